@@ -0,0 +1,5 @@
+# Single entry point serving both languages from one server: the language comes
+# from ?lang=pt / ?lang=en (or the selector in the sidebar), Portuguese by default.
+from subprime_app.engine import run
+
+run()
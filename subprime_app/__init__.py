@@ -0,0 +1,2 @@
+# Rendering engine, data and locale catalogs shared by the Portuguese (Subprime.py),
+# English (Subprime_v2.py) and bilingual (app.py) entry points
@@ -0,0 +1,177 @@
+"""Headless per-view benchmark of the app scripts.
+
+Each script is driven with Streamlit's app-testing harness through every view:
+the landing page, the seven pages and every option of the in-page selectors.
+For every view the benchmark records:
+
+- cold_ms: latency of the first render of the view, in a fresh interpreter
+  with the render cache on disk turned off, so charts are built rather than
+  read from earlier runs. Only the first view of each interpreter starts with
+  nothing imported; later views find the modules, datasets and shared charts
+  already loaded by the views before them;
+- warm_ms: median latency of the following renders of the same view;
+- peak_kib: peak memory allocated during the cold render (tracemalloc, measured
+  in a separate interpreter so it does not slow down the timed runs);
+- elements: number of elements on the page.
+
+The report is written as JSON. Views over a threshold are listed in the report,
+and the exit status is 1 when there is any, so the benchmark can gate a build:
+
+    python -m subprime_app.benchmark --output benchmark.json
+    python -m subprime_app.benchmark --thresholds thresholds.json
+
+A thresholds file overrides DEFAULT_THRESHOLDS and can set per-view limits:
+{"warm_ms": 150, "views": {"securitization": {"cold_ms": 3000}}}.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from subprime_app.warmup import walk_views
+
+SCRIPTS = ("Subprime.py", "Subprime_v2.py")
+
+# Limits applied to every view unless the thresholds file overrides them
+DEFAULT_THRESHOLDS = {"cold_ms": 5000, "warm_ms": 250, "peak_kib": 100 * 1024, "elements": 100}
+
+
+class BenchmarkError(RuntimeError):
+    pass
+
+
+def _count_elements(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(_count_elements(child) for child in children.values())
+
+
+def _walk(script, render):
+    at = AppTest.from_file(script, default_timeout=120)
+    walk_views(at, render)
+    return at.session_state["locale"]
+
+
+def _timed(script, rounds):
+    views = {}
+
+    def render(at, view):
+        start = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise BenchmarkError(f"{script} {view} failed: {at.exception[0].message}")
+        views.setdefault(view, {"timings": [], "elements": _count_elements(at._tree)})["timings"].append(elapsed)
+
+    for _ in range(rounds + 1):
+        locale = _walk(script, render)
+    report = {}
+    for view, row in views.items():
+        cold, *warm = row["timings"]
+        report[view] = {"cold_ms": cold, "warm_ms": statistics.median(warm), "elements": row["elements"]}
+    max_rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"locale": locale, "max_rss_mib": max_rss_mib, "views": report}
+
+
+def _traced(script):
+    peaks = {}
+
+    def render(at, view):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        at.run()
+        peaks[view] = (tracemalloc.get_traced_memory()[1] - before) / 1024
+
+    tracemalloc.start()
+    _walk(script, render)
+    tracemalloc.stop()
+    return peaks
+
+
+def _in_fresh_interpreter(function, *args):
+    # The child inherits the environment when it starts, before it imports
+    # the render cache, which it must neither read nor fill
+    previous = os.environ.get("SUBPRIME_RENDER_CACHE")
+    os.environ["SUBPRIME_RENDER_CACHE"] = "off"
+    try:
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            return pool.apply(function, args)
+    finally:
+        if previous is None:
+            del os.environ["SUBPRIME_RENDER_CACHE"]
+        else:
+            os.environ["SUBPRIME_RENDER_CACHE"] = previous
+
+
+def measure(script, rounds=5):
+    result = _in_fresh_interpreter(_timed, script, rounds)
+    peaks = _in_fresh_interpreter(_traced, script)
+    for view, row in result["views"].items():
+        row["peak_kib"] = peaks[view]
+    return result
+
+
+def check(scripts, thresholds):
+    violations = []
+    for script, result in scripts.items():
+        for view, row in result["views"].items():
+            limits = {**thresholds, **thresholds.get("views", {}).get(view, {})}
+            for metric in DEFAULT_THRESHOLDS:
+                if row[metric] > limits[metric]:
+                    violations.append({"script": script, "view": view, "metric": metric,
+                                       "value": row[metric], "limit": limits[metric]})
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every view of the app scripts headless.")
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS, help="app scripts to benchmark")
+    parser.add_argument("--rounds", type=int, default=5, help="warm renders of every view")
+    parser.add_argument("--thresholds", help="JSON file with the limits (see DEFAULT_THRESHOLDS)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    if args.thresholds:
+        with open(args.thresholds) as source:
+            thresholds.update(json.load(source))
+
+    scripts = {script: measure(script, args.rounds) for script in args.scripts}
+    violations = check(scripts, thresholds)
+    report = {
+        "python": platform.python_version(),
+        "rounds": args.rounds,
+        "thresholds": thresholds,
+        "scripts": scripts,
+        "violations": violations,
+    }
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+            output.write("\n")
+        for script, result in scripts.items():
+            print(f"{script} ({result['locale']}), max RSS {result['max_rss_mib']:.0f} MiB")
+            for view, row in result["views"].items():
+                print(f"  {view:<36} cold {row['cold_ms']:7.1f} ms  warm {row['warm_ms']:6.1f} ms  "
+                      f"peak {row['peak_kib']:8.0f} KiB  {row['elements']:3d} elements")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    for violation in violations:
+        print(f"{violation['script']} {violation['view']}: {violation['metric']} "
+              f"{violation['value']:.1f} over the limit of {violation['limit']}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
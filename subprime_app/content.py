@@ -0,0 +1,198 @@
+"""Precompiled page content, one artifact per locale.
+
+The catalogs hold text in two forms: Markdown blocks (``*_md``) and HTML blocks
+(``*_html``). Compiling a catalog turns every Markdown block into HTML (the
+``*_md`` key becomes ``*_html``) and dedents every HTML block the way
+st.markdown would. It also generates the HTML views of the timeline store
+(subprime_app/timeline_store.py): the banner and event cards of each period,
+the card of every event, the table and the key events. Every heading of a page
+gets a fixed anchor for deep links, and the glossary acronyms get their
+tooltips (subprime_app/glossary.py). Reruns then only stream prebuilt strings.
+
+The compiled catalogs are written to ``subprime_app/locales/compiled`` with
+the version of the sources they come from. Rebuild them after editing a
+catalog:
+
+    python -m subprime_app.content build
+
+If an artifact is missing or stale, the app compiles the catalog in memory
+and logs a warning.
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import textwrap
+import unicodedata
+
+from markdown_it import MarkdownIt
+from streamlit.logger import get_logger
+
+from subprime_app.glossary import load_glossary
+from subprime_app.locales import LOCALES, load_catalog
+from subprime_app.timeline_store import crucial_blocks, event_card, load_timeline, period_blocks, summary_table
+
+COMPILED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales", "compiled")
+
+# Bump when the compiled output changes for the same catalog
+FORMAT = 5
+
+logger = get_logger(__name__)
+
+_markdown = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+
+def _clean(text):
+    # What st.markdown does to its body before sending it
+    return textwrap.dedent(text).strip()
+
+
+def _map_leaves(value, function):
+    if isinstance(value, dict):
+        return {key: _map_leaves(item, function) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_map_leaves(item, function) for item in value]
+    return function(value)
+
+
+def _compile_blocks(section):
+    compiled = {}
+    for key, value in section.items():
+        if key.endswith("_md"):
+            compiled[key[:-3] + "_html"] = _map_leaves(value, lambda text: _markdown.render(_clean(text)).strip())
+        elif key.endswith("_html"):
+            compiled[key] = _map_leaves(value, _clean)
+        elif isinstance(value, dict):
+            compiled[key] = _compile_blocks(value)
+        else:
+            compiled[key] = value
+    return compiled
+
+
+_HEADING = re.compile(r"<(h[1-4])((?:\s[^>]*)?)>(.*?)</\1>", re.DOTALL)
+
+
+def slug(text):
+    # "Títulos lastreados" -> "titulos-lastreados"
+    folded = unicodedata.normalize("NFKD", re.sub(r"<[^>]+>", "", text)).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", folded.lower()).strip("-")
+
+
+def _anchor_headings(section):
+    # Gives every heading of a page a fixed anchor (data-anchor, which
+    # Streamlit uses as the heading's id), unique within the page, so links
+    # such as ?page=securitization#cdo-collateralized-debt-obligations scroll to it
+    used = set()
+
+    def anchor(match):
+        tag, attributes, body = match.groups()
+        if "data-anchor" in attributes:
+            return match.group(0)
+        name = base = slug(body) or tag
+        suffix = 1
+        while name in used:
+            suffix += 1
+            name = f"{base}-{suffix}"
+        used.add(name)
+        return f'<{tag}{attributes} data-anchor="{name}">{body}</{tag}>'
+
+    return _map_html(section, lambda markup: _HEADING.sub(anchor, markup))
+
+
+def _map_html(value, function, in_html=False):
+    # Applies function to every HTML block under value
+    if isinstance(value, dict):
+        return {key: _map_html(item, function, in_html or key.endswith("_html")) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_map_html(item, function, in_html) for item in value]
+    return function(value) if in_html else value
+
+
+def compile_catalog(locale):
+    catalog = load_catalog(locale)
+    content = _compile_blocks(catalog)
+    # The timeline views are projections of the timeline store
+    store = load_timeline(locale)
+    timeline = content["timeline"]
+    timeline["period_html"] = [period_blocks(store, phase.index) for phase in store.phases]
+    timeline["event_html"] = [event_card(event) for event in store.events]
+    timeline["table_html"] = summary_table(store, catalog["timeline"]["table_columns"])
+    timeline["crucial_html"] = crucial_blocks(store)
+    for page in catalog["pages"]:
+        content[page] = _anchor_headings(content[page])
+    return _map_html(content, load_glossary(locale).annotate)
+
+
+def source_version(locale):
+    payload = json.dumps([FORMAT, load_catalog(locale)], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+def _artifact_path(locale):
+    return os.path.join(COMPILED_DIR, f"{locale}.json")
+
+
+def build():
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    versions = {}
+    for locale in LOCALES:
+        versions[locale] = source_version(locale)
+        with open(_artifact_path(locale), "w", encoding="utf-8") as output:
+            json.dump({"version": versions[locale], "content": compile_catalog(locale)},
+                      output, ensure_ascii=False, indent=1)
+            output.write("\n")
+    return versions
+
+
+def stale_locales():
+    stale = []
+    for locale in LOCALES:
+        try:
+            with open(_artifact_path(locale), encoding="utf-8") as artifact:
+                version = json.load(artifact)["version"]
+        except FileNotFoundError:
+            version = None
+        if version != source_version(locale):
+            stale.append(locale)
+    return stale
+
+
+@functools.lru_cache(maxsize=None)
+def load_content(locale):
+    # Compiled catalog of the locale: the catalog with every text block as final HTML
+    try:
+        with open(_artifact_path(locale), encoding="utf-8") as artifact:
+            compiled = json.load(artifact)
+    except FileNotFoundError:
+        compiled = None
+    if compiled is None or compiled["version"] != source_version(locale):
+        logger.warning("Compiled content of %r is missing or stale, compiling it in memory; "
+                       "run `python -m subprime_app.content build`", locale)
+        return compile_catalog(locale)
+    return compiled["content"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the compiled page content.")
+    parser.add_argument("command", choices=("build", "check"),
+                        help="build: compile the catalogs; check: exit 1 if any compiled catalog is stale")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for locale, version in build().items():
+            print(f"{locale}: version {version}")
+        return 0
+
+    stale = stale_locales()
+    if stale:
+        print(f"Stale compiled content: {', '.join(stale)}")
+        return 1
+    print("Compiled content up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
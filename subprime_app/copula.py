@@ -0,0 +1,116 @@
+# Losses of a CDO's tranches under the one-factor Gaussian copula. A loan of
+# the pool defaults when sqrt(rho) * M + sqrt(1 - rho) * e falls below the
+# default threshold N^-1(PD), where M is the economy, shared by every loan,
+# and e is the loan's own risk. Given M the loans default independently, so
+# the number of defaults of a scenario is Binomial(n, p(M)) with
+#
+#     p(M) = N((N^-1(PD) - sqrt(rho) * M) / sqrt(1 - rho))
+#
+# and a scenario costs one normal and one binomial draw instead of one draw
+# per loan. The higher rho, the more the defaults cluster in the same
+# scenarios, which is what fattens the tail the senior tranches sit in.
+#
+# Scenarios are drawn in fixed-size batches of NumPy arrays and only the
+# number of scenarios with each count of defaults is kept, so memory does not
+# grow with the number of scenarios. Every tranche statistic derives from that
+# distribution. Results are memoized by parameter set.
+import functools
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+SCENARIOS = 1_000_000
+BATCH_SIZE = 250_000
+SEED = 2008
+
+# Coefficients of the erfc approximation of Numerical Recipes (erfcc):
+# fractional error of erfc below 1.2e-7, absolute error of normal_cdf below
+# 5e-8 (4.2e-8 at most on a grid of 2 million points over [-9, 9])
+_ERFC = (-1.26551223, 1.00002368, 0.37409196, 0.09678418, -0.18628806,
+         0.27886807, -1.13520398, 1.48851587, -0.82215223, 0.17087277)
+
+
+def normal_cdf(x):
+    # Standard normal CDF of an array
+    z = np.abs(x) / math.sqrt(2)
+    t = 1 / (1 + 0.5 * z)
+    poly = np.zeros_like(t)
+    for coefficient in reversed(_ERFC):
+        poly = coefficient + t * poly
+    erfc = t * np.exp(poly - z * z)
+    return np.where(x >= 0, 1 - 0.5 * erfc, 0.5 * erfc)
+
+
+@dataclass(frozen=True, eq=False)
+class TrancheLoss:
+    attachment: float  # fractions of the pool
+    detachment: float
+    losses: np.ndarray  # loss of the tranche, as a fraction of its size, for each number of defaults
+    expected_loss: float
+    hit_probability: float  # probability of losing anything
+    wipeout_probability: float  # probability of losing everything
+
+
+@dataclass(frozen=True, eq=False)
+class Simulation:
+    scenarios: int
+    defaults: np.ndarray  # probability of each number of defaults, 0 to n
+    pool_losses: np.ndarray  # loss of the pool, as a fraction, for each number of defaults
+    expected_loss: float
+    tranches: tuple
+
+
+def _default_counts(pool_size, pd, correlation, scenarios, batch_size, seed):
+    # Number of scenarios with each count of defaults
+    rng = np.random.default_rng(seed)
+    threshold = NormalDist().inv_cdf(pd)
+    loading, idiosyncratic = math.sqrt(correlation), math.sqrt(1 - correlation)
+    counts = np.zeros(pool_size + 1, dtype=np.int64)
+    for start in range(0, scenarios, batch_size):
+        factor = rng.standard_normal(min(batch_size, scenarios - start))
+        conditional_pd = normal_cdf((threshold - loading * factor) / idiosyncratic)
+        counts += np.bincount(rng.binomial(pool_size, conditional_pd), minlength=pool_size + 1)
+    return counts
+
+
+def tranche_loss(attachment, detachment, pool_losses, defaults):
+    losses = np.clip((pool_losses - attachment) / (detachment - attachment), 0, 1)
+    losses.flags.writeable = False
+    return TrancheLoss(
+        attachment, detachment, losses,
+        expected_loss=float(defaults @ losses),
+        hit_probability=float(defaults[losses > 0].sum()),
+        wipeout_probability=float(defaults[losses >= 1].sum()),
+    )
+
+
+def exceedance(losses, defaults):
+    # (loss, probability of a larger loss) at each distinct loss of a tranche
+    values, inverse = np.unique(losses, return_inverse=True)
+    mass = np.bincount(inverse, weights=defaults, minlength=len(values))
+    return values, np.clip(1 - np.cumsum(mass), 0, 1)
+
+
+@functools.lru_cache(maxsize=256)
+def simulate(pool_size, pd, recovery, correlation, tranches, scenarios=SCENARIOS, batch_size=BATCH_SIZE, seed=SEED):
+    # tranches: ((attachment, detachment), ...) as fractions of the pool. The
+    # arrays of the result are shared by every caller and read-only
+    if not 0 < pd < 1 or not 0 <= recovery <= 1 or not 0 <= correlation < 1:
+        raise ValueError("pd must be in (0, 1), recovery in [0, 1] and correlation in [0, 1)")
+    for attachment, detachment in tranches:
+        if not 0 <= attachment < detachment <= 1:
+            raise ValueError(f"Invalid tranche {attachment}-{detachment}")
+
+    counts = _default_counts(pool_size, pd, correlation, scenarios, batch_size, seed)
+    defaults = counts / scenarios
+    pool_losses = np.arange(pool_size + 1) * (1 - recovery) / pool_size
+    for array in (defaults, pool_losses):
+        array.flags.writeable = False
+    return Simulation(
+        scenarios, defaults, pool_losses,
+        expected_loss=float(defaults @ pool_losses),
+        tranches=tuple(tranche_loss(attachment, detachment, pool_losses, defaults)
+                       for attachment, detachment in tranches),
+    )
@@ -0,0 +1,215 @@
+# Language-independent chart settings shared by every locale: colors, layout
+# and event positions. The numeric series are in the dataset store
+# (subprime_app/datastore.py) and the labels in the locale catalogs.
+import datetime
+
+# Start and end of each phase in the Gantt timeline
+TIMELINE_START_YEARS = [2001, 2006, 2007, 2008, 2008.75, 2008.75, 2010, 2015]
+TIMELINE_END_YEARS = [2006, 2007, 2008, 2008.75, 2010, 2010.5, 2015, 2023]
+
+# Color of each phase, in the Gantt timeline and (as the .phase-N classes of
+# static/subprime.css) in the period banners and the summary table
+TIMELINE_PHASE_COLORS = ['#FF9E80', '#FFCC80', '#FFD180', '#F57C00', '#EF6C00', '#BF360C', '#B71C1C', '#880E4F']
+
+# Important events in the Gantt timeline: year and index of the phase they belong to
+TIMELINE_EVENT_YEARS = [2006.5, 2008.7, 2010, 2010.5]
+TIMELINE_EVENT_PHASES = [1, 3, 5, 6]
+
+# Date range the timeline's event filter starts with: the Lehman Brothers
+# bankruptcy and the rescues that followed
+TIMELINE_RANGE_DEFAULT = (datetime.date(2008, 9, 1), datetime.date(2008, 10, 31))
+
+# Last date of the bubble formation and bubble burst phases
+HOUSING_PHASE_ENDS = [2006.5, 2008.75]
+HOUSING_PHASE_COLORS = ['rgba(255, 200, 0, 0.2)', 'rgba(255, 100, 0, 0.2)', 'rgba(255, 0, 0, 0.2)']
+
+# Important events on the Case-Shiller chart: date and index value
+HOUSING_EVENTS = [(2006.5, 206.2), (2007.5, 189.2), (2008.75, 158.1)]
+HOUSING_TICKS = [2000, 2002, 2004, 2006, 2007, 2008, 2009, 2010, 2012]
+
+# Bar colors of the subprime share chart, one per year
+SUBPRIME_COLORS = ['#90CAF9', '#90CAF9', '#90CAF9', '#90CAF9', '#FFAB91', '#FF8A65', '#FF7043', '#F4511E', '#D84315']
+
+# Dataset behind each impact metric (see subprime_app/datastore.py)
+IMPACT_DATASETS = {'gdp': 'gdp_growth', 'unemployment': 'unemployment', 'debt': 'public_debt'}
+
+IMPACT_COLORS = {
+    'gdp': {'2007': '#4CAF50', '2008': '#FFC107', '2009': '#FF5722'},
+    'unemployment': {'2007': '#4CAF50', '2008': '#FFC107', '2009': '#FF5722', '2010': '#9C27B0'},
+    'debt': {'2007': '#4CAF50', '2010': '#FF5722', 'increase': 'orange'},
+}
+
+# Participants and instruments of the securitization diagram
+SECURITIZATION_NODES = {
+    "households": {"type": "participant", "level": 0, "pos": (0, 4.6)},
+    "originating_banks": {"type": "bank", "level": 1, "pos": (1.8, 4)},
+    "prime_mortgages": {"type": "asset", "level": 1.5, "pos": (4, 5)},
+    "subprime_mortgages": {"type": "asset", "level": 1.5, "pos": (4, 3)},
+    "investment_banks": {"type": "bank", "level": 2, "pos": (6, 4)},
+    "spv": {"type": "special", "level": 3, "pos": (8, 4.7)},
+    "siv": {"type": "special", "level": 3, "pos": (8, 3.3)},
+    "mbs": {"type": "asset", "level": 4, "pos": (10, 4)},
+    "cdo": {"type": "asset", "level": 5, "pos": (12, 4)},
+    "tranche_aaa": {"type": "asset", "level": 6, "pos": (13, 5)},
+    "tranche_bbb": {"type": "asset", "level": 6, "pos": (13.15, 3.25)},
+    "european_banks": {"type": "bank", "level": 6.3, "pos": (14.5, 4)},
+    "pension_funds": {"type": "investor", "level": 7, "pos": (17, 5)},
+    "hedge_funds": {"type": "investor", "level": 7, "pos": (16.85, 3.25)},
+    "cds": {"type": "risk", "level": 5.5, "pos": (12, 2)},
+    "global_system": {"type": "investor", "level": 8, "pos": (18, 4)},
+}
+
+# Edges of the securitization diagram: source, target and label id
+SECURITIZATION_EDGES = [
+    ("households", "originating_banks", "take_loans"),
+    ("originating_banks", "prime_mortgages", "originate"),
+    ("originating_banks", "subprime_mortgages", "originate"),
+    ("originating_banks", "investment_banks", "sell_mortgages"),
+    ("prime_mortgages", "investment_banks", None),
+    ("subprime_mortgages", "investment_banks", None),
+    ("investment_banks", "spv", "create"),
+    ("investment_banks", "siv", "off_balance_sheet"),
+    ("spv", "mbs", "issue"),
+    ("mbs", "cdo", "structure"),
+    ("cdo", "tranche_aaa", "segment_by_risk"),
+    ("cdo", "european_banks", "buy"),
+    ("cdo", "tranche_bbb", "segment_by_risk"),
+    ("cdo", "cds", "default_protection"),
+    ("tranche_aaa", "pension_funds", "buy"),
+    ("tranche_bbb", "hedge_funds", "buy"),
+    ("european_banks", "global_system", "risk_propagation"),
+    ("pension_funds", "global_system", "risk_propagation"),
+    ("hedge_funds", "global_system", "risk_propagation"),
+    ("cds", "global_system", "interconnection")
+]
+
+# Colors of the securitization diagram nodes, by type
+SECURITIZATION_NODE_COLORS = {
+    'participant': '#E1BEE7',  # Light lilac
+    'bank': '#BBDEFB',  # Light blue
+    'asset': '#FFF9C4',  # Light yellow
+    'investor': '#C8E6C9',  # Light green
+    'risk': '#FFCDD2',  # Light red
+    'special': '#D1C4E9',  # Light purple
+}
+
+# Tranche loss simulator (subprime_app/copula.py): starting values of the
+# sliders and colors of the tranches. The equity tranche runs from 0 to the
+# BBB attachment and the AAA tranche from the BBB detachment to 100%
+CDO_DEFAULTS = {'pool_size': 125, 'pd': 5.0, 'recovery': 40, 'correlation': 0.2, 'mezzanine': (3, 7)}
+CDO_TRANCHE_COLORS = {'equity': '#EF5350', 'mezzanine': '#FFA726', 'senior': '#1976D2'}
+
+# Cash-flow waterfall (subprime_app/waterfall.py) of a stylized subprime deal:
+# (tranche, share of the pool, annual coupon), most senior first. The equity
+# tranche has no coupon and receives the excess spread
+WATERFALL_TRANCHES = [('aaa', 0.80, 0.055), ('a', 0.08, 0.065), ('bbb', 0.07, 0.08), ('equity', 0.05, 0.0)]
+WATERFALL_WAC = 0.085
+WATERFALL_TERM = 360  # months
+
+# Axes of the scenario grid, in percent: (first, last, step). The sliders
+# move along the same steps
+WATERFALL_CPR = (0, 60, 2)
+WATERFALL_CDR = (0, 30, 0.5)
+WATERFALL_DEFAULTS = {'cpr': 20, 'cdr': 8.0, 'severity': 50}
+WATERFALL_TRANCHE_COLORS = {'aaa': '#1976D2', 'a': '#64B5F6', 'bbb': '#FFA726', 'equity': '#EF5350'}
+
+# Colors of the Basel capital requirement series
+BASEL_COLORS = {'total': '#90CAF9', 'tier1': '#42A5F5', 'core_tier1': '#1976D2'}
+
+# Synthetic loan pool (subprime_app/loanpool.py). Loans of a vintage are
+# subprime with the share of the subprime_share dataset; the rest of the
+# settings are stylized, by segment. Products: fixed 30-year, 2/28 and 3/27
+# hybrid ARMs (two or three years at the teaser rate) and 5/1 ARMs
+LOAN_POOL_VOLUMES = {2000: 1.05, 2001: 2.2, 2002: 2.9, 2003: 3.9, 2004: 2.9, 2005: 3.0,
+                     2006: 2.7, 2007: 2.3, 2008: 1.5}  # originations, US$ trillion
+LOAN_POOL_MORTGAGE_RATES = {2000: 0.0805, 2001: 0.0697, 2002: 0.0654, 2003: 0.0583, 2004: 0.0584,
+                            2005: 0.0587, 2006: 0.0641, 2007: 0.0634, 2008: 0.0603}  # 30-year fixed average
+LOAN_POOL_PRODUCTS = ['fixed', 'arm_2_28', 'arm_3_27', 'arm_5_1']
+LOAN_POOL_REGIONS = ['northeast', 'midwest', 'south', 'west']
+LOAN_POOL_SEGMENTS = {
+    'prime': {
+        'products': [0.82, 0.0, 0.0, 0.18],
+        'regions': [0.19, 0.22, 0.34, 0.25],
+        'fico': (730, 45, 620, 850),  # mean, standard deviation, minimum, maximum
+        'ltv': (0.75, 0.12, 0.30, 1.00),
+        'dti': (0.33, 0.08, 0.05, 0.55),
+        'balance': 180_000,  # median in 2000, grows with the Case-Shiller index
+        'spread': (0.0025, 0.0025),  # over the 30-year average: mean, standard deviation
+        'teaser_discount': 0.0075,  # teaser rate below the fixed rate
+        'margin': (0.0275, 0.0),  # over the index at reset
+    },
+    'subprime': {
+        'products': [0.30, 0.55, 0.15, 0.0],
+        'regions': [0.16, 0.20, 0.40, 0.24],
+        'fico': (585, 30, 500, 619),
+        'ltv': (0.85, 0.10, 0.40, 1.00),
+        'dti': (0.40, 0.08, 0.10, 0.60),
+        'balance': 140_000,
+        'spread': (0.025, 0.005),
+        'teaser_discount': 0.015,
+        'margin': (0.06, 0.005),
+    },
+}
+
+# Months each product pays the teaser rate before the first reset (0: never resets)
+LOAN_POOL_RESET_MONTHS = {'fixed': 0, 'arm_2_28': 24, 'arm_3_27': 36, 'arm_5_1': 60}
+
+# Monthly performance of the pool (subprime_app/performance.py): vintages
+# followed, month (year, month) the observation ends and status of a loan in
+# each month. Defaulted and prepaid loans leave the pool
+PERFORMANCE_VINTAGES = [2003, 2004, 2005, 2006, 2007, 2008]
+PERFORMANCE_END = (2010, 12)
+PERFORMANCE_STATUSES = ['current', 'dpd30', 'dpd60', 'dpd90', 'default', 'prepaid']
+PERFORMANCE_FICO_BANDS = {'lt580': (300, 580), '580_619': (580, 620), '620_679': (620, 680),
+                          '680_739': (680, 740), '740_plus': (740, 851)}
+
+# Stylized monthly hazards. A current loan misses a payment with the base rate
+# of its segment, scaled by FICO, LTV, house prices (the year-over-year change
+# of the Case-Shiller index: falling prices leave borrowers underwater) and the
+# payment shock after an ARM resets. Prepayment rises with house prices, which
+# make refinancing possible
+PERFORMANCE_HAZARDS = {
+    'delinquency': {'prime': 0.002, 'subprime': 0.0045},
+    'fico_scale': 100,  # points for a factor of e
+    'ltv_slope': 4,  # per unit of LTV above 0.8
+    'price_slope': 8,  # per unit of house price change
+    'reset_factor': 1.5,
+    'prepayment': {'prime': 0.08, 'subprime': 0.12},  # annual
+    'prepayment_price_slope': 5,
+    'reset_prepayment_factor': 2.5,  # for the six months after a reset, when prices still rise
+}
+
+# From each delinquency status: monthly probability of curing (back to
+# current), rolling to the next status and, from 60 days, going back to 30.
+# Rolls grow and cures shrink with the square root of the house price factor
+PERFORMANCE_ROLLS = {
+    'dpd30': {'cure': 0.35, 'roll': 0.30},
+    'dpd60': {'cure': 0.15, 'back': 0.05, 'roll': 0.45},
+    'dpd90': {'cure': 0.03, 'roll': 0.12},
+}
+PERFORMANCE_VINTAGE_COLORS = ['#90CAF9', '#42A5F5', '#FFB74D', '#F4511E', '#C62828', '#6A1B9A']
+
+# ARM payment shock (subprime_app/payment_shock.py): fed funds target rate,
+# as (year, month, rate) from the month it took effect. The index of the ARMs
+# (6-month LIBOR) is taken as the policy rate plus a spread
+PAYMENT_SHOCK_POLICY_RATES = [
+    (2000, 1, 0.055), (2000, 5, 0.065), (2001, 1, 0.06), (2001, 2, 0.055), (2001, 3, 0.05), (2001, 4, 0.045),
+    (2001, 5, 0.04), (2001, 6, 0.0375), (2001, 8, 0.035), (2001, 9, 0.03), (2001, 10, 0.025), (2001, 11, 0.02),
+    (2001, 12, 0.0175), (2002, 11, 0.0125), (2003, 6, 0.01), (2004, 6, 0.0125), (2004, 8, 0.015), (2004, 9, 0.0175),
+    (2004, 11, 0.02), (2004, 12, 0.0225), (2005, 2, 0.025), (2005, 3, 0.0275), (2005, 5, 0.03), (2005, 6, 0.0325),
+    (2005, 8, 0.035), (2005, 9, 0.0375), (2005, 11, 0.04), (2005, 12, 0.0425), (2006, 1, 0.045), (2006, 3, 0.0475),
+    (2006, 5, 0.05), (2006, 6, 0.0525), (2007, 9, 0.0475), (2007, 10, 0.045), (2007, 12, 0.0425), (2008, 1, 0.03),
+    (2008, 3, 0.0225), (2008, 4, 0.02), (2008, 10, 0.01), (2008, 12, 0.00125),
+]
+PAYMENT_SHOCK_INDEX_SPREAD = 0.003
+PAYMENT_SHOCK_HIKES_START = (2004, 6)  # the alternative scenarios change the path from this month on
+
+# Reset terms by product: (cap at the first reset, cap at later resets,
+# lifetime cap over the initial rate, months between resets). The rate never
+# goes below the margin
+PAYMENT_SHOCK_CAPS = {'arm_2_28': (0.03, 0.01, 0.06, 6), 'arm_3_27': (0.03, 0.01, 0.06, 6),
+                      'arm_5_1': (0.05, 0.02, 0.05, 12)}
+PAYMENT_SHOCK_VINTAGES = [2003, 2004, 2005, 2006, 2007]
+PAYMENT_SHOCK_DEFAULTS = {'peak': 3.0, 'threshold': 50}
+PAYMENT_SHOCK_THRESHOLDS = (30, 60, 5)  # PTI threshold slider, in percent: first, last, step
+PAYMENT_SHOCK_COLORS = {'actual': '#D84315', 'capped': '#FFA726', 'held': '#42A5F5'}
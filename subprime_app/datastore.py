@@ -0,0 +1,157 @@
+"""Columnar dataset store.
+
+The numeric series behind the charts live in ``subprime_app/datasets``: each
+dataset has an editable CSV source and a compiled, uncompressed Arrow IPC
+file, described by ``manifest.json`` (schema, row count and a version derived
+from the sources). At run time only the Arrow files are read: they are
+memory-mapped, so numeric columns are zero-copy views of the file, and each
+dataset is loaded once per process and handed out as a read-only frame.
+
+After editing a CSV (or adding a dataset to ``SCHEMAS``), rebuild with:
+
+    python -m subprime_app.datastore build
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+DATASETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datasets")
+MANIFEST_PATH = os.path.join(DATASETS_DIR, "manifest.json")
+
+# Schema of every dataset; the CSV sources are parsed with exactly these types
+SCHEMAS = {
+    "case_shiller": pa.schema([("date", pa.float64()), ("index", pa.float64())]),
+    "subprime_share": pa.schema([("year", pa.int64()), ("share", pa.float64())]),
+    "gdp_growth": pa.schema([("country", pa.string())] + [(year, pa.float64()) for year in ("2007", "2008", "2009")]),
+    "unemployment": pa.schema([("country", pa.string())] + [(year, pa.float64()) for year in ("2007", "2008", "2009", "2010")]),
+    "public_debt": pa.schema([("country", pa.string()), ("2007", pa.float64()), ("2010", pa.float64()), ("increase", pa.float64())]),
+    "basel_capital": pa.schema([("agreement", pa.string()), ("total", pa.float64()), ("tier1", pa.float64()), ("core_tier1", pa.float64())]),
+}
+
+
+_ARROW_STRINGS = {pa.string(): pd.ArrowDtype(pa.string())}
+
+
+class DatasetError(RuntimeError):
+    pass
+
+
+def _schema_description(schema):
+    return {field.name: str(field.type) for field in schema}
+
+
+def _read_source(name):
+    schema = SCHEMAS[name]
+    table = pa_csv.read_csv(
+        os.path.join(DATASETS_DIR, f"{name}.csv"),
+        convert_options=pa_csv.ConvertOptions(column_types=schema, include_columns=schema.names),
+    )
+    return table.cast(schema)
+
+
+def build():
+    # Compiles every CSV source to an Arrow IPC file and rewrites the manifest
+    digest = hashlib.sha256()
+    datasets = {}
+    for name, schema in SCHEMAS.items():
+        with open(os.path.join(DATASETS_DIR, f"{name}.csv"), "rb") as source:
+            source_bytes = source.read()
+        digest.update(name.encode() + b"\0" + schema.to_string().encode() + b"\0" + source_bytes)
+        table = _read_source(name)
+        with pa.OSFile(os.path.join(DATASETS_DIR, f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                writer.write_table(table)
+        datasets[name] = {
+            "file": f"{name}.arrow",
+            "rows": table.num_rows,
+            "schema": _schema_description(schema),
+            "source_sha256": hashlib.sha256(source_bytes).hexdigest(),
+        }
+    manifest = {"version": digest.hexdigest()[:12], "datasets": datasets}
+    with open(MANIFEST_PATH, "w") as output:
+        json.dump(manifest, output, indent=2)
+        output.write("\n")
+    return manifest
+
+
+def stale_datasets():
+    # Datasets whose compiled file no longer matches its CSV source or schema
+    try:
+        manifest = load_manifest.__wrapped__()
+    except FileNotFoundError:
+        return list(SCHEMAS)
+    stale = []
+    for name, schema in SCHEMAS.items():
+        entry = manifest["datasets"].get(name)
+        with open(os.path.join(DATASETS_DIR, f"{name}.csv"), "rb") as source:
+            source_sha256 = hashlib.sha256(source.read()).hexdigest()
+        if entry is None or entry["source_sha256"] != source_sha256 or \
+                entry["schema"] != _schema_description(schema):
+            stale.append(name)
+    return stale
+
+
+@functools.lru_cache(maxsize=None)
+def load_manifest():
+    with open(MANIFEST_PATH) as manifest:
+        return json.load(manifest)
+
+
+def dataset_version():
+    return load_manifest()["version"]
+
+
+@functools.lru_cache(maxsize=None)
+def load_table(name):
+    entry = load_manifest()["datasets"].get(name)
+    if entry is None:
+        raise DatasetError(f"Unknown dataset: {name!r}")
+    source = pa.memory_map(os.path.join(DATASETS_DIR, entry["file"]), "r")
+    table = pa.ipc.open_file(source).read_all()
+    if _schema_description(table.schema) != entry["schema"]:
+        raise DatasetError(f"{entry['file']} does not match the schema in the manifest; "
+                           "run `python -m subprime_app.datastore build`")
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def load_frame(name):
+    # Columns stay backed by the memory-mapped file: numeric ones as read-only
+    # NumPy views, string ones as Arrow arrays. The frame is shared by every
+    # session, so pages derive new frames from it and never assign into it.
+    frame = load_table(name).to_pandas(split_blocks=True, types_mapper=_ARROW_STRINGS.get)
+    for column in frame.select_dtypes("number"):
+        frame[column].to_numpy().flags.writeable = False
+    return frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or check the compiled datasets.")
+    parser.add_argument("command", choices=("build", "check"),
+                        help="build: compile the CSV sources; check: exit 1 if any dataset is stale")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manifest = build()
+        for name, entry in manifest["datasets"].items():
+            print(f"{name:<16} {entry['rows']:6d} rows  {entry['file']}")
+        print(f"version {manifest['version']}")
+        return 0
+
+    stale = stale_datasets()
+    if stale:
+        print(f"Stale datasets: {', '.join(stale)}")
+        return 1
+    print(f"Datasets up to date (version {dataset_version()})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
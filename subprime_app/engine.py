@@ -0,0 +1,136 @@
+# Rendering engine shared by every language. The launchers (Subprime.py,
+# Subprime_v2.py and app.py) only pick the default locale; the text comes
+# from the locale catalogs and the pages from subprime_app.pages.
+import html
+
+import streamlit as st
+
+from subprime_app import instrumentation
+from subprime_app.content import load_content
+from subprime_app.instrumentation import fragment, stage
+from subprime_app.locales import DEFAULT_LOCALE, LANGUAGE_NAMES, LOCALES, TRANSLATED_SELECTORS, load_catalog
+from subprime_app.pages import PAGES, choose
+from subprime_app.search import search
+from subprime_app.styles import load_stylesheet
+
+
+def current_locale(default_locale):
+    # The language picked in the sidebar, else ?lang=<locale>, else the launcher's default
+    names = {name: locale for locale, name in LANGUAGE_NAMES.items()}
+    if "language" in st.session_state:
+        return names[st.session_state["language"]]
+    locale = st.query_params.get("lang", default_locale)
+    return locale if locale in LOCALES else default_locale
+
+
+def switch_locale(locale):
+    # Carries the selections over to the new language, so changing language keeps
+    # the page, period, metric and region the user was looking at
+    previous = st.session_state.get("locale")
+    st.session_state["locale"] = locale
+    if previous is None or previous == locale:
+        return
+    # Widgets get a new id when their labels change, so their values are set again
+    st.session_state["language"] = LANGUAGE_NAMES[locale]
+    old_text, new_text = load_catalog(previous), load_catalog(locale)
+    for key, labels in TRANSLATED_SELECTORS.items():
+        if key in st.session_state:
+            old_labels, new_labels = labels(old_text), labels(new_text)
+            ids = {label: option for option, label in old_labels.items()}
+            st.session_state[key] = new_labels[ids[st.session_state[key]]]
+    st.query_params["lang"] = locale
+
+
+def open_deep_link(locale):
+    # Links such as ?page=regulation&region=intl#<anchor> (the search results)
+    # open the session on that page and selector option. They are applied on
+    # the first run only, so the widgets are free afterwards
+    if "deep_link" in st.session_state:
+        return
+    st.session_state["deep_link"] = True
+    text = load_catalog(locale)
+    for key, labels in TRANSLATED_SELECTORS.items():
+        options = {str(option): label for option, label in labels(text).items()}
+        if st.query_params.get(key) in options:
+            st.session_state[key] = options[st.query_params[key]]
+
+
+@fragment
+def search_panel(text, locale):
+    query = st.text_input(text["search_label"], placeholder=text["search_placeholder"], key="search")
+    if not query.strip():
+        return
+    # The other languages are searched when the session's has no hit
+    hits = search(query, [locale] + [other for other in LOCALES if other != locale])
+    if not hits:
+        st.markdown(text["search_empty"])
+        return
+    st.markdown("".join(
+        f'<div class="search-hit"><a href="{html.escape(hit.document.link)}" target="_self">'
+        f'{html.escape(hit.document.title)}</a><div class="search-snippet">{html.escape(hit.snippet)}</div></div>'
+        for hit in hits
+    ), unsafe_allow_html=True)
+
+
+def timings_panel(stages):
+    # Admin panel of the instrumentation (see subprime_app/instrumentation.py)
+    with st.sidebar.expander("Render timings", expanded=True):
+        st.dataframe(
+            [{"stage": name, "ms": round(row["ms"], 1), "KiB": round(row["kib"])} for name, row in stages.items()],
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.dataframe(
+            [{"counter": name, "value": value} for name, value in instrumentation.counters().items()],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+def run(default_locale=DEFAULT_LOCALE):
+    if instrumentation.ENABLED:
+        instrumentation.start_rerun()
+    locale = current_locale(default_locale)
+    switch_locale(locale)
+    open_deep_link(locale)
+    text = load_content(locale)
+
+    st.set_page_config(
+        page_title=text["page_title"],
+        page_icon="📈",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+
+    with stage("chrome"):
+        load_stylesheet()
+
+        # Main title
+        st.markdown(f'<div class="main-header">{text["title"]}</div>', unsafe_allow_html=True)
+
+        st.markdown(text["intro_box_html"], unsafe_allow_html=True)
+
+        # Sidebar navigation
+        st.session_state.setdefault("language", LANGUAGE_NAMES[locale])
+        choose(st.sidebar.radio, text["sidebar"]["language_label"], LANGUAGE_NAMES, key="language",
+               horizontal=True, label_visibility="collapsed")
+        st.sidebar.title(text["sidebar"]["title"])
+        page = choose(st.sidebar.radio, text["sidebar"]["label"], text["pages"], key="page")
+
+        with st.sidebar:
+            search_panel(text["sidebar"], locale)
+
+        st.sidebar.markdown("---")
+        st.sidebar.markdown(text["sidebar"]["about_html"], unsafe_allow_html=True)
+
+    with stage("page"):
+        PAGES[page](text[page])
+
+    with stage("chrome"):
+        # Footer
+        st.markdown(text["footer_html"], unsafe_allow_html=True)
+
+    if instrumentation.ENABLED:
+        stages = instrumentation.finish_rerun(locale=locale, page=page)
+        if "timings" in st.query_params:
+            timings_panel(stages)
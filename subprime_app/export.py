@@ -0,0 +1,208 @@
+"""Static-site export of every view, for audiences too large for live sessions.
+
+Every view of every locale is rendered headless with Streamlit's app-testing
+harness: the seven pages and every period, metric and region option. Each
+element tree is then written as a plain HTML page:
+
+- Markdown and HTML blocks are converted to HTML. The app's stylesheet is
+  inlined where the app imports it, so a page opened on its own is styled.
+- Plotly charts carry their pre-serialized JSON spec.
+- Selectors become links to the pages of the other options. Sliders show
+  their initial value and the search box is left out.
+
+plotly.js is copied next to the pages once, so any plain file server can
+serve the bundle with no Python process:
+
+    python -m subprime_app.export --output site
+"""
+import argparse
+import datetime
+import functools
+import html
+import os
+import sys
+
+from markdown_it import MarkdownIt
+from plotly.offline import get_plotlyjs
+from streamlit.testing.v1 import AppTest
+
+from subprime_app.locales import LANGUAGE_NAMES, LOCALES, TRANSLATED_SELECTORS, load_catalog
+from subprime_app.styles import STYLESHEET_PATH, stylesheet_url
+from subprime_app.warmup import walk_views
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+PLOTLY_JS = "plotly.min.js"
+
+# Layout of the sidebar, columns and tabs, which Streamlit's frontend draws itself
+_LAYOUT_CSS = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333F; display: flex; }
+.sidebar { width: 18rem; flex-shrink: 0; min-height: 100vh; padding: 2rem 1.5rem; background: #F0F2F6; box-sizing: border-box; }
+.main { flex: 1; min-width: 0; max-width: 80rem; margin: 0 auto; padding: 3rem 3rem 2rem; }
+.columns { display: flex; gap: 1rem; }
+.columns > div { min-width: 0; }
+.options a, .options strong { display: inline-block; margin: 0 1rem 0.3rem 0; }
+.options.vertical a, .options.vertical strong { display: block; }
+.tab-label { border-bottom: 2px solid #FF4B4B; display: inline-block; margin-top: 1rem; font-weight: 600; }
+"""
+
+_PAGE = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="../{plotly_js}"></script>
+<style>{layout_css}</style>
+</head>
+<body>
+<nav class="sidebar">
+{sidebar}
+</nav>
+<main class="main">
+{main}
+</main>
+</body>
+</html>
+"""
+
+_markdown = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+
+
+@functools.lru_cache(maxsize=None)
+def _stylesheet():
+    with open(STYLESHEET_PATH, encoding="utf-8") as stylesheet:
+        return stylesheet.read()
+
+
+def view_file(view):
+    # "impact/impact_metric=debt" -> "impact-impact_metric-debt.html"
+    return ("index" if view == "landing" else view.replace("/", "-").replace("=", "-")) + ".html"
+
+
+class _ViewWriter:
+    # Turns the element tree of one view into HTML
+
+    def __init__(self, locale, view):
+        self.locale = locale
+        self.view = view
+        self.page = view.split("/")[0] if view != "landing" else "intro"
+        self.text = load_catalog(locale)
+        self.charts = 0
+
+    def link(self, key, option):
+        # Page the option of a widget leads to, relative to the locale directory
+        if key == "language":
+            return f"../{option}/{view_file(self.view)}"
+        if key == "page":
+            return view_file(option)
+        return view_file(f"{self.page}/{key}={option}")
+
+    def options(self, node, horizontal):
+        labels = LANGUAGE_NAMES if node.key == "language" else TRANSLATED_SELECTORS[node.key](self.text)
+        ids = {label: option for option, label in labels.items()}
+        items = []
+        for label in node.options:
+            if label == node.value:
+                items.append(f"<strong>{html.escape(label)}</strong>")
+            else:
+                items.append(f'<a href="{self.link(node.key, ids[label])}">{html.escape(label)}</a>')
+        title = "" if node.proto.label_visibility.value != 0 else f"<p>{html.escape(node.label)}</p>"
+        layout = "" if horizontal else " vertical"
+        return f'{title}<div class="options{layout}">{"".join(items)}</div>'
+
+    def element(self, node):
+        kind = node.type
+        if kind == "markdown":
+            if stylesheet_url() in node.proto.body:
+                # The block of load_stylesheet, which imports the stylesheet from the live server
+                return f"<style>\n{_stylesheet()}</style>"
+            return _markdown.render(node.proto.body)
+        if kind == "title":
+            return f"<h1>{html.escape(node.value)}</h1>"
+        if kind == "radio":
+            return self.options(node, node.proto.horizontal)
+        if kind == "selectbox":
+            return self.options(node, False)
+        if kind == "text_input":
+            # The search box needs the live app
+            return ""
+        if kind == "slider":
+            # The static page shows the value or range the app starts with
+            values = node.value if isinstance(node.value, (list, tuple)) else [node.value]
+            shown = " – ".join(f"{value:%m/%Y}" if isinstance(value, datetime.date) else f"{value:g}"
+                               for value in values)
+            return f"<p>{html.escape(node.label)}</p><p><strong>{shown}</strong></p>"
+        if kind == "plotly_chart":
+            self.charts += 1
+            chart_id = f"chart-{self.charts}"
+            return (f'<div id="{chart_id}"></div>\n<script>(function () {{ var spec = {node.proto.spec}; '
+                    f'Plotly.newPlot("{chart_id}", spec.data, spec.layout, {{responsive: true}}); }})();</script>')
+        if kind in ("main", "sidebar", "vertical", "event"):
+            return self.children(node)
+        if kind == "horizontal":
+            return f'<div class="columns">{self.children(node)}</div>'
+        if kind == "column":
+            return f'<div style="flex: {node.weight}">{self.children(node)}</div>'
+        if kind == "tab_container":
+            return self.children(node)
+        if kind == "tab":
+            return f'<div class="tab-label">{html.escape(node.label)}</div>{self.children(node)}'
+        raise ValueError(f"{self.view}: no HTML export for {kind!r} elements")
+
+    def children(self, node):
+        return "\n".join(self.element(child) for child in node.children.values())
+
+    def document(self, at):
+        return _PAGE.format(
+            lang=self.locale,
+            title=html.escape(self.text["page_title"]),
+            plotly_js=PLOTLY_JS,
+            layout_css=_LAYOUT_CSS,
+            sidebar=self.element(at.sidebar),
+            main=self.element(at.main),
+        )
+
+
+def export(output):
+    os.makedirs(output, exist_ok=True)
+    with open(os.path.join(output, PLOTLY_JS), "w", encoding="utf-8") as script:
+        script.write(get_plotlyjs())
+
+    written = []
+    for locale in LOCALES:
+        os.makedirs(os.path.join(output, locale), exist_ok=True)
+
+        def render(at, view):
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{locale} {view} failed: {at.exception[0].message}")
+            path = os.path.join(output, locale, view_file(view))
+            with open(path, "w", encoding="utf-8") as page:
+                page.write(_ViewWriter(locale, view).document(at))
+            written.append(path)
+
+        at = AppTest.from_file(APP_SCRIPT, default_timeout=120)
+        at.query_params["lang"] = locale
+        walk_views(at, render)
+
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as index:
+        target = f"{LOCALES[0]}/index.html"
+        index.write(f'<!DOCTYPE html>\n<meta http-equiv="refresh" content="0; url={target}">\n'
+                    f'<a href="{target}">{target}</a>\n')
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every view of the app as a static HTML bundle.")
+    parser.add_argument("--output", default="site", help="directory of the bundle")
+    args = parser.parse_args(argv)
+
+    written = export(args.output)
+    size = sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(args.output) for name in names)
+    print(f"{len(written)} pages written to {args.output} ({size / 1024 / 1024:.1f} MiB with the scripts)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Process-wide cache of the Plotly charts. Their inputs are static, so each
+# figure is built once per page, selection, locale and dataset version, kept as
+# its JSON spec and sent as is to every session: a cache hit builds no figure,
+# DataFrame or JSON at all. Misses go through the render cache on disk (subprime_app/render_cache.py)
+# before building, so other workers and restarts reuse what was built once.
+# Its entries are also keyed on the version of the locale catalog and on
+# FORMAT, so edited chart text or builders are never served from an old entry.
+import json
+import threading
+
+import plotly.io as pio
+import streamlit as st
+
+from subprime_app import content, datastore, render_cache
+from subprime_app.instrumentation import report, stage
+
+# The chart element is built by hand on Streamlit internals, which match what
+# st.plotly_chart sends only in the versions below. Any other version gets the
+# public st.plotly_chart with the spec as a dict (slower: Streamlit turns it
+# back into a figure)
+_TESTED_VERSIONS = ("1.37.0", "1.37.1")
+try:
+    from streamlit.elements.form import current_form_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    from streamlit.runtime.state.common import compute_widget_id
+except ImportError:
+    FAST_PATH = False
+else:
+    FAST_PATH = st.__version__ in _TESTED_VERSIONS
+
+# Same config st.plotly_chart sends when no config is given
+_CONFIG = json.dumps({"showLink": False, "linkText": False})
+
+# Bump when a figure builder draws something else for the same inputs
+FORMAT = 1
+
+_rendered = {}
+_counters = {"hits": 0, "misses": 0, "built": 0}
+_lock = threading.Lock()  # guards the dicts above, never held while building
+_building = {}  # key -> lock of the build in progress
+
+
+def _cached(kind, page, selection, build):
+    locale = st.session_state.get("locale")
+    key = (kind, page, selection, locale, datastore.dataset_version())
+    with _lock:
+        value = _rendered.get(key)
+        if value is not None:
+            _counters["hits"] += 1
+            return value
+        key_lock = _building.setdefault(key, threading.Lock())
+
+    # One build per key: sessions missing the same chart wait for it, misses
+    # on other charts go ahead
+    with key_lock:
+        with _lock:
+            value = _rendered.get(key)
+            _counters["hits" if value is not None else "misses"] += 1
+        if value is not None:
+            return value
+
+        def render():
+            with _lock:
+                _counters["built"] += 1
+            return build()
+
+        inputs = [FORMAT, page, selection, locale, content.source_version(locale) if locale else None]
+        value = render_cache.cached(kind, inputs, render)
+        with _lock:
+            _rendered[key] = value
+            _building.pop(key, None)
+        return value
+
+
+def figure_spec(page, selection, build):
+    # JSON spec of the figure returned by build(); selection tells apart the
+    # charts of a page (chart name and, for selector-driven ones, the chosen option)
+    return _cached("figure", page, selection, lambda: pio.to_json(build(), validate=False))
+
+
+def plotly_chart(page, selection, build, use_container_width=False):
+    # st.plotly_chart for a cached spec: the same element, without turning the
+    # spec back into a figure (which costs as much as building it)
+    with stage("figure"):
+        spec = figure_spec(page, selection, build)
+    if not FAST_PATH:
+        st.plotly_chart(json.loads(spec), use_container_width=use_container_width)
+        return
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.use_container_width = use_container_width
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(dg)
+    proto.spec = spec
+    proto.config = _CONFIG
+    ctx = get_script_run_ctx()
+    proto.id = compute_widget_id(
+        "plotly_chart",
+        user_key=None,
+        key=None,
+        plotly_spec=spec,
+        plotly_config=_CONFIG,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme="streamlit",
+        form_id=proto.form_id,
+        use_container_width=use_container_width,
+        page=ctx.active_script_hash if ctx else None,
+    )
+    dg._enqueue("plotly_chart", proto)
+
+
+def cache_stats():
+    with _lock:
+        return {**_counters, "entries": len(_rendered)}
+
+
+report("figure_cache", cache_stats)
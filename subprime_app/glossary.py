@@ -0,0 +1,128 @@
+# Glossary tooltips. The acronyms of a locale's "glossary" (MBS, CDO, TARP...)
+# are wrapped in <abbr class="glossary" title="definition"> the first time
+# they appear in each text block, so hovering them shows the definition.
+#
+# All the terms are found in one pass over the text with an Aho-Corasick
+# automaton, compiled once per locale: the cost of a pass grows with the
+# length of the text and the number of matches, not with the number of terms.
+# The annotation runs when the content is compiled (subprime_app/content.py),
+# so the app only ever streams annotated HTML.
+import collections
+import functools
+import html
+import re
+
+from subprime_app.locales import load_catalog
+
+# Text inside these elements is never annotated
+_SKIPPED_ELEMENTS = {"h1", "h2", "h3", "h4", "h5", "h6", "a", "abbr", "code", "pre", "script", "style"}
+
+_TAGS = re.compile(r"(<[^>]*>)")
+_TAG_NAME = re.compile(r"<(/?)([a-zA-Z0-9]+)")
+
+
+class Automaton:
+    # Aho-Corasick automaton: a trie of the patterns whose nodes also link to
+    # the longest proper suffix of their path that is in the trie
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        for pattern in patterns:
+            node = 0
+            for char in pattern:
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            self._output[node] = (pattern,)
+
+        # Failure links, breadth first: a node's link is found from its parent's
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[child] = link if link != child else 0
+                self._output[child] += self._output[self._fail[child]]
+                queue.append(child)
+
+    def matches(self, text):
+        # (start, end, pattern) of every occurrence of every pattern
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern in self._output[node]:
+                yield position + 1 - len(pattern), position + 1, pattern
+
+
+def _word_end(text, end):
+    # End of the word a match closes, allowing a plural "s" ("CDOs", "G-SIBs"),
+    # or None when the match ends inside a longer word
+    if end == len(text) or not text[end].isalnum():
+        return end
+    if text[end] == "s" and (end + 1 == len(text) or not text[end + 1].isalnum()):
+        return end + 1
+    return None
+
+
+class Glossary:
+
+    def __init__(self, definitions):
+        self.definitions = definitions
+        self._automaton = Automaton(definitions)
+
+    def _terms(self, text):
+        # Leftmost-longest whole-word matches, without overlaps
+        candidates = []
+        for start, end, term in self._automaton.matches(text):
+            if start and text[start - 1].isalnum():
+                continue
+            word_end = _word_end(text, end)
+            if word_end is not None:
+                candidates.append((start, -len(term), word_end, term))
+        candidates.sort()
+        last_end = 0
+        for start, _, end, term in candidates:
+            if start >= last_end:
+                yield start, end, term
+                last_end = end
+
+    def annotate(self, markup):
+        # The block with the first occurrence of each term wrapped in a tooltip
+        seen = set()
+        skipped = 0
+        parts = _TAGS.split(markup)
+        for index, part in enumerate(parts):
+            if index % 2:
+                tag = _TAG_NAME.match(part)
+                if tag and tag.group(2).lower() in _SKIPPED_ELEMENTS and not part.endswith("/>"):
+                    skipped += -1 if tag.group(1) else 1
+                continue
+            if skipped > 0 or not part:
+                continue
+            pieces = []
+            last = 0
+            for start, end, term in self._terms(part):
+                if term in seen:
+                    continue
+                seen.add(term)
+                title = html.escape(self.definitions[term])
+                pieces.append(f'{part[last:start]}<abbr class="glossary" title="{title}">{part[start:end]}</abbr>')
+                last = end
+            if pieces:
+                parts[index] = "".join(pieces) + part[last:]
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def load_glossary(locale):
+    return Glossary(load_catalog(locale)["glossary"])
@@ -0,0 +1,126 @@
+# Opt-in render timings, per stage of a rerun. Turned on by the environment:
+#
+#   SUBPRIME_TIMINGS=1       wall time of every stage, logged once per rerun
+#   SUBPRIME_TIMINGS=memory  also the memory each stage allocates (tracemalloc,
+#                            which slows the whole app down while it traces)
+#
+# When it is on, sessions opened with ?timings=1 also get a sidebar panel with
+# the stages of their last rerun. When it is off, stage() hands back one shared
+# no-op context manager, so an instrumented section costs a function call.
+#
+# Reruns of a fragment alone (a selector or slider inside it) are logged as
+# records of their own, labelled with the fragment's name. Counters registered
+# with report() (the hits and misses of subprime_app/figure_cache.py) are
+# logged with every record.
+import contextlib
+import functools
+import os
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+MODE = os.environ.get("SUBPRIME_TIMINGS", "")
+ENABLED = bool(MODE)
+if MODE == "memory":
+    tracemalloc.start()
+
+logger = get_logger(__name__)
+
+# Stages are recorded for the rerun running on the current thread
+_local = threading.local()
+_OFF = contextlib.nullcontext()
+
+# Stages that are not markup: building figures and loading or computing data
+_BUILD_STAGES = ("figure", "data")
+
+# Name -> function returning a dict of counters, process-wide
+_reporters = {}
+
+
+@contextlib.contextmanager
+def _record(name):
+    stages = getattr(_local, "stages", None)
+    if stages is None:
+        stages = _local.stages = {}
+    open_stages = _local.__dict__.setdefault("open", [])
+    # Time in build stages, counted once when they nest (data inside a figure)
+    outermost_build = name in _BUILD_STAGES and not any(stage in _BUILD_STAGES for stage in open_stages)
+    open_stages.append(name)
+    tracing = tracemalloc.is_tracing()
+    before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        open_stages.pop()
+        elapsed = (time.perf_counter() - start) * 1000
+        row = stages.setdefault(name, {"ms": 0.0, "kib": 0.0})
+        row["ms"] += elapsed
+        if outermost_build:
+            _local.build_ms = getattr(_local, "build_ms", 0.0) + elapsed
+        if tracing:
+            row["kib"] += (tracemalloc.get_traced_memory()[0] - before) / 1024
+
+
+def stage(name):
+    # Times the enclosed block; a stage entered several times in a rerun adds up,
+    # and nested stages are also counted in the enclosing one
+    return _record(name) if ENABLED else _OFF
+
+
+def report(name, read):
+    # Logs the counters returned by read() with every record, as <name>_<key>=<value>
+    _reporters[name] = read
+
+
+def counters():
+    return {f"{name}_{key}": value for name, read in _reporters.items() for key, value in read().items()}
+
+
+def start_rerun():
+    _local.stages = {}
+    _local.build_ms = 0.0
+    _local.in_rerun = True
+
+
+def finish_rerun(**labels):
+    # Logs the stages of the rerun as one key=value line and returns them.
+    # "markup" is the part of the page outside the figures and data:
+    # Markdown, HTML and widgets
+    _local.in_rerun = False
+    stages = getattr(_local, "stages", {})
+    page = stages.get("page")
+    if page is not None:
+        stages["markup"] = {"ms": page["ms"] - getattr(_local, "build_ms", 0.0), "kib": 0.0}
+    fields = [f"{key}={value}" for key, value in labels.items()]
+    for name, row in stages.items():
+        fields.append(f"{name}_ms={row['ms']:.1f}")
+        if row["kib"]:
+            fields.append(f"{name}_kib={row['kib']:.0f}")
+    fields.extend(f"{name}={value}" for name, value in counters().items())
+    logger.info("render %s", " ".join(fields))
+    return stages
+
+
+def fragment(function):
+    # st.fragment whose reruns of its own are logged as a record labelled
+    # fragment=<name>, its body counting as the page. Within a full rerun it
+    # only adds to that rerun's stages
+    if not ENABLED:
+        return st.fragment(function)
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        if getattr(_local, "in_rerun", False):
+            return function(*args, **kwargs)
+        start_rerun()
+        try:
+            with _record("page"):
+                return function(*args, **kwargs)
+        finally:
+            finish_rerun(fragment=function.__name__)
+
+    return st.fragment(timed)
@@ -0,0 +1,138 @@
+"""Page-scoped lazy imports and an import-time report.
+
+Modules that only some pages need (plotly.express, plotly.subplots and the
+loan-pool analytics) are bound to lazy proxies at the top of the page modules
+and only imported the first time the selected page touches them. Everything
+else is paid by every page: Streamlit 1.37 imports plotly.graph_objects and
+plotly.io itself at startup, and the page modules import pandas, numpy and
+pyarrow, so those are plain imports. Running this module prints how much each
+page's imports cost in a fresh interpreter, with the modules each import
+actually added to ``sys.modules``:
+
+    python -m subprime_app.lazy_imports --budget-ms 1500 --budget-rss-mb 150
+"""
+import argparse
+import importlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import types
+
+# Modules imported by every page: Streamlit (which brings plotly.graph_objects
+# and plotly.io in) and the page renderers (pandas, numpy, pyarrow)
+BASE_MODULES = ("streamlit", "subprime_app.pages")
+
+# Modules each page imports lazily on top of the base modules
+PAGE_MODULES = {
+    "intro": (),
+    "timeline": (),
+    "housing": ("plotly.express", "subprime_app.performance", "subprime_app.payment_shock"),
+    "impact": ("plotly.express",),
+    "securitization": ("plotly.subplots",),
+    "regulation": (),
+    "lessons": (),
+}
+
+# Libraries whose presence in sys.modules the report shows
+WATCHED_MODULES = ("plotly.graph_objects", "plotly.io", "plotly.express", "plotly.subplots", "pandas", "numpy",
+                   "pyarrow", "pyarrow.parquet")
+
+# Time (ms) and RSS delta (KB) of each lazy import performed by this process
+IMPORT_TIMINGS = {}
+
+
+def current_rss_kb():
+    # Resident set size of this process; falls back to the peak RSS off Linux
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def timed_import(name):
+    start_rss = current_rss_kb()
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMINGS.setdefault(name, {
+        "ms": (time.perf_counter() - start) * 1000,
+        "rss_kb": current_rss_kb() - start_rss,
+    })
+    return module
+
+
+class LazyModule(types.ModuleType):
+    # Stands in for a module until one of its attributes is first accessed
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = timed_import(self.__name__)
+        return getattr(self._module, attr)
+
+
+def lazy_import(name):
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def _measure(modules):
+    # Runs in a fresh interpreter: import the modules in order, one at a time,
+    # noting the watched libraries each one loaded and whether it was already
+    # loaded by the ones before (then it costs nothing and need not be lazy)
+    report = []
+    for name in modules:
+        preloaded = name in sys.modules
+        before = set(sys.modules)
+        timed_import(name)
+        loaded = [module for module in WATCHED_MODULES if module in sys.modules and module not in before]
+        report.append({"module": name, "preloaded": preloaded, "loaded": loaded, **IMPORT_TIMINGS[name]})
+    json.dump(report, sys.stdout)
+
+
+def measure_page(page):
+    modules = BASE_MODULES + PAGE_MODULES[page]
+    code = f"from subprime_app.lazy_imports import _measure; _measure({modules!r})"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the cold import cost of each page.")
+    parser.add_argument("--budget-ms", type=float, help="maximum import time per page, in ms")
+    parser.add_argument("--budget-rss-mb", type=float, help="maximum RSS growth per page, in MB")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = {page: measure_page(page) for page in PAGE_MODULES}
+    over_budget = []
+    for page, rows in report.items():
+        total_ms = sum(row["ms"] for row in rows)
+        total_mb = sum(row["rss_kb"] for row in rows) / 1024
+        if (args.budget_ms is not None and total_ms > args.budget_ms) or \
+                (args.budget_rss_mb is not None and total_mb > args.budget_rss_mb):
+            over_budget.append(page)
+        if not args.json:
+            print(f"{page}: {total_ms:.0f} ms, {total_mb:+.1f} MB")
+            for row in rows:
+                note = "already loaded" if row["preloaded"] else ", ".join(row["loaded"])
+                print(f"    {row['module']:<28} {row['ms']:8.1f} ms {row['rss_kb'] / 1024:+8.1f} MB  {note}")
+
+    if args.json:
+        json.dump({"pages": report, "over_budget": over_budget}, sys.stdout, indent=2)
+        print()
+    elif over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
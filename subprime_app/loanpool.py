@@ -0,0 +1,198 @@
+"""Synthetic loan-level mortgage pool.
+
+Generates a seeded pool of mortgages originated from 2000 to 2008, one row per
+loan: vintage, segment (prime or subprime), product (fixed or hybrid ARM),
+region, FICO, LTV, DTI, original balance, initial rate (the teaser rate of
+ARMs) and ARM margin. Vintages are drawn in proportion to the originations of
+each year and a loan is subprime (FICO under 620) with the share of its
+vintage in the ``subprime_share`` dataset, so the pool reproduces the chart of
+the housing page. The other settings are in ``subprime_app/data.py``.
+
+Loans are drawn in chunks of NumPy arrays and each chunk is written as one
+row group of a Parquet file, so memory does not grow with the pool. Numeric
+columns are float32 or small integers and text columns are dictionary-encoded
+(categoricals in pandas):
+
+    python -m subprime_app.loanpool --rows 10000000
+"""
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from subprime_app import data, datastore
+
+POOL_PATH = os.path.join(datastore.DATASETS_DIR, "loans.parquet")
+ROWS = 10_000_000
+CHUNK_SIZE = 1_000_000
+SEED = 2008
+
+SEGMENTS = list(data.LOAN_POOL_SEGMENTS)
+
+_CATEGORY = pa.dictionary(pa.int8(), pa.string())
+
+SCHEMA = pa.schema([
+    ("loan_id", pa.int32()),
+    ("vintage", pa.int16()),
+    ("segment", _CATEGORY),
+    ("product", _CATEGORY),
+    ("region", _CATEGORY),
+    ("fico", pa.int16()),
+    ("ltv", pa.float32()),
+    ("dti", pa.float32()),
+    ("balance", pa.float32()),
+    ("rate", pa.float32()),  # initial rate: the teaser rate of ARMs
+    ("margin", pa.float32()),  # over the index at the reset, NaN for fixed-rate loans
+])
+
+
+def calibration():
+    # Vintages with their share of the originations, subprime share and
+    # Case-Shiller index relative to 2000
+    vintages = np.array(list(data.LOAN_POOL_VOLUMES), dtype=np.int16)
+    shares = datastore.load_frame("subprime_share").set_index("year")["share"]
+    case_shiller = datastore.load_frame("case_shiller")
+    volumes = np.array(list(data.LOAN_POOL_VOLUMES.values()))
+    return {
+        "vintages": vintages,
+        "volume": volumes / volumes.sum(),
+        "subprime": shares.loc[vintages].to_numpy() / 100,
+        "prices": np.interp(vintages, case_shiller["date"], case_shiller["index"]) / case_shiller["index"].iloc[0],
+        "rates": np.array([data.LOAN_POOL_MORTGAGE_RATES[vintage] for vintage in vintages]),
+    }
+
+
+def _choice(rng, weights, size):
+    # Index of a category for each loan
+    cumulative = np.cumsum(weights)
+    return np.minimum(np.searchsorted(cumulative, rng.random(size, dtype=np.float32), side="right"),
+                      len(weights) - 1).astype(np.int8)
+
+
+def _truncated_normal(rng, mean, deviation, low, high, size):
+    # Normal draws, redrawing the ones out of [low, high]
+    values = mean + deviation * rng.standard_normal(size, dtype=np.float32)
+    outside = (values < low) | (values > high)
+    while outside.any():
+        values[outside] = mean + deviation * rng.standard_normal(np.count_nonzero(outside), dtype=np.float32)
+        outside[outside] = (values[outside] < low) | (values[outside] > high)
+    return values
+
+
+def _dictionary(indexes, names):
+    return pa.DictionaryArray.from_arrays(pa.array(indexes, pa.int8()), pa.array(names, pa.string()))
+
+
+def generate_chunk(rng, size, first_id, calibrated):
+    # Loans are drawn a block per vintage and segment, with that block's
+    # settings; the number of loans of each block is multinomial
+    cells = np.outer(calibrated["volume"], [1, 0]) + np.outer(calibrated["volume"] * calibrated["subprime"], [-1, 1])
+    counts = rng.multinomial(size, cells.ravel()).reshape(cells.shape)
+
+    vintage = np.empty(size, np.int16)
+    segment, product, region = (np.empty(size, np.int8) for _ in range(3))
+    fico, ltv, dti, balance, rate, margin = (np.empty(size, np.float32) for _ in range(6))
+    fixed = data.LOAN_POOL_PRODUCTS.index("fixed")
+    start = 0
+    for (index, segment_index), count in np.ndenumerate(counts):
+        block = slice(start, start + count)
+        start += count
+        settings = data.LOAN_POOL_SEGMENTS[SEGMENTS[segment_index]]
+        vintage[block] = calibrated["vintages"][index]
+        segment[block] = segment_index
+        product[block] = _choice(rng, settings["products"], count)
+        region[block] = _choice(rng, settings["regions"], count)
+        fico[block] = _truncated_normal(rng, *settings["fico"], count)
+        ltv[block] = _truncated_normal(rng, *settings["ltv"], count)
+        dti[block] = _truncated_normal(rng, *settings["dti"], count)
+        balance[block] = settings["balance"] * calibrated["prices"][index] * np.exp(
+            0.5 * rng.standard_normal(count, dtype=np.float32))
+
+        # Fixed rate: the year's average plus the segment spread; ARMs start
+        # below it and reset to the index plus their margin
+        arm = product[block] != fixed
+        spread, spread_deviation = settings["spread"]
+        rate[block] = (calibrated["rates"][index] + spread + spread_deviation * rng.standard_normal(count, dtype=np.float32)
+                       - np.where(arm, settings["teaser_discount"], 0))
+        margin_mean, margin_deviation = settings["margin"]
+        margin[block] = np.where(arm, margin_mean + margin_deviation * rng.standard_normal(count, dtype=np.float32),
+                                 np.nan)
+
+    columns = [
+        pa.array(np.arange(first_id, first_id + size, dtype=np.int32)),
+        pa.array(vintage),
+        _dictionary(segment, SEGMENTS),
+        _dictionary(product, data.LOAN_POOL_PRODUCTS),
+        _dictionary(region, data.LOAN_POOL_REGIONS),
+        pa.array(np.rint(fico).astype(np.int16)),
+        pa.array(ltv.round(3)),
+        pa.array(dti.round(3)),
+        pa.array(balance.round(-3)),
+        pa.array(rate.round(4)),
+        pa.array(margin.round(4)),
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=SCHEMA)
+
+
+def generate(rows=ROWS, seed=SEED, chunk_size=CHUNK_SIZE):
+    # Record batches of at most chunk_size loans; chunk i is drawn from the
+    # seed sequence (seed, i), so a pool is reproducible from its parameters
+    calibrated = calibration()
+    for index, first_id in enumerate(range(0, rows, chunk_size)):
+        rng = np.random.default_rng([seed, index])
+        yield generate_chunk(rng, min(chunk_size, rows - first_id), first_id, calibrated)
+
+
+def write_pool(path=POOL_PATH, rows=ROWS, seed=SEED, chunk_size=CHUNK_SIZE):
+    # Writes the pool one row group per chunk; returns the number of loans and
+    # of subprime loans of each vintage. The file is replaced only once complete
+    calibrated = calibration()
+    loans = np.zeros(len(calibrated["vintages"]), dtype=np.int64)
+    subprime = np.zeros_like(loans)
+    temporary = f"{path}.tmp"
+    # Arrow releases the GIL while it encodes, so each chunk is written in a
+    # thread while the next one is drawn
+    with pq.ParquetWriter(temporary, SCHEMA, compression="zstd") as writer, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for batch in generate(rows, seed, chunk_size):
+            if pending is not None:
+                pending.result()
+            pending = executor.submit(writer.write_batch, batch, row_group_size=len(batch))
+            vintage = batch.column("vintage").to_numpy() - calibrated["vintages"][0]
+            is_subprime = batch.column("segment").indices.to_numpy(zero_copy_only=False) == SEGMENTS.index("subprime")
+            loans += np.bincount(vintage, minlength=len(loans))
+            subprime += np.bincount(vintage[is_subprime], minlength=len(loans))
+        if pending is not None:
+            pending.result()
+    os.replace(temporary, path)
+    return dict(zip(calibrated["vintages"].tolist(), zip(loans.tolist(), subprime.tolist())))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the synthetic loan-level mortgage pool as Parquet.")
+    parser.add_argument("--rows", type=int, default=ROWS, help="number of loans")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="loans per row group")
+    parser.add_argument("--output", default=POOL_PATH, help="Parquet file to write")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    counts = write_pool(args.output, args.rows, args.seed, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    targets = datastore.load_frame("subprime_share").set_index("year")["share"]
+    for vintage, (loans, subprime) in counts.items():
+        print(f"{vintage}  {loans:10d} loans  subprime {subprime / max(loans, 1):6.2%} (target {targets[vintage] / 100:6.2%})")
+    size = os.path.getsize(args.output)
+    print(f"{args.rows} loans written to {args.output} in {elapsed:.1f} s ({size / 1024 / 1024:.1f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
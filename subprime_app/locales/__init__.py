@@ -0,0 +1,31 @@
+# Locale catalogs: every piece of text shown by the app, one module per
+# language. A catalog is only imported the first time its locale is used.
+import functools
+import importlib
+
+LOCALES = ("pt", "en")
+DEFAULT_LOCALE = "pt"
+
+# Shown in the language selector, always in the language itself
+LANGUAGE_NAMES = {"pt": "Português", "en": "English"}
+
+# Keyed selectors whose session state holds a translated label, with the
+# catalog entry that maps their option ids to labels
+TRANSLATED_SELECTORS = {
+    "page": lambda text: text["pages"],
+    "timeline_period": lambda text: dict(enumerate(text["timeline"]["periods"])),
+    "impact_metric": lambda text: text["impact"]["metrics"],
+    "region": lambda text: text["regulation"]["regions"],
+    "waterfall_allocation": lambda text: text["securitization"]["allocations"],
+    "performance_product": lambda text: text["housing"]["products"],
+    "performance_fico": lambda text: text["housing"]["fico_bands"],
+    "performance_vintage": lambda text: text["housing"]["vintages"],
+    "shock_product": lambda text: text["housing"]["shock_products"],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(locale):
+    if locale not in LOCALES:
+        raise ValueError(f"Unknown locale: {locale!r}")
+    return importlib.import_module(f"{__name__}.{locale}").CATALOG
@@ -0,0 +1,991 @@
+# Text, labels and content of the English version of the app
+
+CATALOG = {
+    "page_title": "Subprime Crisis: Timeline and Impacts",
+    "title": "Subprime Crisis: Timeline and Global Impacts",
+    "intro_box_html": """
+        <div class="info-box">
+        This interactive application presents a detailed analysis of the 2008 Subprime Crisis,
+        including its timeline, causes, global impacts, and lessons learned.
+        Navigate through different sections using the sidebar menu.
+        </div>
+        """,
+    "footer_html": """
+        <div class="footer">
+        Developed as educational material for financial crisis classes.<br>
+        © 2025 - Prof. José Américo – Coppead
+        </div>
+        """,
+    "sidebar": {
+        "title": "Navigation",
+        "language_label": "Language",
+        "label": "Select a section:",
+        "search_label": "Search the content",
+        "search_placeholder": "SIV, TARP, Basel III...",
+        "search_empty": "No results.",
+        "about_md": """
+            **About the application**
+
+            This application was developed as educational material for financial crisis classes.
+
+            © 2025 - Prof. José Américo – Coppead
+            """,
+    },
+    # Acronyms explained by a tooltip wherever they appear in the content
+    "glossary": {
+        "MBS": "Mortgage-Backed Security: a bond paid by the installments of a pool of mortgages.",
+        "CDO": "Collateralized Debt Obligation: a security backed by a pool of debt (often MBS), "
+               "split into tranches of different risk.",
+        "CDO²": "CDO squared: a CDO backed by tranches of other CDOs.",
+        "CDS": "Credit Default Swap: a contract that pays its buyer if a borrower defaults, "
+               "in exchange for periodic premiums.",
+        "SIV": "Structured Investment Vehicle: an off-balance-sheet fund that bought long-term "
+               "securities with short-term funding.",
+        "SPV": "Special Purpose Vehicle: a legal entity that holds the securitized assets apart "
+               "from the bank that originated them.",
+        "LCR": "Liquidity Coverage Ratio (Basel III): liquid assets enough to cover 30 days of "
+               "stressed outflows.",
+        "NSFR": "Net Stable Funding Ratio (Basel III): long-term assets must be funded by stable "
+                "sources over a one-year horizon.",
+        "TAF": "Term Auction Facility: auctions of term loans from the Federal Reserve to banks, "
+               "created in December 2007.",
+        "TARP": "Troubled Asset Relief Program: the US$700 billion program of October 2008 to buy "
+                "troubled assets and recapitalize banks.",
+        "QE": "Quantitative Easing: large-scale purchases of securities by a central bank to lower "
+              "long-term interest rates.",
+        "G-SIB": "Global Systemically Important Bank: a bank whose failure would threaten the global "
+                 "financial system, subject to extra capital requirements.",
+    },
+    "pages": {
+        "intro": "Introduction",
+        "timeline": "Timeline",
+        "housing": "Housing Bubble",
+        "impact": "Global Impact",
+        "securitization": "Securitization",
+        "regulation": "Regulatory Responses",
+        "lessons": "Lessons Learned",
+    },
+    "intro": {
+        "header": "Overview of the Subprime Crisis",
+        "overview_md": """
+            The 2008 subprime crisis was the most severe financial crisis since the Great Depression,
+            causing profound impacts on the global economy and fundamentally changing the international
+            financial system.
+
+            ### What was the subprime crisis?
+
+            The crisis originated in the US housing market, centered on high-risk (subprime) mortgage loans
+            granted to borrowers with questionable credit history. The securitization of these loans into
+            complex financial instruments spread risk throughout the global financial system.
+
+            ### Why study this crisis?
+
+            * Reveals vulnerabilities in the modern financial system
+            * Demonstrates how problems in one sector can propagate globally
+            * Led to fundamental changes in financial regulation
+            * Offers valuable lessons to prevent future crises
+
+            Explore the different sections of this application to understand the timeline, causes,
+            impacts, and consequences of this historic crisis.
+            """,
+        "key_facts_md": """
+            ### Key Facts
+
+            * **Estimated loss:** More than $2 trillion globally
+
+            * **Market decline:** Major stock indices fell more than 50%
+
+            * **Government bailouts:** Hundreds of billions of dollars in interventions
+
+            * **US unemployment:** Increased from 5% to more than 10%
+
+            * **Global recession:** First contraction of global GDP since 1945
+
+            * **Failed institutions:** Lehman Brothers, Washington Mutual, Bear Stearns and others
+            """,
+        "explore_html": "<div class=\"info-box\"><strong>Start exploring!</strong><br>Use the navigation menu to access different sections of the application.</div>",
+    },
+    "timeline": {
+        "header": "Crisis Timeline",
+        "period_label": "Select a period from the timeline:",
+        "periods": [
+            "Background (2001-2006)",
+            "Early Warning Signs (2006-2007)",
+            "Crisis Outbreak (2007-2008)",
+            "Peak of the Crisis (2008)",
+            "Global Developments (2008-2010)",
+            "Policy Responses (2008-2010)",
+            "Consequences (2010-2015)",
+            "Legacy and Transformations (2015-2023)",
+        ],
+        "events": [
+            [
+                {
+                    "date": "2001",
+                    "description": "After the dot-com bubble burst, the Federal Reserve reduced interest rates to just 1% to stimulate the economy.",
+                },
+                {
+                    "date": "2001-2003",
+                    "description": "Beginning of financial deregulation. The banking sector began to aggressively expand mortgage credit.",
+                },
+                {
+                    "date": "2003-2006",
+                    "description": "Proliferation of subprime (high-risk) loans and complex financial instruments such as CDOs (Collateralized Debt Obligations) and MBS (Mortgage-Backed Securities).",
+                },
+                {
+                    "date": "2001-2006",
+                    "description": "Housing prices in the US rose by an average of 85%, creating a speculative bubble in the real estate market.",
+                },
+            ],
+            [
+                {
+                    "date": "Mid-2006",
+                    "description": "Housing prices peaked and began to fall. Default rates on subprime loans began to rise.",
+                },
+                {
+                    "date": "Feb 2007",
+                    "description": "HSBC bank announced losses of $10.5 billion related to the subprime market.",
+                },
+                {
+                    "date": "Apr 2007",
+                    "description": "New Century Financial, one of the largest subprime lenders in the US, filed for bankruptcy.",
+                },
+                {
+                    "date": "Jun-Jul 2007",
+                    "description": "Rating agencies (Moody's, S&P) downgraded hundreds of securities backed by subprime mortgages.",
+                },
+                {
+                    "date": "Aug 2007",
+                    "description": "BNP Paribas suspended three funds due to the impossibility of valuing subprime assets. This event is often considered the formal beginning of the crisis.",
+                },
+            ],
+            [
+                {
+                    "date": "Sep 2007",
+                    "description": "Northern Rock, a British bank, experienced a bank run and needed a rescue from the Bank of England.",
+                },
+                {
+                    "date": "Oct 2007",
+                    "description": "UBS and Citigroup announced billion-dollar losses related to the subprime market.",
+                },
+                {
+                    "date": "Dec 2007",
+                    "description": "Federal Reserve created the Term Auction Facility (TAF) to provide liquidity to the banking system.",
+                },
+                {
+                    "date": "Jan-Feb 2008",
+                    "description": "Major global banks announced massive losses. The Fed aggressively cut interest rates.",
+                },
+                {
+                    "date": "Mar 2008",
+                    "description": "Bear Stearns, the fifth-largest US investment bank, was sold to JPMorgan Chase with help from the Federal Reserve for just $10 per share, well below its previous market value.",
+                },
+            ],
+            [
+                {
+                    "date": "Sep 2008 (7th)",
+                    "description": "The US government took control of Fannie Mae and Freddie Mac, mortgage market giants.",
+                },
+                {
+                    "date": "Sep 2008 (15th)",
+                    "description": "Lehman Brothers, the fourth-largest US investment bank, declared bankruptcy. This is considered the most dramatic moment of the crisis.",
+                },
+                {
+                    "date": "Sep 2008 (16th)",
+                    "description": "Insurance company AIG received an $85 billion bailout from the US government.",
+                },
+                {
+                    "date": "Sep 2008 (16-20th)",
+                    "description": "Panic in global markets. Freezing of interbank credit. Bank runs at various institutions.",
+                },
+                {
+                    "date": "Oct 2008",
+                    "description": "US Congress approved the TARP (Troubled Asset Relief Program) of $700 billion to buy toxic assets and recapitalize banks.",
+                },
+                {
+                    "date": "Nov-Dec 2008",
+                    "description": "The US officially entered a recession. The unemployment rate soared. Bailouts for American automakers.",
+                },
+            ],
+            [
+                {
+                    "date": "Oct 2008",
+                    "description": "Iceland: collapse of the country's three largest banks, leading to the virtual bankruptcy of the nation.",
+                },
+                {
+                    "date": "Oct-Nov 2008",
+                    "description": "Central banks around the world coordinated interest rate cuts. IMF rescued countries like Hungary, Ukraine, and Pakistan.",
+                },
+                {
+                    "date": "Dec 2008",
+                    "description": "China announced a $586 billion stimulus package. Japan, UK, and European Union launched their own packages.",
+                },
+                {
+                    "date": "Jan-Feb 2009",
+                    "description": "Global economy entered a synchronized recession. Global GDP contracted by 0.6% in 2009, the first contraction since World War II.",
+                },
+                {
+                    "date": "Feb 2009",
+                    "description": "US approved the American Recovery and Reinvestment Act of $787 billion.",
+                },
+                {
+                    "date": "2009-2010",
+                    "description": "Beginning of the European sovereign debt crisis, especially in Greece, Ireland, Portugal, Spain, and Italy.",
+                },
+            ],
+            [
+                {
+                    "date": "Oct 2008",
+                    "description": "G7 committed to taking 'all necessary measures' to stabilize the financial system.",
+                },
+                {
+                    "date": "Nov 2008",
+                    "description": "First G20 summit focused on the financial crisis, marking the rise of this group as the main global economic forum.",
+                },
+                {
+                    "date": "Mar 2009",
+                    "description": "Federal Reserve initiated the first Quantitative Easing (QE) program, buying $1.25 trillion in mortgage-backed securities.",
+                },
+                {
+                    "date": "Apr 2009",
+                    "description": "G20 committed to providing $1.1 trillion in resources to combat the global crisis.",
+                },
+                {
+                    "date": "Jul 2010",
+                    "description": "Dodd-Frank Act approved in the US, the biggest financial reform since the Great Depression.",
+                },
+                {
+                    "date": "Sep 2010",
+                    "description": "Basel III agreement established new rules for bank capital and liquidity at the global level.",
+                },
+            ],
+            [
+                {
+                    "date": "2010-2012",
+                    "description": "Slowdown in global economic recovery. Persistence of high unemployment in many developed countries.",
+                },
+                {
+                    "date": "2010-2014",
+                    "description": "European debt crisis intensified, forcing bailouts of Greece, Ireland, Portugal, and intervention in the Spanish banking sector.",
+                },
+                {
+                    "date": "2011-2013",
+                    "description": "Social protests such as Occupy Wall Street and anti-austerity demonstrations in Europe reflected popular discontent.",
+                },
+                {
+                    "date": "2012-2014",
+                    "description": "Central banks maintained ultra-loose monetary policies. ECB promised to do 'whatever it takes' to save the euro.",
+                },
+                {
+                    "date": "2013-2015",
+                    "description": "Uneven recovery: US recovered more quickly, while Europe and Japan faced prolonged stagnation. Emerging economies slowed down.",
+                },
+            ],
+            [
+                {
+                    "date": "2015-2018",
+                    "description": "Federal Reserve began gradual monetary normalization. Moderate but stable global growth, with increasing inequalities.",
+                },
+                {
+                    "date": "2016-2018",
+                    "description": "Rise of populist and nationalist political movements in various countries, partially attributed to the socioeconomic consequences of the crisis.",
+                },
+                {
+                    "date": "2018-2019",
+                    "description": "Revisions and relaxation of some banking regulations implemented post-crisis, especially in the US.",
+                },
+                {
+                    "date": "2020-2021",
+                    "description": "During the COVID-19 crisis, lessons from the 2008 crisis allowed faster and more coordinated responses from central banks and governments.",
+                },
+                {
+                    "date": "2022-2023",
+                    "description": "Return of inflation and rising interest rates after years of expansionary monetary policy, testing the resilience of the reformed financial system.",
+                },
+            ],
+        ],
+        "overview_title": "Timeline Overview",
+        "table_columns": ["Period", "Phase", "Key Events"],
+        "table_periods": [
+            "2001-2006",
+            "2006-2007",
+            "2007-2008",
+            "2008 (Sep)",
+            "2008-2010",
+            "2008-2010",
+            "2010-2015",
+            "2015-2023",
+        ],
+        "phases": [
+            "Bubble Formation",
+            "Warning",
+            "Initial Crisis",
+            "Collapse",
+            "Global Contagion",
+            "Intervention",
+            "Recovery",
+            "Transformation",
+        ],
+        "table_events": [
+            "Low interest rates, deregulation, subprime credit expansion",
+            "Falling housing prices, increasing defaults, first bankruptcies",
+            "Northern Rock, major bank losses, Bear Stearns sale",
+            "Lehman Brothers collapses, market panic, AIG bailout, TARP approved",
+            "Iceland crisis, global stimulus packages, synchronized recession",
+            "G20 coordination, QE programs, regulatory reforms",
+            "European debt crisis, slow recovery, prolonged low interest rates",
+            "Monetary normalization, revision of some regulations, lessons for the COVID-19 crisis",
+        ],
+        "crucial_title": "Crucial Events",
+        "crucial_events": [
+            {
+                "date": "August 2007",
+                "event": "BNP Paribas suspends funds - Formal beginning of the crisis",
+            },
+            {
+                "date": "March 2008",
+                "event": "Emergency sale of Bear Stearns to JPMorgan Chase",
+            },
+            {
+                "date": "September 2008",
+                "event": "Lehman Brothers bankruptcy - Most dramatic moment of the crisis",
+            },
+            {
+                "date": "October 2008",
+                "event": "Approval of TARP ($700 billion) to stabilize the financial system",
+            },
+            {
+                "date": "March 2009",
+                "event": "Beginning of the first Quantitative Easing (QE) program by the Federal Reserve",
+            },
+            {
+                "date": "July 2010",
+                "event": "Approval of the Dodd-Frank Act - Biggest financial reform since the Great Depression",
+            },
+        ],
+        "chart_title": "Subprime Crisis Timeline",
+        "chart_events": [
+            "Beginning of housing decline",
+            "Lehman Brothers bankruptcy",
+            "Dodd-Frank & Basel III",
+            "European debt crisis",
+        ],
+        "x_label": "Year",
+        "range_label": "Or filter the events of every period by date:",
+        "range_format": "MMM YYYY",
+        "range_count": "{count} events in the selected range",
+        "months": [
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December",
+        ],
+        "mid_year": "Mid",
+    },
+    "housing": {
+        "header": "Evolution of the US Housing Bubble",
+        "phases": ["Bubble Formation", "Bubble Burst", "Crisis and Slow Recovery"],
+        "events": ["Bubble peak", "Subprime crisis begins", "Lehman Brothers collapse"],
+        "x_label": "Year",
+        "y_label": "Case-Shiller Index (2000=100)",
+        "legend_title": "Phase",
+        "hovertemplate": "Year: %{x}<br>Index: %{y:.1f}",
+        "anatomy_html": """
+            <div class="info-box">
+            <h3>Anatomy of the Housing Bubble</h3>
+            <p>The chart above shows the evolution of the Case-Shiller Index, which measures residential home prices in 20 major metropolitan areas in the US. Note the three distinct phases:</p>
+            <ol>
+                <li><strong>Bubble Formation (2000-2006):</strong> Prices rose more than 100% in just 6 years, driven by low interest rates, loose regulation, and financial innovations that expanded mortgage credit.</li>
+                <li><strong>Bubble Burst (2006-2008):</strong> When interest rates rose and default rates increased, prices began to fall, creating a vicious cycle of foreclosures and further price drops.</li>
+                <li><strong>Crisis and Slow Recovery (2008-2012):</strong> After the collapse of Lehman Brothers, the crisis deepened and prices continued to fall, with a very slow recovery that only began in 2012.</li>
+            </ol>
+            </div>
+            """,
+        "factors_title": "Factors that Contributed to the Bubble",
+        "factors_md": """
+            - **Loose monetary policy**: Low interest rates after the dot-com crisis
+            - **Government policy**: Incentives to expand home ownership
+            - **Financial innovation**: Securitization and complex structured products
+            - **Inadequate regulation**: Weak supervision of the mortgage market
+            - **Distorted incentives**: Mortgage originators with no responsibility for risk
+            - **Optimistic valuations**: Expectation of continuous property appreciation
+            - **Failed risk ratings**: Rating agencies assigning AAA to toxic products
+            """,
+        "subprime_title": "Subprime Mortgage Rates (2000-2008)",
+        "subprime_y_label": "% of Mortgage Market",
+        "subprime_caption_html": """
+            <div style="font-size: 0.8rem; color: #666; text-align: center; margin-top: -15px;">
+            Share of subprime loans in the US mortgage market.
+            </div>
+            """,
+        "performance_title": "How the Vintages Performed",
+        "performance_md": """
+            The share of subprime loans tells only half the story: what matters is how the loans of each year
+            (their **vintage**) paid afterwards. The charts below follow a synthetic pool of mortgages, built to
+            match the subprime share above, month by month until 2010. Each curve is the share of a vintage's loans
+            that had defaulted by each month since origination: the later the vintage, the faster it went bad, as
+            2/28 ARMs reset to higher payments just when house prices started to fall.
+
+            The **roll-rate** matrix shows, for the loans in each status, where they were one month later. When
+            prices fall, fewer delinquent borrowers can cure by selling or refinancing, and more roll towards default.
+            """,
+        "performance_missing_md": """
+            *The synthetic pool has not been generated on this server. To see the vintage curves, run
+            `python -m subprime_app.loanpool` and then `python -m subprime_app.performance generate`.*
+            """,
+        "product_label": "Product:",
+        "products": {"all": "All products", "fixed": "30-year fixed", "arm_2_28": "2/28 ARM",
+                     "arm_3_27": "3/27 ARM", "arm_5_1": "5/1 ARM"},
+        "fico_label": "FICO score:",
+        "fico_bands": {"all": "All scores", "lt580": "Below 580", "580_619": "580-619", "620_679": "620-679",
+                       "680_739": "680-739", "740_plus": "740 or more"},
+        "curve_title": "Cumulative defaults by vintage",
+        "curve_x_label": "Months since origination",
+        "curve_y_label": "Loans in default",
+        "vintage_legend": "Vintage",
+        "vintage_label": "Roll rates of the vintage:",
+        "vintages": {"all": "All vintages", "2003": "2003", "2004": "2004", "2005": "2005", "2006": "2006",
+                     "2007": "2007", "2008": "2008"},
+        "statuses": {"current": "Current", "dpd30": "30 days", "dpd60": "60 days", "dpd90": "90+ days",
+                     "default": "Default", "prepaid": "Prepaid"},
+        "roll_title": "Monthly roll rates",
+        "roll_from_label": "Status this month",
+        "roll_to_label": "Status the next month",
+        "thousands_separator": ",",
+        "performance_count": "{loans} loans followed over {loan_months} loan-months.",
+        "shock_title": "The Payment Shock at the Reset",
+        "shock_md": """
+            Hybrid ARMs charged a low teaser rate for their first two, three or five years. Then the rate reset to
+            an index (6-month LIBOR, which follows the Fed's policy rate) plus the loan's margin, within caps, and
+            the monthly payment was recalculated. A 2/28 taken out in 2005 reset in 2007, after the Fed had raised
+            its rate from 1% to 5.25%: the payment typically jumped by a quarter or more.
+
+            The calculator below resets every ARM of the 2003-2007 vintages of the synthetic pool on its own dates
+            and compares the payment with the borrower's income, inferred from the debt-to-income ratio at
+            origination. A borrower is **pushed past the threshold** when the payment-to-income ratio after a reset
+            goes above it, having been below it at origination. Compare the actual policy path with one where the
+            Fed stops hiking at a lower rate and one where it keeps the rate at 1%. Every loan is followed as if it
+            neither prepaid nor defaulted.
+            """,
+        "shock_product_label": "ARMs:",
+        "shock_products": {"arm_2_28": "2/28 ARM", "arm_3_27": "3/27 ARM", "arm_5_1": "5/1 ARM",
+                           "all": "All ARMs"},
+        "peak_label": "Fed stops hiking at",
+        "threshold_label": "Affordability threshold (payment / income)",
+        "shock_scenarios": {"actual": "Actual fed funds rate", "capped": "Hikes stopped at {peak:.2f}%",
+                            "held": "Held at 1%"},
+        "policy_title": "Policy rate in each scenario",
+        "policy_y_label": "Fed funds rate",
+        "past_threshold_title": "Borrowers pushed past {threshold}% of income",
+        "past_threshold_y_label": "Share of the ARMs",
+        "shock_columns": ["Scenario", "Median payment change at the first reset", "Payment up more than 25%",
+                          "Past {threshold}% at the first reset", "Past {threshold}% by December 2010"],
+        "shock_count": {"pool": "{loans} ARMs sampled from the loan pool.",
+                        "synthetic": "{loans} ARMs drawn with the loan pool generator (the pool file has not been "
+                                     "generated on this server)."},
+    },
+    "impact": {
+        "header": "Global Economic Impacts of the Crisis",
+        "metric_label": "Select an impact metric:",
+        "country_label": "Country",
+        "metrics": {
+            "gdp": "GDP Growth",
+            "unemployment": "Unemployment",
+            "debt": "Public Debt",
+        },
+        "countries": {
+            "US": "USA",
+            "GB": "UK",
+            "JP": "Japan",
+            "DE": "Germany",
+            "FR": "France",
+            "BR": "Brazil",
+            "CN": "China",
+            "IN": "India",
+            "RU": "Russia",
+            "ES": "Spain",
+            "GR": "Greece",
+            "IT": "Italy",
+            "IE": "Ireland",
+        },
+        "gdp": {
+            "series_label": "Year",
+            "value_label": "GDP Growth (%)",
+            "title": "Impact on Economic Growth between 2007-2009",
+            "y_label": "GDP Growth (%)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impact on Economic Growth</h3>
+                <p>The crisis caused a severe global economic contraction:</p>
+                <ul>
+                    <li><strong>Advanced economies:</strong> Were the hardest hit, with severe contractions in 2009.</li>
+                    <li><strong>Russia:</strong> Among emerging economies, suffered the largest contraction due to commodity dependence.</li>
+                    <li><strong>China and India:</strong> Maintained positive growth, although slowed, partly due to large stimulus packages.</li>
+                    <li><strong>Brazil:</strong> Experienced a brief contraction followed by rapid recovery in 2010.</li>
+                </ul>
+                <p>This was the first synchronized global recession since World War II.</p>
+                </div>
+                """,
+        },
+        "unemployment": {
+            "series_label": "Year",
+            "value_label": "Unemployment Rate (%)",
+            "title": "Evolution of Unemployment Rate between 2007-2010",
+            "y_label": "Unemployment Rate (%)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impact on Labor Market</h3>
+                <p>The crisis caused a significant increase in unemployment in many countries:</p>
+                <ul>
+                    <li><strong>USA:</strong> The unemployment rate doubled, rising from 4.6% to over 9%.</li>
+                    <li><strong>Southern Europe:</strong> Spain and Greece suffered the most severe impacts, with unemployment rates reaching nearly 20% in Spain.</li>
+                    <li><strong>Germany:</strong> Experienced less impact due to flexible labor policies (Kurzarbeit) that allowed for hour reductions instead of layoffs.</li>
+                    <li><strong>Slow recovery:</strong> In most countries, unemployment continued to rise even after GDP began to recover (phenomenon known as "jobless recovery").</li>
+                </ul>
+                </div>
+                """,
+        },
+        "debt": {
+            "series_label": "Period",
+            "value_label": "Debt (% of GDP)",
+            "increase_label": "Increase",
+            "title": "Public Debt Increase between 2007-2010 due to Bailouts and Economic Stimulus",
+            "y_label": "Public Debt (% of GDP)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impact on Public Finances</h3>
+                <p>The crisis led to a dramatic increase in public debts due to:</p>
+                <ul>
+                    <li><strong>Bank bailouts:</strong> Governments injected hundreds of billions to save financial institutions.</li>
+                    <li><strong>Fiscal stimulus packages:</strong> Public spending to offset the fall in private demand.</li>
+                    <li><strong>Reduced tax revenues:</strong> Due to economic contraction and rising unemployment.</li>
+                    <li><strong>Ireland:</strong> Recorded the largest relative increase, with its debt more than tripling in three years.</li>
+                    <li><strong>Greece:</strong> The high pre-crisis debt combined with the increase led to the European sovereign debt crisis.</li>
+                </ul>
+                <p>This increase in public debt subsequently led to austerity policies in many countries, especially in Europe.</p>
+                </div>
+                """,
+        },
+    },
+    "securitization": {
+        "header": "Financial Innovations and Securitization",
+        "intro_html": """
+            <div class="info-box">
+            Securitization and complex financial innovations were central elements in the subprime crisis.
+            This diagram illustrates how high-risk mortgage loans were transformed into complex financial
+            products and distributed throughout the global financial system.
+            </div>
+            """,
+        "flow_title": "Securitization Process Flow",
+        "nodes": {
+            "households": "Households",
+            "originating_banks": "Originating Banks",
+            "prime_mortgages": "Prime Mortgages",
+            "subprime_mortgages": "Subprime Mortgages",
+            "investment_banks": "Investment Banks",
+            "spv": "SPV",
+            "siv": "SIV",
+            "mbs": "MBS",
+            "cdo": "CDO",
+            "tranche_aaa": "AAA Tranche",
+            "tranche_bbb": "BBB Tranche",
+            "european_banks": "European Bks",
+            "pension_funds": "Pension Funds",
+            "hedge_funds": "Hedge Funds",
+            "cds": "CDS",
+            "global_system": "Global System",
+        },
+        "edge_labels": {
+            "take_loans": "Take loans",
+            "originate": "Originate",
+            "sell_mortgages": "Sell mortgages",
+            "create": "Create",
+            "off_balance_sheet": "Kept off-balance",
+            "issue": "Issue",
+            "structure": "Structure",
+            "segment_by_risk": "Segment by risk",
+            "buy": "Buy",
+            "default_protection": "Protection against default",
+            "risk_propagation": "Risk propagation",
+            "interconnection": "Interconnection",
+        },
+        "legend": {
+            "participant": "Participants",
+            "bank": "Banks",
+            "asset": "Assets",
+            "investor": "Investors",
+            "risk": "Risk Instruments",
+            "special": "Special Vehicles",
+        },
+        "instruments_title": "Complex Financial Instruments",
+        "instruments_left_md": """
+            ### MBS (Mortgage-Backed Securities)
+            Securities backed by mortgages, which group hundreds or thousands of mortgage loans into a single financial product. Investors who buy MBS receive payments based on the cash flow from the underlying loans.
+
+            ### CDO (Collateralized Debt Obligations)
+            Structured products that group various cash flow-generating assets (including MBS) and divide them into "tranches" with different levels of risk and return. Upper tranches (AAA) had priority in receiving cash flows, while lower ones absorbed the first losses.
+
+            ### CDO² (CDO of CDOs)
+            An additional layer of complexity: CDOs composed of tranches of other CDOs. This re-securitization made it extremely difficult to assess the real risks of the underlying assets.
+            """,
+        "instruments_right_md": """
+            ### CDS (Credit Default Swaps)
+            Insurance contracts that protected against default risk. The buyer paid a periodic premium to the seller, who guaranteed compensation in case of a "credit event" (such as default). They were widely used for speculation, not just for risk protection.
+
+            ### SIV (Structured Investment Vehicles)
+            Entities created by banks to hold assets off-balance sheet. SIVs issued short-term commercial paper to finance the purchase of long-term assets such as MBS, creating a maturity mismatch that proved fatal during the crisis.
+
+            ### SPV (Special Purpose Vehicles)
+            Legal entities created specifically to isolate financial risks. They were fundamental in the securitization process, allowing banks to transfer assets and their associated risks off their balance sheets.
+            """,
+        "simulator_title": "Simulating the Losses of a CDO's Tranches",
+        "simulator_md": """
+            How much of a pool has to default before the AAA tranche loses money? The simulator below draws
+            one million scenarios of a pool of mortgages under the one-factor Gaussian copula, the model the
+            market used to price CDOs. In each scenario the state of the economy moves the default risk of every
+            loan at once; the **correlation** sets how much. The losses of the pool then hit the tranches from the
+            bottom up: the equity tranche first, then the BBB tranche, and the AAA tranche only after both are gone.
+
+            Raise the correlation with the same default probability: the expected loss of the pool does not change,
+            but the losses concentrate in a few bad scenarios, and those are exactly the ones that reach the AAA tranche.
+            """,
+        "pool_size_label": "Loans in the pool",
+        "pd_label": "Default probability of each loan",
+        "recovery_label": "Recovery rate on default",
+        "correlation_label": "Default correlation",
+        "mezzanine_label": "BBB tranche (share of the pool)",
+        "tranches": {"equity": "Equity", "mezzanine": "BBB", "senior": "AAA"},
+        "loss_legend": "{name} ({attachment:.0f}–{detachment:.0f}%): expected loss {expected_loss:.2%}",
+        "loss_x_label": "Loss of the tranche (share of its size)",
+        "loss_y_label": "Probability of a larger loss",
+        "thousands_separator": ",",
+        "simulator_summary": "{scenarios} scenarios. Expected loss of the pool: **{expected_loss:.2%}**. "
+                             "Probability that the AAA tranche loses money: **{senior_hit:.2%}**.",
+        "waterfall_title": "The Cash-Flow Waterfall",
+        "waterfall_md": """
+            The tranches of an MBS are not paid from a loss distribution but month by month, in order of priority.
+            The mortgages pay interest and principal into the SPV; some borrowers prepay (**CPR**, the annual
+            prepayment rate) and some default (**CDR**, the annual default rate), losing the **severity** of their
+            balance. Interest pays the coupons from the AAA tranche down, and the excess spread left over covers
+            the month's losses before reaching the equity. Principal goes either to the most senior tranche still
+            outstanding (**sequential**) or to every tranche in proportion to its size (**pro rata**), and the losses
+            not covered write the tranches down from the bottom up.
+
+            The heatmaps run the whole deal under every pair of prepayment and default rates at once. The X marks
+            the selected scenario, whose monthly principal and totals are shown below them.
+            """,
+        "allocation_label": "Principal allocation:",
+        "allocations": {"sequential": "Sequential", "pro_rata": "Pro rata"},
+        "cpr_label": "Prepayment rate (CPR, annual)",
+        "cdr_label": "Default rate (CDR, annual)",
+        "severity_label": "Loss severity on default",
+        "waterfall_tranches": {"aaa": "AAA", "a": "A", "bbb": "BBB", "equity": "Equity"},
+        "writedown_title": "Write-down of each tranche across {count} scenarios",
+        "writedown_colorbar": "Write-down",
+        "cpr_axis": "CPR (%)",
+        "cdr_axis": "CDR (%)",
+        "principal_title": "Principal paid to each tranche in the selected scenario",
+        "month_axis": "Years",
+        "principal_axis": "Principal (% of the pool)",
+        "waterfall_columns": ["Tranche", "Size", "Coupon", "WAL (years)", "Write-down",
+                              "Interest received (% of the pool)"],
+        "problems_html": """
+            <div class="info-box">
+            <h3>Fundamental Problems of the Securitization Model</h3>
+            <ul>
+                <li><strong>Distorted incentives:</strong> The "originate-to-distribute" model removed the incentive for rigorous credit risk assessment.</li>
+                <li><strong>Opacity and complexity:</strong> Investors couldn't adequately assess the risks of the structured products they were buying.</li>
+                <li><strong>Failures in rating agencies:</strong> Conflicts of interest led to overly optimistic classification of toxic products.</li>
+                <li><strong>Hidden risk concentration:</strong> Banks maintained significant exposure through credit lines and implicit guarantees.</li>
+                <li><strong>Excessive leverage:</strong> Securitization allowed institutions to circumvent capital requirements and dramatically increase their leverage.</li>
+            </ul>
+            </div>
+            """,
+    },
+    "regulation": {
+        "header": "Regulatory Responses to the Crisis",
+        "intro_html": """
+            <div class="info-box">
+            After the crisis, governments and regulators implemented a series of reforms to correct the flaws
+            revealed by the crisis and strengthen the financial system. The tables below summarize the main
+            measures by region.
+            </div>
+            """,
+        "region_label": "Select a region:",
+        "regions": {
+            "us": "United States",
+            "eu": "European Union",
+            "intl": "International (Basel)",
+        },
+        "measures_md": {
+            "us": """
+                ## Main Regulatory Measures in the United States
+
+                | Measure | Year | Main Objectives | Impacts |
+                |--------|-----|----------------------|----------|
+                | **Dodd-Frank Act** | 2010 | • Greater supervision of systemically important institutions;  • Creation of the Financial Stability Oversight Council;  • Regulation of OTC derivatives;  • Creation of the Consumer Financial Protection Bureau;  • Volcker Rule (limits proprietary trading) | • Increased capital requirements for banks;  • Greater transparency in the derivatives market;  • Restrictions on speculative activities of banks;  • Enhanced consumer financial protection |
+                | **Stress Tests** | 2009-present | • Assess banks' ability to withstand adverse scenarios;  • Identify systemic vulnerabilities | • Strengthening of banking resilience;  • Greater transparency about risks;  • Basis for additional capital requirements |
+                | **Liquidity Rules** | 2013-2015 | • Liquidity Coverage Ratio (LCR);  • Net Stable Funding Ratio (NSFR) | • Reduced vulnerability to liquidity shocks;  • Less dependence on short-term funding |
+                """,
+            "eu": """
+                ## Main Regulatory Measures in the European Union
+
+                | Measure | Year | Main Objectives | Impacts |
+                |--------|-----|----------------------|----------|
+                | **Banking Union** | 2012-2014 | • Single Supervisory Mechanism (SSM);  • Single Resolution Mechanism (SRM);  • Deposit Guarantee Scheme | • Centralized supervision of the largest European banks;  • Reduction of the bank-sovereign nexus;  • Harmonized bank resolution process |
+                | **CRD IV/CRR** | 2013 | • Implementation of Basel III in Europe;  • More stringent capital requirements;  • Limitation of bank bonuses | • Increase in regulatory capital;  • Introduction of conservation and countercyclical buffers;  • Controls on financial sector remuneration |
+                | **MiFID II/MiFIR** | 2018 | • Greater transparency in financial markets;  • Enhanced investor protection;  • Regulation of high-frequency trading | • Stricter rules for order execution;  • Improvement in price formation;  • Reduction of conflicts of interest |
+                """,
+            "intl": """
+                ## Main International Regulatory Measures (Basel)
+
+                | Measure | Year | Main Objectives | Impacts |
+                |--------|-----|----------------------|----------|
+                | **Basel III** | 2010-2022 | • Increase in the quality and quantity of capital;  • Introduction of countercyclical buffer;  • Limitation of leverage;  • Global liquidity standards | • Tier 1 capital increased from 4% to 6%;  • Introduction of the 3% leverage ratio;  • Enhanced risk management standards;  • More resilient global financial system |
+                | **G-SIBs/D-SIBs** | 2011-2012 | • Identification of global and domestic systemically important banks;  • Additional requirements for critical institutions | • Additional capital for systemically important banks;  • Recovery and resolution plans;  • More intense supervision |
+                | **FSB** | 2009 | • International coordination of financial regulation;  • Monitoring of systemic risks;  • Implementation of G20 reforms | • Greater global regulatory coordination;  • Peer review of national reforms;  • Global standards for financial institutions |
+                """,
+        },
+        "focus_html": {
+            "us": """
+                <div class="info-box">
+                <h3>Focus of the US Approach</h3>
+                <p>The US regulatory response focused primarily on:</p>
+                <ul>
+                    <li>Greater financial consumer protection</li>
+                    <li>Enhanced supervision of systemically important institutions</li>
+                    <li>Greater transparency and regulation of derivatives markets</li>
+                    <li>Limits on bank risk-taking</li>
+                </ul>
+                <p>However, since 2018, some parts of the Dodd-Frank Act have been relaxed, especially for mid-sized banks.</p>
+                </div>
+                """,
+            "eu": """
+                <div class="info-box">
+                <h3>Focus of the European Approach</h3>
+                <p>The EU regulatory response focused primarily on:</p>
+                <ul>
+                    <li>Creation of a supranational institutional architecture for banking supervision</li>
+                    <li>Breaking the vicious circle between banks and sovereign debts</li>
+                    <li>Harmonization of rules across the single market</li>
+                    <li>Stricter control over remuneration in the financial sector</li>
+                </ul>
+                <p>The complete implementation of the Banking Union, however, remains incomplete, with the European Deposit Insurance Scheme still under discussion.</p>
+                </div>
+                """,
+            "intl": """
+                <div class="info-box">
+                <h3>Focus of the International Approach</h3>
+                <p>The international regulatory response focused primarily on:</p>
+                <ul>
+                    <li>Strengthening the resilience of individual banks</li>
+                    <li>Reducing systemic risk in the global banking system</li>
+                    <li>Improving cooperation and coordination among national regulators</li>
+                    <li>Global minimum standards for capital, liquidity, and risk management</li>
+                </ul>
+                <p>Although Basel III represents a significant strengthening compared to previous agreements, its implementation varies across jurisdictions and deadlines have been extended several times.</p>
+                </div>
+                """,
+        },
+        "capital_title": "Evolution of Bank Capital Requirements (SIB & G-SIB Banks)",
+        "basel_agreements": {
+            "basel_1": "Basel I\n(1988)",
+            "basel_2": "Basel II\n(2004)",
+            "basel_3": "Basel III\n(2010)",
+            "basel_3_final": "Basel III\n(Final Implementation)",
+        },
+        "capital_series": {
+            "total": "Total Capital",
+            "tier1": "Tier 1 Capital",
+            "core_tier1": "Core Tier 1 Capital",
+        },
+        "x_label": "Basel Agreement",
+        "y_label": "% of Risk-Weighted Assets",
+        "capital_caption_html": """
+            <div style="font-size: 0.8rem; color: #666; text-align: center; margin-top: -20px;">
+            Evolution of minimum capital requirements across Basel agreements. Basel III requirements include the capital conservation buffer.
+            </div>
+            """,
+        "effectiveness_html": """
+            <div class="info-box">
+            <h3>Effectiveness of Regulatory Reforms</h3>
+            <p>More than a decade after the crisis, debates about the effectiveness of regulatory reforms continue:</p>
+            <ul>
+                <li><strong>Positive points:</strong> Banking system with more capital and liquidity, greater transparency in derivatives markets, better supervision of systemically important institutions.</li>
+                <li><strong>Pending issues:</strong> "Too big to fail" has not been fully resolved, shadow banking continues to grow, regulatory complexity has increased substantially.</li>
+                <li><strong>New challenges:</strong> Fintech, cryptocurrencies, and decentralized finance are creating new potential risks outside the traditional regulatory perimeter.</li>
+            </ul>
+            <p>The COVID-19 crisis in 2020 served as the first major test for the reformed financial system, which demonstrated greater resilience than in 2008, but still with significant support needed from central banks.</p>
+            </div>
+            """,
+    },
+    "lessons": {
+        "header": "Lessons from the Subprime Crisis",
+        "intro_html": """
+            <div class="info-box">
+            The subprime crisis offered valuable lessons about the functioning of financial markets,
+            risk management, financial regulation, and macroeconomic policies. Some of these
+            lessons have been implemented, while others continue to be debated.
+            </div>
+            """,
+        "tabs": [
+            "Market Failures",
+            "Risk Management",
+            "Governance and Supervision",
+            "Economic Perspectives",
+            "Persistent Challenges",
+        ],
+        "tab_html": [
+            """
+                <div class="tab-content">
+                <h3>Asymmetric Information</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Investors relied excessively on rating agencies without understanding complex financial products</li>
+                    <li><strong>Lesson:</strong> Opacity and complexity in financial products can hide systemic risks</li>
+                    <li><strong>Corrective measure:</strong> Greater transparency and mandatory risk disclosure</li>
+                </ul>
+
+                <h3>Distorted Incentives</h3>
+                <ul>
+                    <li><strong>Problem:</strong> "Originate-to-distribute" model removed incentive for proper risk assessment</li>
+                    <li><strong>Lesson:</strong> Compensation and incentive structures should be aligned with long-term stability</li>
+                    <li><strong>Corrective measure:</strong> Risk retention requirements ("skin in the game") for originators</li>
+                </ul>
+
+                <h3>Inadequate Regulation</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Shadow banking system operated with limited supervision</li>
+                    <li><strong>Lesson:</strong> Regulatory arbitrage creates systemic vulnerabilities</li>
+                    <li><strong>Corrective measure:</strong> Comprehensive supervision based on activities, not just entities</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Tail Risk</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Models underestimated extreme events and correlations in times of crisis</li>
+                    <li><strong>Lesson:</strong> "Black swans" occur more frequently than models suggest</li>
+                    <li><strong>Corrective measure:</strong> More rigorous stress tests and consideration of extreme scenarios</li>
+                </ul>
+
+                <h3>Dynamic Correlations</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Diversification failed when correlations between assets increased during the crisis</li>
+                    <li><strong>Lesson:</strong> Benefits of diversification can disappear when most needed</li>
+                    <li><strong>Corrective measure:</strong> Risk models should consider dynamic correlations and not just historical data</li>
+                </ul>
+
+                <h3>Liquidity Risk</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Institutions relied excessively on short-term funding</li>
+                    <li><strong>Lesson:</strong> Maturity mismatch can quickly become fatal in periods of stress</li>
+                    <li><strong>Corrective measure:</strong> Liquidity standards (LCR and NSFR) and enhanced liquidity management</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Systemic View</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Regulators focused on individual institutions, not the system as a whole</li>
+                    <li><strong>Lesson:</strong> Stability of individual institutions does not guarantee systemic stability</li>
+                    <li><strong>Corrective measure:</strong> Creation of macroprudential supervision bodies (e.g., FSOC in the US)</li>
+                </ul>
+
+                <h3>Too Big To Fail</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Institutions too big to fail created moral hazard</li>
+                    <li><strong>Lesson:</strong> The cost of public bailouts is unacceptably high</li>
+                    <li><strong>Corrective measure:</strong> Additional requirements for systemic banks and resolution regimes</li>
+                </ul>
+
+                <h3>International Coordination</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Fragmented response to the global crisis</li>
+                    <li><strong>Lesson:</strong> Financial markets are global, requiring international regulatory coordination</li>
+                    <li><strong>Corrective measure:</strong> Strengthening of the FSB and global implementation of Basel standards</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Asset Bubbles</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Loose monetary policies contributed to the housing bubble</li>
+                    <li><strong>Lesson:</strong> Monetary policy should consider financial stability, not just inflation</li>
+                    <li><strong>Corrective measure:</strong> Macroprudential tools to contain unsustainable credit growth</li>
+                </ul>
+
+                <h3>Slow Recovery</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Post-crisis recovery was prolonged, especially in advanced economies</li>
+                    <li><strong>Lesson:</strong> Financial crises leave lasting economic scars</li>
+                    <li><strong>Corrective measure:</strong> Early and decisive intervention to prevent deepening of the crisis</li>
+                </ul>
+
+                <h3>Inequality</h3>
+                <ul>
+                    <li><strong>Problem:</strong> Crisis costs were disproportionately borne by vulnerable groups</li>
+                    <li><strong>Lesson:</strong> Financial crises can exacerbate economic inequalities</li>
+                    <li><strong>Corrective measure:</strong> Policies that consider distributional impacts of crises and bailouts</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Regulatory Effectiveness</h3>
+                <ul>
+                    <li><strong>Challenge:</strong> Avoiding both excessive regulation and imprudent deregulation</li>
+                    <li><strong>Critical question:</strong> How to calibrate regulation to protect stability without stifling innovation?</li>
+                </ul>
+
+                <h3>Financial Innovation</h3>
+                <ul>
+                    <li><strong>Challenge:</strong> New technologies and products create unknown risks</li>
+                    <li><strong>Critical question:</strong> How to regulate innovations like fintech, cryptocurrencies, and decentralized finance?</li>
+                </ul>
+
+                <h3>Emerging Vulnerabilities</h3>
+                <ul>
+                    <li><strong>Challenge:</strong> Risks migrate to less regulated sectors</li>
+                    <li><strong>Critical question:</strong> How to identify and mitigate new sources of systemic risk?</li>
+                </ul>
+                </div>
+                """,
+        ],
+        "quote_html": """
+            <div style="margin: 2rem 0; padding: 2rem; text-align: center; background-color: #F3F4F6; border-radius: 10px;">
+                <blockquote style="font-size: 1.1rem; font-style: italic; color: #4B5563;">
+                    "History doesn't repeat itself, but it often rhymes."
+                    <br><span style="font-size: 0.9rem;">— Attributed to Mark Twain</span>
+                </blockquote>
+                <p style="margin-top: 1rem;">
+                The most important lesson from the subprime crisis may be the constant need for vigilance and humility.
+                Risks in the financial system continuously evolve, requiring regulators, financial institutions,
+                and market participants to adapt their approaches. Financial stability is never permanent - it is a
+                constantly moving target that requires perpetual attention.
+                </p>
+            </div>
+            """,
+        "resources_title": "Additional Resources for Study",
+        "books_md": """
+            ### Recommended Books
+
+            * **"The Crisis of 2008 and the Economics of Depression"** - Paul Krugman
+            * **"Too Big to Fail"** - Andrew Ross Sorkin
+            * **"The Big Short"** - Michael Lewis
+            * **"Lords of Finance"** - Liaquat Ahamed
+            * **"This Time Is Different"** - Carmen Reinhart and Kenneth Rogoff
+            * **"Crashed: How a Decade of Financial Crises Changed the World"** - Adam Tooze
+            """,
+        "films_md": """
+            ### Documentaries and Movies
+
+            * **"Inside Job"** (2010) - Documentary
+            * **"The Big Short"** (2015) - Movie
+            * **"Margin Call"** (2011) - Movie
+            * **"Too Big to Fail"** (2011) - TV Movie
+            * **"Frontline: Money, Power and Wall Street"** - Documentary series
+            * **"Explained: The 2008 Financial Crisis"** - Netflix
+            """,
+    },
+}
@@ -0,0 +1,998 @@
+# Textos, rótulos e conteúdo da versão em português do aplicativo
+
+CATALOG = {
+    "page_title": "Crise Subprime: Cronologia e Impactos",
+    "title": "Crise Subprime: Cronologia e Impactos Globais",
+    "intro_box_html": """
+        <div class="info-box">
+        Este aplicativo interativo apresenta uma análise detalhada da Crise Subprime de 2008,
+        incluindo sua cronologia, causas, impactos globais e lições aprendidas.
+        Navegue pelas diferentes seções usando o menu lateral.
+        </div>
+        """,
+    "footer_html": """
+        <div class="footer">
+        Desenvolvido como material didático para aulas sobre crises financeiras.<br>
+        © 2025 - Prof. José Américo – Coppead
+        </div>
+        """,
+    "sidebar": {
+        "title": "Navegação",
+        "language_label": "Idioma",
+        "label": "Selecione uma seção:",
+        "search_label": "Buscar no conteúdo",
+        "search_placeholder": "SIV, TARP, Basileia III...",
+        "search_empty": "Nenhum resultado.",
+        "about_md": """
+            **Sobre o aplicativo**
+
+            Este aplicativo foi desenvolvido como material didático para aulas sobre crises financeiras.
+
+            © 2025 - Prof. José Américo – Coppead
+            """,
+    },
+    # Siglas explicadas por uma dica onde quer que apareçam no conteúdo
+    "glossary": {
+        "MBS": "Mortgage-Backed Security: título pago pelas prestações de um conjunto de hipotecas.",
+        "CDO": "Collateralized Debt Obligation: título lastreado em um conjunto de dívidas (muitas "
+               "vezes MBS), dividido em tranches de riscos diferentes.",
+        "CDO²": "CDO ao quadrado: CDO lastreado em tranches de outros CDOs.",
+        "CDS": "Credit Default Swap: contrato que paga ao comprador se um devedor der default, "
+               "em troca de prêmios periódicos.",
+        "SIV": "Structured Investment Vehicle: fundo fora do balanço que comprava títulos de longo "
+               "prazo com financiamento de curto prazo.",
+        "SPV": "Special Purpose Vehicle: entidade jurídica que mantém os ativos securitizados "
+               "separados do banco que os originou.",
+        "LCR": "Liquidity Coverage Ratio (Basileia III): ativos líquidos suficientes para cobrir "
+               "30 dias de saídas em estresse.",
+        "NSFR": "Net Stable Funding Ratio (Basileia III): ativos de longo prazo devem ser financiados "
+                "por fontes estáveis em um horizonte de um ano.",
+        "TAF": "Term Auction Facility: leilões de empréstimos a prazo do Federal Reserve para os "
+               "bancos, criados em dezembro de 2007.",
+        "TARP": "Troubled Asset Relief Program: programa de US$ 700 bilhões de outubro de 2008 para "
+                "comprar ativos problemáticos e recapitalizar bancos.",
+        "QE": "Quantitative Easing: compras de títulos em grande escala por um banco central para "
+              "reduzir as taxas de juros de longo prazo.",
+        "G-SIB": "Global Systemically Important Bank: banco cuja quebra ameaçaria o sistema "
+                 "financeiro global, sujeito a requisitos adicionais de capital.",
+    },
+    "pages": {
+        "intro": "Introdução",
+        "timeline": "Linha do Tempo",
+        "housing": "Bolha Imobiliária",
+        "impact": "Impacto Global",
+        "securitization": "Securitização",
+        "regulation": "Respostas Regulatórias",
+        "lessons": "Lições Aprendidas",
+    },
+    "intro": {
+        "header": "Visão Geral da Crise Subprime",
+        "overview_md": """
+            A crise subprime de 2008 foi a mais severa crise financeira desde a Grande Depressão,
+            causando profundos impactos na economia global e mudando fundamentalmente o sistema
+            financeiro internacional.
+
+            ### O que foi a crise subprime?
+
+            A crise originou-se no mercado imobiliário dos Estados Unidos, centrada nos empréstimos
+            hipotecários de alto risco (subprime) concedidos a tomadores com histórico de crédito
+            questionável. A securitização desses empréstimos em instrumentos financeiros complexos
+            espalhou o risco pelo sistema financeiro global.
+
+            ### Por que estudar esta crise?
+
+            * Revela vulnerabilidades do sistema financeiro moderno
+            * Demonstra como problemas em um setor podem se propagar globalmente
+            * Levou a mudanças fundamentais na regulação financeira
+            * Oferece lições valiosas para prevenir futuras crises
+
+            Explore as diferentes seções deste aplicativo para entender a cronologia, as causas,
+            os impactos e as consequências desta crise histórica.
+            """,
+        "key_facts_md": """
+            ### Fatos-chave
+
+            * **Prejuízo estimado:** Mais de $2 trilhões globalmente
+
+            * **Queda nos mercados:** Principais índices de ações caíram mais de 50%
+
+            * **Resgates governamentais:** Centenas de bilhões de dólares em intervenções
+
+            * **Desemprego nos EUA:** Aumentou de 5% para mais de 10%
+
+            * **Recessão global:** Primeira contração do PIB global desde 1945
+
+            * **Instituições falidas:** Lehman Brothers, Washington Mutual, Bear Stearns e outras
+            """,
+        "explore_html": "<div class=\"info-box\"><strong>Comece a explorar!</strong><br>Utilize o menu de navegação para acessar as diferentes seções do aplicativo.</div>",
+    },
+    "timeline": {
+        "header": "Cronologia da Crise",
+        "period_label": "Selecione um período da linha do tempo:",
+        "periods": [
+            "Antecedentes (2001-2006)",
+            "Primeiros Sinais (2006-2007)",
+            "Eclosão da Crise (2007-2008)",
+            "Auge da Crise (2008)",
+            "Desdobramentos Globais (2008-2010)",
+            "Respostas Políticas (2008-2010)",
+            "Consequências (2010-2015)",
+            "Legado e Transformações (2015-2023)",
+        ],
+        "events": [
+            [
+                {
+                    "date": "2001",
+                    "description": "Após o estouro da bolha das empresas ponto-com, o Federal Reserve reduz as taxas de juros para próximo de zero para estimular a economia.",
+                },
+                {
+                    "date": "2001-2003",
+                    "description": "Baixas taxas de juros estimularam o setor bancário a expandir agressivamente o crédito imobiliário.",
+                },
+                {
+                    "date": "2003-2006",
+                    "description": "Proliferação dos empréstimos subprime (alto risco) e instrumentos financeiros complexos como CDOs (Collateralized Debt Obligations) e MBS (Mortgage-Backed Securities).",
+                },
+                {
+                    "date": "2001-2006",
+                    "description": "Os preços dos imóveis sobem em média 85% nos EUA, criando uma bolha especulativa no mercado imobiliário.",
+                },
+            ],
+            [
+                {
+                    "date": "Meados de 2006",
+                    "description": "Os preços dos imóveis atingem o pico e começam a cair. As taxas de inadimplência em empréstimos subprime começam a subir.",
+                },
+                {
+                    "date": "Fev 2007",
+                    "description": "O banco HSBC anuncia perdas de US$ 10,5 bilhões relacionadas ao mercado subprime.",
+                },
+                {
+                    "date": "Abr 2007",
+                    "description": "New Century Financial, uma das maiores empresas de empréstimos subprime dos EUA, pede falência.",
+                },
+                {
+                    "date": "Jun-Jul 2007",
+                    "description": "As agências de classificação de risco (Moody's, S&P) rebaixam centenas de títulos lastreados em hipotecas subprime.",
+                },
+                {
+                    "date": "Ago 2007",
+                    "description": "BNP Paribas suspende três fundos devido à impossibilidade de avaliação dos ativos subprime. Este evento é frequentemente considerado o início formal da crise.",
+                },
+            ],
+            [
+                {
+                    "date": "Set 2007",
+                    "description": "Northern Rock, banco britânico, sofre corrida bancária e precisa de resgate do Banco da Inglaterra.",
+                },
+                {
+                    "date": "Out 2007",
+                    "description": "UBS e Citigroup anunciam perdas bilionárias relacionadas ao mercado subprime.",
+                },
+                {
+                    "date": "Dez 2007",
+                    "description": "Federal Reserve cria a Term Auction Facility (TAF) para fornecer liquidez ao sistema bancário.",
+                },
+                {
+                    "date": "Jan-Fev 2008",
+                    "description": "Grandes bancos globais anunciam perdas massivas. O Fed corta as taxas de juros agressivamente.",
+                },
+                {
+                    "date": "Mar 2008",
+                    "description": "Bear Stearns, quinto maior banco de investimento dos EUA, é vendido para o JPMorgan Chase com ajuda do Federal Reserve por apenas $10 por ação, totalizando cerca de $1 bilhão, bem abaixo do valor de mercado anterior.",
+                },
+            ],
+            [
+                {
+                    "date": "Set 2008 (dia 7)",
+                    "description": "O governo americano assume o controle das empresas Fannie Mae e Freddie Mac, gigantes do mercado hipotecário.",
+                },
+                {
+                    "date": "Set 2008 (dia 15)",
+                    "description": "Lehman Brothers, quarto maior banco de investimento dos EUA, declara falência. Este é considerado o momento mais dramático da crise.",
+                },
+                {
+                    "date": "Set 2008 (dia 16)",
+                    "description": "A seguradora AIG recebe resgate de $180 bilhões do governo americano. O maior resgate da crise",
+                },
+                {
+                    "date": "Set 2008 (dias 16-20)",
+                    "description": "Pânico nos mercados globais. Congelamento do crédito interbancário. Corridas bancárias em várias instituições.",
+                },
+                {
+                    "date": "Out 2008",
+                    "description": "Congresso americano aprova o TARP (Troubled Asset Relief Program) de $700 bilhões para comprar ativos tóxicos e recapitalizar bancos.",
+                },
+                {
+                    "date": "Nov-Dez 2008",
+                    "description": "Os EUA entram oficialmente em recessão. A taxa de desemprego dispara. Resgates às montadoras americanas.",
+                },
+            ],
+            [
+                {
+                    "date": "Out 2008",
+                    "description": "Islândia: colapso dos três maiores bancos do país, levando à falência virtual da nação.",
+                },
+                {
+                    "date": "Out-Nov 2008",
+                    "description": "Bancos centrais ao redor do mundo coordenam cortes de taxas de juros. FMI resgata países como Hungria, Ucrânia e Paquistão.",
+                },
+                {
+                    "date": "Dez 2008",
+                    "description": "China anuncia pacote de estímulo de $586 bilhões. Japão, Reino Unido e União Europeia lançam seus próprios pacotes.",
+                },
+                {
+                    "date": "Jan-Fev 2009",
+                    "description": "Economia global entra em recessão sincronizada. O PIB global contrai 0,6% em 2009, a primeira contração desde a Segunda Guerra Mundial.",
+                },
+                {
+                    "date": "Fev 2009",
+                    "description": "EUA aprovam o American Recovery and Reinvestment Act de $787 bilhões.",
+                },
+                {
+                    "date": "2009-2010",
+                    "description": "Início da crise da dívida soberana europeia, especialmente na Grécia, Irlanda, Portugal, Espanha e Itália.",
+                },
+            ],
+            [
+                {
+                    "date": "Out 2008",
+                    "description": "G7 se compromete a tomar 'todas as medidas necessárias' para estabilizar o sistema financeiro.",
+                },
+                {
+                    "date": "Nov 2008",
+                    "description": "Primeira cúpula do G20 focada na crise financeira, marcando a ascensão deste grupo como principal fórum econômico global.",
+                },
+                {
+                    "date": "Mar 2009",
+                    "description": "Federal Reserve inicia o primeiro programa de Quantitative Easing (QE), comprando $1,25 trilhão em títulos lastreados em hipotecas.",
+                },
+                {
+                    "date": "Abr 2009",
+                    "description": "G20 compromete-se a fornecer $1,1 trilhão em recursos para combater a crise global.",
+                },
+                {
+                    "date": "Jul 2010",
+                    "description": "Aprovação da Lei Dodd-Frank nos EUA, a maior reforma financeira desde a Grande Depressão.",
+                },
+                {
+                    "date": "Set 2010",
+                    "description": "Acordo de Basileia III estabelece novas regras para capital e liquidez bancária a nível global.",
+                },
+            ],
+            [
+                {
+                    "date": "2010-2012",
+                    "description": "Desaceleração da recuperação econômica global. Persistência de alto desemprego em muitos países desenvolvidos.",
+                },
+                {
+                    "date": "2010-2014",
+                    "description": "Crise da dívida europeia se intensifica, forçando resgates da Grécia, Irlanda, Portugal e intervenção no setor bancário espanhol.",
+                },
+                {
+                    "date": "2011-2013",
+                    "description": "Protestos sociais como Occupy Wall Street e manifestações contra austeridade na Europa refletem o descontentamento popular.",
+                },
+                {
+                    "date": "2012-2014",
+                    "description": "Bancos centrais mantêm políticas monetárias ultrafrouxas. BCE promete fazer 'o que for preciso' para salvar o euro.",
+                },
+                {
+                    "date": "2013-2015",
+                    "description": "Recuperação desigual: EUA se recuperam mais rapidamente, enquanto Europa e Japão enfrentam estagnação prolongada. Economias emergentes desaceleram.",
+                },
+            ],
+            [
+                {
+                    "date": "2015-2018",
+                    "description": "Federal Reserve inicia normalização monetária gradual. Crescimento global moderado mas estável, com desigualdades crescentes.",
+                },
+                {
+                    "date": "2016-2018",
+                    "description": "Ascensão de movimentos políticos populistas e nacionalistas em vários países, parcialmente atribuídos às consequências socioeconômicas da crise.",
+                },
+                {
+                    "date": "2018-2019",
+                    "description": "Revisões e flexibilizações de algumas regulações bancárias implementadas pós-crise, especialmente nos EUA.",
+                },
+                {
+                    "date": "2020-2021",
+                    "description": "Durante a crise da COVID-19, lições da crise de 2008 permitiram respostas mais rápidas e coordenadas de bancos centrais e governos.",
+                },
+                {
+                    "date": "2022-2023",
+                    "description": "Retorno da inflação e aumento das taxas de juros após anos de política monetária expansionista, testando a resiliência do sistema financeiro reformado.",
+                },
+            ],
+        ],
+        "overview_title": "Visão Geral da Linha do Tempo",
+        "table_columns": ["Período", "Fase", "Eventos Chave"],
+        "table_periods": [
+            "2001-2006",
+            "2006-2007",
+            "2007-2008",
+            "2008 (Set)",
+            "2008-2010",
+            "2008-2010",
+            "2010-2015",
+            "2015-2023",
+        ],
+        "phases": [
+            "Formação da Bolha",
+            "Alerta",
+            "Crise Inicial",
+            "Colapso",
+            "Contágio Global",
+            "Intervenção",
+            "Recuperação",
+            "Transformação",
+        ],
+        "table_events": [
+            "Taxas de juros baixas, desregulamentação, expansão de crédito subprime",
+            "Queda nos preços imobiliários, aumento da inadimplência, primeiras falências",
+            "Northern Rock, perdas de grandes bancos, venda do Bear Stearns",
+            "Lehman Brothers quebra, pânico nos mercados, AIG resgatada, TARP aprovado",
+            "Crise na Islândia, pacotes de estímulo globais, recessão sincronizada",
+            "Coordenação do G20, programas de QE, reformas regulatórias",
+            "Crise da dívida europeia, recuperação lenta, juros baixos prolongados",
+            "Normalização monetária, revisão de algumas regulações, lições para a crise da COVID-19",
+        ],
+        "crucial_title": "Eventos Cruciais",
+        "crucial_events": [
+            {
+                "date": "Agosto 2007",
+                "event": "BNP Paribas suspende fundos - Início formal da crise",
+            },
+            {
+                "date": "Março 2008",
+                "event": "Venda emergencial do Bear Stearns para JPMorgan Chase",
+            },
+            {
+                "date": "Setembro 2008",
+                "event": "Falência do Lehman Brothers - Momento mais dramático da crise",
+            },
+            {
+                "date": "Outubro 2008",
+                "event": "Aprovação do TARP ($700 bilhões) para estabilizar o sistema financeiro",
+            },
+            {
+                "date": "Março 2009",
+                "event": "Início do primeiro programa de Quantitative Easing (QE) pelo Federal Reserve",
+            },
+            {
+                "date": "Julho 2010",
+                "event": "Aprovação da Lei Dodd-Frank - Maior reforma financeira desde a Grande Depressão",
+            },
+        ],
+        "chart_title": "Linha do Tempo da Crise Subprime",
+        "chart_events": [
+            "Início do declínio imobiliário",
+            "Falência Lehman Brothers",
+            "Dodd-Frank & Basileia III",
+            "Crise da dívida europeia",
+        ],
+        "x_label": "Ano",
+        "range_label": "Ou filtre os eventos de todos os períodos por data:",
+        "range_format": "MM/YYYY",
+        "range_count": "{count} eventos no intervalo selecionado",
+        "months": [
+            "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+            "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro",
+        ],
+        "mid_year": "Meados de",
+    },
+    "housing": {
+        "header": "Evolução da Bolha Imobiliária nos EUA",
+        "phases": ["Formação da Bolha", "Estouro da Bolha", "Crise e Recuperação Lenta"],
+        "events": ["Pico da bolha", "Crise subprime começa", "Quebra do Lehman Brothers"],
+        "x_label": "Ano",
+        "y_label": "Índice Case-Shiller (2000=100)",
+        "legend_title": "Fase",
+        "hovertemplate": "Ano: %{x}<br>Índice: %{y:.1f}",
+        "anatomy_html": """
+            <div class="info-box">
+            <h3>Anatomia da Bolha Imobiliária</h3>
+            <p>O gráfico acima mostra a evolução do Índice Case-Shiller, que mede os preços de imóveis residenciais em 20 grandes áreas metropolitanas nos EUA. Observe as três fases distintas:</p>
+            <ol>
+                <li><strong>Formação da Bolha (2000-2006):</strong> Preços subiram mais de 100% em apenas 6 anos, impulsionados por taxas de juros baixas, regulação frouxa e inovações financeiras que expandiram o crédito imobiliário.</li>
+                <li><strong>Estouro da Bolha (2006-2008):</strong> Quando as taxas de juros subiram e as taxas de inadimplência aumentaram, os preços começaram a cair, criando um ciclo vicioso de execuções hipotecárias e mais quedas nos preços.</li>
+                <li><strong>Crise e Recuperação Lenta (2008-2012):</strong> Após o colapso do Lehman Brothers, a crise se aprofundou e os preços continuaram caindo, com uma recuperação muito lenta que só começou em 2012.</li>
+            </ol>
+            </div>
+            """,
+        "factors_title": "Fatores que Contribuíram para a Bolha",
+        "factors_md": """
+            - **Política monetária frouxa**: Taxas de juros baixas após a crise das empresas ponto-com
+            - **Política governamental**: Incentivos à expansão da propriedade imobiliária
+            - **Inovação financeira**: Securitização e produtos estruturados complexos
+            - **Regulação inadequada**: Supervisão fraca do mercado de hipotecas
+            - **Incentivos distorcidos**: Originadores de hipotecas sem responsabilidade pelo risco
+            - **Avaliações otimistas**: Expectativa de valorização contínua dos imóveis
+            - **Classificações de risco falhas**: Agências de rating atribuindo AAA a produtos tóxicos
+            """,
+        "subprime_title": "Taxas de Hipotecas Subprime (2000-2008)",
+        "subprime_y_label": "% do Mercado Hipotecário",
+        "subprime_caption_html": """
+            <div style="font-size: 0.8rem; color: #666; text-align: center; margin-top: -15px;">
+            Participação dos empréstimos subprime no mercado hipotecário dos EUA.
+            </div>
+            """,
+        "performance_title": "Como as Safras se Comportaram",
+        "performance_md": """
+            A participação dos empréstimos subprime conta só metade da história: o que importa é como os empréstimos
+            de cada ano (a sua **safra**) foram pagos depois. Os gráficos abaixo acompanham uma carteira sintética de
+            hipotecas, construída para reproduzir a participação do subprime acima, mês a mês até 2010. Cada curva é
+            a parcela dos empréstimos de uma safra que já estava inadimplente em cada mês desde a concessão: quanto
+            mais recente a safra, mais rápido ela se deteriorou, pois as ARMs 2/28 passaram a prestações maiores
+            justamente quando os preços dos imóveis começaram a cair.
+
+            A matriz de **rolagem** mostra, para os empréstimos em cada situação, onde eles estavam um mês depois.
+            Quando os preços caem, menos mutuários em atraso conseguem se regularizar vendendo o imóvel ou
+            refinanciando, e mais deles rolam em direção à inadimplência.
+            """,
+        "performance_missing_md": """
+            *A carteira sintética não foi gerada neste servidor. Para ver as curvas das safras, execute
+            `python -m subprime_app.loanpool` e depois `python -m subprime_app.performance generate`.*
+            """,
+        "product_label": "Produto:",
+        "products": {"all": "Todos os produtos", "fixed": "Taxa fixa, 30 anos", "arm_2_28": "ARM 2/28",
+                     "arm_3_27": "ARM 3/27", "arm_5_1": "ARM 5/1"},
+        "fico_label": "Score FICO:",
+        "fico_bands": {"all": "Todos os scores", "lt580": "Abaixo de 580", "580_619": "580-619",
+                       "620_679": "620-679", "680_739": "680-739", "740_plus": "740 ou mais"},
+        "curve_title": "Inadimplência acumulada por safra",
+        "curve_x_label": "Meses desde a concessão",
+        "curve_y_label": "Empréstimos inadimplentes",
+        "vintage_legend": "Safra",
+        "vintage_label": "Rolagem da safra:",
+        "vintages": {"all": "Todas as safras", "2003": "2003", "2004": "2004", "2005": "2005", "2006": "2006",
+                     "2007": "2007", "2008": "2008"},
+        "statuses": {"current": "Em dia", "dpd30": "30 dias", "dpd60": "60 dias", "dpd90": "90+ dias",
+                     "default": "Inadimplente", "prepaid": "Pré-pago"},
+        "roll_title": "Taxas de rolagem mensais",
+        "roll_from_label": "Situação neste mês",
+        "roll_to_label": "Situação no mês seguinte",
+        "thousands_separator": ".",
+        "performance_count": "{loans} empréstimos acompanhados ao longo de {loan_months} empréstimos-mês.",
+        "shock_title": "O Choque de Prestação no Reajuste",
+        "shock_md": """
+            As ARMs híbridas cobravam uma taxa promocional baixa nos dois, três ou cinco primeiros anos. Depois, a
+            taxa era reajustada para um índice (a LIBOR de 6 meses, que acompanha a taxa básica do Fed) mais a
+            margem do empréstimo, dentro de limites, e a prestação mensal era recalculada. Uma 2/28 contratada em
+            2005 foi reajustada em 2007, depois de o Fed ter elevado sua taxa de 1% para 5,25%: a prestação
+            costumava subir um quarto ou mais.
+
+            A calculadora abaixo reajusta cada ARM das safras de 2003 a 2007 do conjunto sintético em suas próprias
+            datas e compara a prestação com a renda do mutuário, deduzida da relação dívida/renda na concessão. Um
+            mutuário é **empurrado além do limite** quando a relação prestação/renda após um reajuste passa do
+            limite, estando abaixo dele na concessão. Compare a trajetória real dos juros com uma em que o Fed para
+            de subir a taxa num nível mais baixo e outra em que a mantém em 1%. Cada empréstimo é acompanhado como se
+            não fosse pré-pago nem ficasse inadimplente.
+            """,
+        "shock_product_label": "ARMs:",
+        "shock_products": {"arm_2_28": "ARM 2/28", "arm_3_27": "ARM 3/27", "arm_5_1": "ARM 5/1",
+                           "all": "Todas as ARMs"},
+        "peak_label": "Fed para de subir os juros em",
+        "threshold_label": "Limite de comprometimento (prestação / renda)",
+        "shock_scenarios": {"actual": "Fed funds real", "capped": "Altas interrompidas em {peak:.2f}%",
+                            "held": "Mantida em 1%"},
+        "policy_title": "Taxa básica em cada cenário",
+        "policy_y_label": "Taxa dos Fed funds",
+        "past_threshold_title": "Mutuários empurrados além de {threshold}% da renda",
+        "past_threshold_y_label": "Parcela das ARMs",
+        "shock_columns": ["Cenário", "Variação mediana da prestação no primeiro reajuste",
+                          "Prestação mais de 25% maior", "Além de {threshold}% no primeiro reajuste",
+                          "Além de {threshold}% até dezembro de 2010"],
+        "shock_count": {"pool": "{loans} ARMs amostradas do conjunto de empréstimos.",
+                        "synthetic": "{loans} ARMs geradas com o gerador do conjunto de empréstimos (o arquivo do "
+                                     "conjunto não foi gerado neste servidor)."},
+    },
+    "impact": {
+        "header": "Impactos Econômicos Globais da Crise",
+        "metric_label": "Selecione uma métrica de impacto:",
+        "country_label": "País",
+        "metrics": {
+            "gdp": "Crescimento do PIB",
+            "unemployment": "Desemprego",
+            "debt": "Dívida Pública",
+        },
+        "countries": {
+            "US": "EUA",
+            "GB": "Reino Unido",
+            "JP": "Japão",
+            "DE": "Alemanha",
+            "FR": "França",
+            "BR": "Brasil",
+            "CN": "China",
+            "IN": "Índia",
+            "RU": "Rússia",
+            "ES": "Espanha",
+            "GR": "Grécia",
+            "IT": "Itália",
+            "IE": "Irlanda",
+        },
+        "gdp": {
+            "series_label": "Ano",
+            "value_label": "Crescimento do PIB (%)",
+            "title": "Impacto no Crescimento Econômico entre 2007-2009",
+            "y_label": "Crescimento do PIB (%)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impacto no Crescimento Econômico</h3>
+                <p>A crise causou uma forte contração econômica global:</p>
+                <ul>
+                    <li><strong>Economias avançadas:</strong> Foram as mais atingidas, com contrações severas em 2009.</li>
+                    <li><strong>Rússia:</strong> Entre as economias emergentes, sofreu a maior contração devido à dependência de commodities.</li>
+                    <li><strong>China e Índia:</strong> Mantiveram crescimento positivo, embora desacelerado, em parte devido aos grandes pacotes de estímulo.</li>
+                    <li><strong>Brasil:</strong> Experimentou uma breve contração seguida de rápida recuperação em 2010.</li>
+                </ul>
+                <p>Esta foi a primeira recessão global sincronizada desde a Segunda Guerra Mundial.</p>
+                </div>
+                """,
+        },
+        "unemployment": {
+            "series_label": "Ano",
+            "value_label": "Taxa de Desemprego (%)",
+            "title": "Evolução da Taxa de Desemprego entre 2007-2010",
+            "y_label": "Taxa de Desemprego (%)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impacto no Mercado de Trabalho</h3>
+                <p>A crise causou um aumento significativo do desemprego em muitos países:</p>
+                <ul>
+                    <li><strong>EUA:</strong> A taxa de desemprego dobrou, passando de 4,6% para mais de 9%.</li>
+                    <li><strong>Europa do Sul:</strong> Espanha e Grécia sofreram os impactos mais graves, com taxas de desemprego chegando a quase 20% na Espanha.</li>
+                    <li><strong>Alemanha:</strong> Experienciou menor impacto devido a políticas de trabalho flexíveis (Kurzarbeit) que permitiram redução de horas em vez de demissões.</li>
+                    <li><strong>Recuperação lenta:</strong> Na maioria dos países, o desemprego continuou subindo mesmo após o PIB começar a se recuperar (fenômeno conhecido como "jobless recovery").</li>
+                </ul>
+                </div>
+                """,
+        },
+        "debt": {
+            "series_label": "Período",
+            "value_label": "Dívida (% do PIB)",
+            "increase_label": "Aumento",
+            "title": "Aumento da Dívida Pública entre 2007-2010 devido aos Resgates e Estímulos Econômicos",
+            "y_label": "Dívida Pública (% do PIB)",
+            "info_html": """
+                <div class="info-box">
+                <h3>Impacto nas Finanças Públicas</h3>
+                <p>A crise levou a um aumento dramático das dívidas públicas devido a:</p>
+                <ul>
+                    <li><strong>Resgates bancários:</strong> Governos injetaram centenas de bilhões para salvar instituições financeiras.</li>
+                    <li><strong>Pacotes de estímulo fiscal:</strong> Gastos públicos para compensar a queda na demanda privada.</li>
+                    <li><strong>Receitas fiscais reduzidas:</strong> Devido à contração econômica e aumento do desemprego.</li>
+                    <li><strong>Irlanda:</strong> Registrou o maior aumento relativo, com sua dívida mais que triplicando em três anos.</li>
+                    <li><strong>Grécia:</strong> A alta dívida pré-crise combinada com o aumento levou à crise da dívida soberana europeia.</li>
+                </ul>
+                <p>Este aumento da dívida pública levou posteriormente a políticas de austeridade em muitos países, especialmente na Europa.</p>
+                </div>
+                """,
+        },
+    },
+    "securitization": {
+        "header": "Inovações Financeiras e Securitização",
+        "intro_html": """
+            <div class="info-box">
+            A securitização e as inovações financeiras complexas foram elementos centrais na crise subprime.
+            Este diagrama ilustra como os empréstimos imobiliários de alto risco foram transformados em produtos
+            financeiros complexos e distribuídos pelo sistema financeiro global.
+            </div>
+            """,
+        "flow_title": "Fluxo do Processo de Securitização",
+        "nodes": {
+            "households": "Famílias",
+            "originating_banks": "Bcos Originadores",
+            "prime_mortgages": "Hipotecas Prime",
+            "subprime_mortgages": "Hipotecas Subprime",
+            "investment_banks": "Bcos de Investimento",
+            "spv": "SPV",
+            "siv": "SIV",
+            "mbs": "MBS",
+            "cdo": "CDO",
+            "tranche_aaa": "Tranche AAA",
+            "tranche_bbb": "Tranche BBB",
+            "european_banks": "Bcos Europa",
+            "pension_funds": "Fundos de Pensão",
+            "hedge_funds": "Hedge Funds",
+            "cds": "CDS",
+            "global_system": "Sistema Global",
+        },
+        "edge_labels": {
+            "take_loans": "Tomam empréstimos",
+            "originate": "Originam",
+            "sell_mortgages": "Vendem hipotecas",
+            "create": "Criam",
+            "off_balance_sheet": "Mantém fora do balanço",
+            "issue": "Emitem",
+            "structure": "Estruturam",
+            "segment_by_risk": "Segmentam por risco",
+            "buy": "Compram",
+            "default_protection": "Proteção contra default",
+            "risk_propagation": "Propagação do risco",
+            "interconnection": "Interconexão",
+        },
+        "legend": {
+            "participant": "Participantes",
+            "bank": "Bancos",
+            "asset": "Ativos",
+            "investor": "Investidores",
+            "risk": "Instrumentos de Risco",
+            "special": "Veículos Especiais",
+        },
+        "instruments_title": "Instrumentos Financeiros Complexos",
+        "instruments_left_md": """
+            ### MBS (Mortgage-Backed Securities)
+            Títulos lastreados em hipotecas, que agrupam centenas ou milhares de empréstimos imobiliários em um único produto financeiro. Os investidores que compram MBS recebem pagamentos baseados no fluxo de caixa dos empréstimos subjacentes.
+
+            ### CDO (Collateralized Debt Obligations)
+            Produtos estruturados que agrupam diversos ativos geradores de fluxo de caixa (incluindo MBS) e os dividem em "tranches" com diferentes níveis de risco e retorno. As tranches superiores (AAA) tinham prioridade no recebimento dos fluxos de caixa, enquanto as inferiores absorviam as primeiras perdas.
+
+            ### CDO² (CDO de CDOs)
+            Uma camada adicional de complexidade: CDOs compostos por tranches de outros CDOs. Esta resecuritização tornava extremamente difícil avaliar os riscos reais dos ativos subjacentes.
+            """,
+        "instruments_right_md": """
+            ### CDS (Credit Default Swaps)
+            Contratos de seguro que protegiam contra o risco de inadimplência. O comprador pagava um prêmio periódico ao vendedor, que garantia compensação em caso de "evento de crédito" (como default). Foram amplamente utilizados para especular, não apenas para se proteger contra riscos.
+
+            ### SIV (Structured Investment Vehicles)
+            Entidades criadas por bancos para manter ativos fora do balanço. Os SIVs emitiam papel comercial de curto prazo para financiar a compra de ativos de longo prazo como MBS, criando um descasamento de prazos que se mostrou fatal durante a crise.
+
+            ### SPV (Special Purpose Vehicles)
+            Entidades legais criadas especificamente para isolar riscos financeiros. Eram fundamentais no processo de securitização, permitindo que os bancos transferissem ativos e seus riscos associados para fora de seus balanços, já que a consolidação desses ativos não era exigida para efeitos regulatórios.
+            """,
+        "simulator_title": "Simulando as Perdas das Tranches de um CDO",
+        "simulator_md": """
+            Quanto de uma carteira precisa ficar inadimplente para que a tranche AAA perca dinheiro? O simulador
+            abaixo sorteia um milhão de cenários de uma carteira de hipotecas com a cópula gaussiana de um fator,
+            o modelo que o mercado usava para precificar CDOs. Em cada cenário, o estado da economia move o risco de
+            inadimplência de todos os empréstimos ao mesmo tempo; a **correlação** define o quanto. As perdas da
+            carteira atingem então as tranches de baixo para cima: primeiro a tranche de equity, depois a BBB, e a
+            AAA só depois que as duas se esgotam.
+
+            Aumente a correlação mantendo a probabilidade de inadimplência: a perda esperada da carteira não muda,
+            mas as perdas se concentram em poucos cenários ruins, e são justamente esses que chegam à tranche AAA.
+            """,
+        "pool_size_label": "Empréstimos na carteira",
+        "pd_label": "Probabilidade de inadimplência de cada empréstimo",
+        "recovery_label": "Taxa de recuperação na inadimplência",
+        "correlation_label": "Correlação de inadimplência",
+        "mezzanine_label": "Tranche BBB (parcela da carteira)",
+        "tranches": {"equity": "Equity", "mezzanine": "BBB", "senior": "AAA"},
+        "loss_legend": "{name} ({attachment:.0f}–{detachment:.0f}%): perda esperada {expected_loss:.2%}",
+        "loss_x_label": "Perda da tranche (parcela do seu tamanho)",
+        "loss_y_label": "Probabilidade de uma perda maior",
+        "thousands_separator": ".",
+        "simulator_summary": "{scenarios} cenários. Perda esperada da carteira: **{expected_loss:.2%}**. "
+                             "Probabilidade de a tranche AAA perder dinheiro: **{senior_hit:.2%}**.",
+        "waterfall_title": "A Cascata de Pagamentos",
+        "waterfall_md": """
+            As tranches de um MBS não são pagas a partir de uma distribuição de perdas, mas mês a mês, em ordem de
+            prioridade. As hipotecas pagam juros e principal ao SPV; alguns mutuários pagam antecipadamente (**CPR**,
+            a taxa anual de pré-pagamento) e alguns ficam inadimplentes (**CDR**, a taxa anual de inadimplência),
+            perdendo a **severidade** do seu saldo. Os juros pagam os cupons da tranche AAA para baixo, e o excesso
+            de spread que sobra cobre as perdas do mês antes de chegar à equity. O principal vai para a tranche mais
+            sênior ainda em aberto (**sequencial**) ou para todas as tranches na proporção do seu tamanho
+            (**pro rata**), e as perdas não cobertas reduzem as tranches de baixo para cima.
+
+            Os mapas de calor executam a operação inteira sob todos os pares de taxas de pré-pagamento e de
+            inadimplência de uma só vez. O X marca o cenário selecionado, cujo principal mensal e totais aparecem
+            abaixo deles.
+            """,
+        "allocation_label": "Alocação do principal:",
+        "allocations": {"sequential": "Sequencial", "pro_rata": "Pro rata"},
+        "cpr_label": "Taxa de pré-pagamento (CPR, anual)",
+        "cdr_label": "Taxa de inadimplência (CDR, anual)",
+        "severity_label": "Severidade da perda na inadimplência",
+        "waterfall_tranches": {"aaa": "AAA", "a": "A", "bbb": "BBB", "equity": "Equity"},
+        "writedown_title": "Perda de principal de cada tranche em {count} cenários",
+        "writedown_colorbar": "Perda",
+        "cpr_axis": "CPR (%)",
+        "cdr_axis": "CDR (%)",
+        "principal_title": "Principal pago a cada tranche no cenário selecionado",
+        "month_axis": "Anos",
+        "principal_axis": "Principal (% da carteira)",
+        "waterfall_columns": ["Tranche", "Tamanho", "Cupom", "WAL (anos)", "Perda de principal",
+                              "Juros recebidos (% da carteira)"],
+        "problems_html": """
+            <div class="info-box">
+            <h3>Problemas Fundamentais do Modelo de Securitização</h3>
+            <ul>
+                <li><strong>Incentivos distorcidos:</strong> O modelo "originar para distribuir" removeu o incentivo para uma avaliação rigorosa do risco de crédito.</li>
+                <li><strong>Opacidade e complexidade:</strong> Investidores não conseguiam avaliar adequadamente os riscos dos produtos estruturados que compravam.</li>
+                <li><strong>Falhas nas agências de rating:</strong> Conflitos de interesse levaram à classificação excessivamente otimista de produtos tóxicos.</li>
+                <li><strong>Concentração oculta de riscos:</strong> Bancos mantiveram exposição significativa através de linhas de crédito e garantias implícitas.</li>
+                <li><strong>Alavancagem excessiva:</strong> A securitização permitiu que instituições contornassem requisitos de capital e aumentassem drasticamente sua alavancagem.</li>
+            </ul>
+            </div>
+            """,
+    },
+    "regulation": {
+        "header": "Respostas Regulatórias à Crise",
+        "intro_html": """
+            <div class="info-box">
+            Após a crise, governos e reguladores implementaram uma série de reformas para corrigir as falhas
+            reveladas pela crise e fortalecer o sistema financeiro. As tabelas abaixo resumem as principais
+            medidas por região.
+            </div>
+            """,
+        "region_label": "Selecione uma região:",
+        "regions": {
+            "us": "Estados Unidos",
+            "eu": "União Europeia",
+            "intl": "Internacional (Basileia)",
+        },
+        "measures_md": {
+            "us": """
+                ## Principais Medidas Regulatórias nos Estados Unidos
+
+                | Medida | Ano | Objetivos Principais | Impactos |
+                |--------|-----|----------------------|----------|
+                | **Lei Dodd-Frank** | 2010 | • Maior supervisão de instituições sistemicamente importantes;  • Criação do Financial Stability Oversight Council;  • Regulação de derivativos de balcão;  • Criação do Consumer Financial Protection Bureau;  • Regra Volcker (limita proprietary trading) | • Aumento de requisitos de capital para bancos;  • Maior transparência no mercado de derivativos;  • Restrições às atividades especulativas dos bancos;  • Proteção aprimorada ao consumidor financeiro |
+                | **Teste de Estresse** | 2009-atual | • Avaliar capacidade dos bancos de resistir a cenários adversos;  • Identificar vulnerabilidades sistêmicas | • Fortalecimento da resiliência bancária;  • Maior transparência sobre riscos;  • Base para exigências de capital adicionais |
+                | **Regras de Liquidez** | 2013-2015 | • Índice de Cobertura de Liquidez (LCR);  • Índice de Financiamento Estável Líquido (NSFR) | • Redução da vulnerabilidade a choques de liquidez;  • Menor dependência de financiamento de curto prazo |
+                """,
+            "eu": """
+                ## Principais Medidas Regulatórias na União Europeia
+
+                | Medida | Ano | Objetivos Principais | Impactos |
+                |--------|-----|----------------------|----------|
+                | **União Bancária** | 2012-2014 | • Mecanismo Único de Supervisão (SSM);  • Mecanismo Único de Resolução (SRM);  • Sistema de Garantia de Depósitos | • Supervisão centralizada dos maiores bancos europeus;  • Redução do vínculo banco-soberano;  • Processo de resolução bancária harmonizado |
+                | **CRD IV/CRR** | 2013 | • Implementação do Basileia III na Europa;  • Requisitos de capital mais rigorosos;  • Limitação dos bônus bancários | • Aumento do capital regulatório;  • Introdução de buffer de conservação e contracíclico;  • Controles sobre remuneração do setor financeiro |
+                | **MiFID II/MiFIR** | 2018 | • Maior transparência nos mercados financeiros;  • Proteção ao investidor aprimorada;  • Regulação de trading de alta frequência | • Regras mais rígidas de execução de ordens;  • Melhoria na formação de preços;  • Redução de conflitos de interesse |
+                """,
+            "intl": """
+                ## Principais Medidas Regulatórias Internacionais (Basileia)
+
+                | Medida | Ano | Objetivos Principais | Impactos |
+                |--------|-----|----------------------|----------|
+                | **Basileia III** | 2010-2022 | • Aumento na qualidade e quantidade do capital;  • Introdução de buffer contracíclico;  • Limitação da alavancagem;  • Padrões de liquidez globais | • Capital Tier 1 aumentado de 4% para 6%;  • Introdução do índice de alavancagem de 3%;  • Padrões de gestão de risco aprimorados;  • Sistema financeiro global mais resiliente |
+                | **G-SIBs/D-SIBs** | 2011-2012 | • Identificação de bancos sistêmicos globais e domésticos;  • Requisitos adicionais para instituições críticas | • Capital adicional para bancos sistemicamente importantes;  • Planos de recuperação e resolução;  • Supervisão mais intensa |
+                | **FSB** | 2009 | • Coordenação internacional de regulação financeira;  • Monitoramento de riscos sistêmicos;  • Implementação de reformas do G20 | • Maior coordenação regulatória global;  • Revisão por pares das reformas nacionais;  • Padrões globais para instituições financeiras |
+                """,
+        },
+        "focus_html": {
+            "us": """
+                <div class="info-box">
+                <h3>Foco da Abordagem dos EUA</h3>
+                <p>A resposta regulatória dos EUA focou principalmente em:</p>
+                <ul>
+                    <li>Maior proteção ao consumidor financeiro</li>
+                    <li>Supervisão reforçada das instituições sistemicamente importantes</li>
+                    <li>Maior transparência e regulamentação dos mercados de derivativos</li>
+                    <li>Limites à tomada de riscos pelos bancos</li>
+                </ul>
+                <p>Contudo, desde 2018, algumas partes da Lei Dodd-Frank foram relaxadas, especialmente para bancos de médio porte.</p>
+                </div>
+                """,
+            "eu": """
+                <div class="info-box">
+                <h3>Foco da Abordagem Europeia</h3>
+                <p>A resposta regulatória da UE focou principalmente em:</p>
+                <ul>
+                    <li>Criação de uma arquitetura institucional supranacional para supervisão bancária</li>
+                    <li>Quebra do círculo vicioso entre bancos e dívidas soberanas</li>
+                    <li>Harmonização das regras em todo o mercado único</li>
+                    <li>Controle mais rígido sobre a remuneração no setor financeiro</li>
+                </ul>
+                <p>A implementação completa da União Bancária, contudo, permanece incompleta, com o Sistema Europeu de Seguro de Depósitos ainda em discussão.</p>
+                </div>
+                """,
+            "intl": """
+                <div class="info-box">
+                <h3>Foco da Abordagem Internacional</h3>
+                <p>A resposta regulatória internacional focou principalmente em:</p>
+                <ul>
+                    <li>Fortalecimento da resiliência dos bancos individuais</li>
+                    <li>Redução do risco sistêmico no sistema bancário global</li>
+                    <li>Melhoria da cooperação e coordenação entre reguladores nacionais</li>
+                    <li>Padrões mínimos globais para capital, liquidez e gestão de risco</li>
+                </ul>
+                <p>Embora Basileia III represente um fortalecimento significativo em relação aos acordos anteriores, sua implementação varia entre jurisdições e os prazos foram estendidos várias vezes.</p>
+                </div>
+                """,
+        },
+        "capital_title": "Evolução dos Requisitos de Capital Bancário (Bancos Sistemicamente Importantes - SIB)",
+        "basel_agreements": {
+            "basel_1": "Basileia I\n(1988)",
+            "basel_2": "Basileia II\n(2004)",
+            "basel_3": "Basileia III\n(2010)",
+            "basel_3_final": "Basileia III\n(Implementação Final)",
+        },
+        "capital_series": {
+            "total": "Capital Total",
+            "tier1": "Capital Tier 1",
+            "core_tier1": "Capital Core Tier 1",
+        },
+        "x_label": "Acordo de Basileia",
+        "y_label": "% dos Ativos Ponderados pelo Risco",
+        "capital_caption_html": """
+            <div style="font-size: 0.8rem; color: #666; text-align: center; margin-top: -20px;">
+            Evolução dos requisitos mínimos de capital ao longo dos acordos de Basileia. Os requisitos do Basileia III incluem o buffer de conservação de capital.
+            </div>
+            """,
+        "effectiveness_html": """
+            <div class="info-box">
+            <h3>Eficácia das Reformas Regulatórias</h3>
+            <p>Mais de uma década após a crise, os debates sobre a eficácia das reformas regulatórias continuam:</p>
+            <ul>
+                <li><strong>Pontos positivos:</strong> Sistema bancário com mais capital e liquidez, maior transparência nos mercados de derivativos, melhor supervisão de instituições sistemicamente importantes.</li>
+                <li><strong>Questões pendentes:</strong> "Too big to fail" não foi totalmente resolvido, shadow banking continua crescendo, complexidade regulatória aumentou substancialmente.</li>
+                <li><strong>Novos desafios:</strong> Fintech, criptomoedas e finanças descentralizadas estão criando novos riscos potenciais fora do perímetro regulatório tradicional.</li>
+            </ul>
+            <p>A crise da COVID-19 em 2020 serviu como primeiro grande teste para o sistema financeiro reformado, que demonstrou maior resiliência do que em 2008, mas ainda com necessidade de suporte significativo dos bancos centrais.</p>
+            </div>
+            """,
+    },
+    "lessons": {
+        "header": "Lições da Crise Subprime",
+        "intro_html": """
+            <div class="info-box">
+            A crise subprime ofereceu lições valiosas sobre o funcionamento dos mercados financeiros,
+            a gestão de risco, a regulação financeira e as políticas macroeconômicas. Algumas dessas
+            lições foram implementadas, enquanto outras continuam sendo debatidas.
+            </div>
+            """,
+        "tabs": [
+            "Falhas de Mercado",
+            "Gestão de Risco",
+            "Governança e Supervisão",
+            "Perspectivas Econômicas",
+            "Desafios Persistentes",
+        ],
+        "tab_html": [
+            """
+                <div class="tab-content">
+                <h3>Informação Assimétrica</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Investidores confiaram excessivamente nas agências de rating sem entender os produtos financeiros complexos</li>
+                    <li><strong>Lição:</strong> A opacidade e complexidade em produtos financeiros podem esconder riscos sistêmicos</li>
+                    <li><strong>Medida corretiva:</strong> Maior transparência e divulgação obrigatória de riscos</li>
+                </ul>
+
+                <h3>Incentivos Distorcidos</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Modelo "originar para distribuir" removeu incentivo para avaliação adequada de risco</li>
+                    <li><strong>Lição:</strong> Estruturas de compensação e incentivos devem estar alinhados com estabilidade de longo prazo</li>
+                    <li><strong>Medida corretiva:</strong> Requisitos de retenção de risco ("skin in the game") para originadores</li>
+                </ul>
+
+                <h3>Regulação Inadequada</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Sistema bancário paralelo (shadow banking) operava com supervisão limitada</li>
+                    <li><strong>Lição:</strong> Arbitragem regulatória cria vulnerabilidades sistêmicas</li>
+                    <li><strong>Medida corretiva:</strong> Supervisão abrangente baseada em atividades, não apenas em entidades</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Risco de Cauda</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Modelos subestimaram eventos extremos e correlações em tempos de crise</li>
+                    <li><strong>Lição:</strong> "Cisnes negros" ocorrem com mais frequência do que os modelos sugerem</li>
+                    <li><strong>Medida corretiva:</strong> Testes de estresse mais rigorosos e consideração de cenários extremos</li>
+                </ul>
+
+                <h3>Correlações Dinâmicas</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Diversificação falhou quando correlações entre ativos aumentaram durante a crise</li>
+                    <li><strong>Lição:</strong> Benefícios da diversificação podem desaparecer quando mais necessários</li>
+                    <li><strong>Medida corretiva:</strong> Modelos de risco devem considerar correlações dinâmicas e não apenas dados históricos</li>
+                </ul>
+
+                <h3>Risco de Liquidez</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Instituições dependiam excessivamente de financiamento de curto prazo</li>
+                    <li><strong>Lição:</strong> Descasamento de prazos pode rapidamente se tornar fatal em períodos de estresse</li>
+                    <li><strong>Medida corretiva:</strong> Padrões de liquidez (LCR e NSFR) e gestão de liquidez aprimorada</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Visão Sistêmica</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Reguladores focavam em instituições individuais, não no sistema como um todo</li>
+                    <li><strong>Lição:</strong> Estabilidade de instituições individuais não garante estabilidade sistêmica</li>
+                    <li><strong>Medida corretiva:</strong> Criação de órgãos de supervisão macroprudencial (ex: FSOC nos EUA)</li>
+                </ul>
+
+                <h3>Too Big To Fail</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Instituições grandes demais para quebrar criaram risco moral</li>
+                    <li><strong>Lição:</strong> O custo de resgates públicos é inaceitavelmente alto</li>
+                    <li><strong>Medida corretiva:</strong> Requisitos adicionais para bancos sistêmicos e regimes de resolução</li>
+                </ul>
+
+                <h3>Coordenação Internacional</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Resposta fragmentada à crise global</li>
+                    <li><strong>Lição:</strong> Mercados financeiros são globais, exigindo coordenação regulatória internacional</li>
+                    <li><strong>Medida corretiva:</strong> Fortalecimento do FSB e implementação global de padrões de Basileia</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Bolhas de Ativos</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Políticas monetárias frouxas contribuíram para a bolha imobiliária</li>
+                    <li><strong>Lição:</strong> Política monetária deve considerar estabilidade financeira, não apenas inflação</li>
+                    <li><strong>Medida corretiva:</strong> Ferramentas macroprudenciais para conter crescimento insustentável de crédito</li>
+                </ul>
+
+                <h3>Recuperação Lenta</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Recuperação pós-crise foi prolongada, especialmente em economias avançadas</li>
+                    <li><strong>Lição:</strong> Crises financeiras deixam cicatrizes econômicas duradouras</li>
+                    <li><strong>Medida corretiva:</strong> Intervenção antecipada e decisiva para evitar aprofundamento da crise</li>
+                </ul>
+
+                <h3>Desigualdade</h3>
+                <ul>
+                    <li><strong>Problema:</strong> Custos da crise foram desproporcionalmente suportados por grupos vulneráveis</li>
+                    <li><strong>Lição:</strong> Crises financeiras podem exacerbar desigualdades econômicas</li>
+                    <li><strong>Medida corretiva:</strong> Políticas que consideram impactos distributivos de crises e resgates</li>
+                </ul>
+                </div>
+                """,
+            """
+                <div class="tab-content">
+                <h3>Eficácia Regulatória</h3>
+                <ul>
+                    <li><strong>Desafio:</strong> Evitar tanto a regulação excessiva quanto a desregulamentação imprudente</li>
+                    <li><strong>Questão crítica:</strong> Como calibrar regulação para proteger estabilidade sem sufocar inovação?</li>
+                </ul>
+
+                <h3>Inovação Financeira</h3>
+                <ul>
+                    <li><strong>Desafio:</strong> Novas tecnologias e produtos criam riscos desconhecidos</li>
+                    <li><strong>Questão crítica:</strong> Como regular inovações como fintech, criptomoedas e finanças descentralizadas?</li>
+                </ul>
+
+                <h3>Vulnerabilidades Emergentes</h3>
+                <ul>
+                    <li><strong>Desafio:</strong> Riscos migram para setores menos regulados</li>
+                    <li><strong>Questão crítica:</strong> Como identificar e mitigar novas fontes de risco sistêmico?</li>
+                </ul>
+                </div>
+                """,
+        ],
+        "quote_html": """
+            <div style="margin: 2rem 0; padding: 2rem; text-align: center; background-color: #F3F4F6; border-radius: 10px;">
+                <blockquote style="font-size: 1.1rem; font-style: italic; color: #4B5563;">
+                    "A história não se repete, mas frequentemente rima."
+                    <br><span style="font-size: 0.9rem;">— Atribuído a Mark Twain</span>
+                </blockquote>
+                <p style="margin-top: 1rem;">
+                A lição mais importante da crise subprime talvez seja a necessidade constante de vigilância e humildade.
+                Os riscos no sistema financeiro evoluem continuamente, exigindo que reguladores, instituições financeiras
+                e participantes do mercado adaptem suas abordagens. A estabilidade financeira nunca é permanente - é um
+                objetivo em constante movimento que requer atenção perpétua.
+                </p>
+            </div>
+            """,
+        "resources_title": "Recursos Adicionais para Estudo",
+        "books_md": """
+            ### Livros Recomendados
+
+            * **"A Crise de 2008 e a Economia da Depressão"** - Paul Krugman
+            * **"Too Big to Fail"** - Andrew Ross Sorkin
+            * **"The Big Short"** - Michael Lewis
+            * **"Lords of Finance"** - Liaquat Ahamed
+            * **"This Time Is Different"** - Carmen Reinhart e Kenneth Rogoff
+            * **"Crashed: How a Decade of Financial Crises Changed the World"** - Adam Tooze
+            """,
+        "films_md": """
+            ### Documentários e Filmes
+
+            * **"Inside Job"** (2010) - Documentário
+            * **"The Big Short"** (2015) - Filme
+            * **"Margin Call"** (2011) - Filme
+            * **"Too Big to Fail"** (2011) - Filme para TV
+            * **"Frontline: Money, Power and Wall Street"** - Série documental
+            * **"Explained: The 2008 Financial Crisis"** - Netflix
+            """,
+    },
+}
@@ -0,0 +1,822 @@
+# Page renderers. Each one receives its section of the compiled locale catalog
+# (subprime_app.content, where every text block is final HTML) and builds the
+# page from the language-independent settings in subprime_app.data and the
+# datasets in subprime_app.datastore.
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from subprime_app import data, datastore
+from subprime_app.copula import exceedance, simulate
+from subprime_app.figure_cache import plotly_chart
+from subprime_app.instrumentation import fragment, stage
+from subprime_app.lazy_imports import lazy_import
+from subprime_app.timeline_store import gantt_figure, load_timeline
+from subprime_app.waterfall import Deal, Tranche, cash_flows, scenario_grid
+
+px = lazy_import("plotly.express")
+subplots = lazy_import("plotly.subplots")
+performance = lazy_import("subprime_app.performance")
+payment_shock = lazy_import("subprime_app.payment_shock")
+
+
+def sub_header(text):
+    st.markdown(f'<div class="sub-header">{text}</div>', unsafe_allow_html=True)
+
+
+def chart_title(text):
+    st.markdown(f'<div class="chart-title">{text}</div>', unsafe_allow_html=True)
+
+
+def choose(widget, label, labels, **kwargs):
+    # Shows the translated labels and returns the id of the chosen one, so the
+    # pages never depend on the text of the selected option
+    ids = list(labels)
+    choice = widget(label, [labels[i] for i in ids], **kwargs)
+    return ids[[labels[i] for i in ids].index(choice)]
+
+
+def intro(text):
+    sub_header(text["header"])
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(text["overview_html"], unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(text["key_facts_html"], unsafe_allow_html=True)
+
+        st.markdown(text["explore_html"], unsafe_allow_html=True)
+
+
+# Selector-driven sections are fragments: changing the selector reruns and
+# re-sends only the fragment, not the header, sidebar, CSS or the rest of the page
+@fragment
+def period_events(text):
+    selected = choose(st.selectbox, text["period_label"], dict(enumerate(text["periods"])), key="timeline_period")
+
+    # Banner and events of the selected period
+    for block in text["period_html"][selected]:
+        st.markdown(block, unsafe_allow_html=True)
+
+
+@fragment
+def events_in_range(text):
+    store = load_timeline(st.session_state["locale"])
+    start, end = st.slider(text["range_label"], min_value=store.index.first_date, max_value=store.index.last_date,
+                           value=data.TIMELINE_RANGE_DEFAULT, format=text["range_format"], key="timeline_range")
+
+    # Events of every period that overlap the range, from the interval index
+    positions = store.events_between(start, end)
+    st.markdown(text["range_count"].format(count=len(positions)))
+    if positions:
+        st.markdown("\n".join(text["event_html"][position] for position in positions), unsafe_allow_html=True)
+
+
+def timeline(text):
+    sub_header(text["header"])
+
+    period_events(text)
+
+    events_in_range(text)
+
+    # Simplified visual timeline
+    chart_title(text["overview_title"])
+
+    # Timeline table with one color per phase
+    st.markdown(text["table_html"], unsafe_allow_html=True)
+
+    # Key events as a list
+    chart_title(text["crucial_title"])
+
+    for block in text["crucial_html"]:
+        st.markdown(block, unsafe_allow_html=True)
+
+    # Gantt chart of the phases
+    store = load_timeline(st.session_state["locale"])
+    plotly_chart("timeline", "gantt", lambda: gantt_figure(store, text["chart_title"], text["x_label"]),
+                 use_container_width=True)
+
+
+def case_shiller_figure(text):
+    with stage("data"):
+        case_shiller = datastore.load_frame("case_shiller")
+
+        # Phase of each observation, on a new frame: the dataset is shared and read-only
+        bubble_end, burst_end = data.HOUSING_PHASE_ENDS
+        conditions = [
+            (case_shiller['date'] <= bubble_end),
+            (case_shiller['date'] > bubble_end) & (case_shiller['date'] <= burst_end),
+            (case_shiller['date'] > burst_end)
+        ]
+        phases = text["phases"]
+        df_housing = case_shiller.assign(phase=np.select(conditions, phases))
+
+    fig = px.line(df_housing, x='date', y='index', title='')
+
+    # Shaded areas for the phases
+    for phase, color in zip(phases, data.HOUSING_PHASE_COLORS):
+        phase_data = df_housing[df_housing['phase'] == phase]
+        if not phase_data.empty:
+            fig.add_shape(
+                type="rect",
+                x0=phase_data['date'].min(),
+                x1=phase_data['date'].max(),
+                y0=df_housing['index'].min() * 0.95,
+                y1=df_housing['index'].max() * 1.05,
+                fillcolor=color,
+                opacity=0.8,
+                layer="below",
+                line_width=0,
+            )
+
+    # Vertical lines and annotations for the key events
+    for (date, value), label in zip(data.HOUSING_EVENTS, text["events"]):
+        fig.add_vline(x=date, line_dash="dash", line_color="red", line_width=1)
+        fig.add_annotation(x=date, y=value, text=label, showarrow=True, arrowhead=1, ax=0, ay=-40)
+
+    fig.update_layout(
+        xaxis_title=text["x_label"],
+        yaxis_title=text["y_label"],
+        height=600,
+        hovermode="x unified",
+        legend_title=text["legend_title"],
+        xaxis=dict(
+            tickmode='array',
+            tickvals=data.HOUSING_TICKS,
+            ticktext=[str(tick) for tick in data.HOUSING_TICKS]
+        ),
+        shapes=[
+            # Horizontal line at the 2000 level
+            dict(
+                type="line",
+                x0=2000,
+                x1=2012.5,
+                y0=100,
+                y1=100,
+                line=dict(color="gray", width=1, dash="dot"),
+            )
+        ]
+    )
+
+    fig.update_traces(line=dict(color='#FF5722', width=3), hovertemplate=text["hovertemplate"])
+
+    return fig
+
+
+def subprime_figure(text):
+    subprime = datastore.load_frame("subprime_share")
+    fig_subprime = px.bar(
+        x=subprime['year'],
+        y=subprime['share'],
+        labels={'x': text["x_label"], 'y': text["subprime_y_label"]},
+        title=''
+    )
+
+    fig_subprime.update_traces(marker_color=data.SUBPRIME_COLORS)
+
+    fig_subprime.update_layout(
+        height=300,
+        xaxis_title=text["x_label"],
+        yaxis_title=text["subprime_y_label"],
+        hovermode="x"
+    )
+
+    return fig_subprime
+
+
+def default_curve_figure(text, results):
+    fig = go.Figure()
+    curves = results.default_curves()
+
+    # Share of each vintage's loans in default by months since origination
+    for vintage, curve, color in zip(results.vintages, curves, data.PERFORMANCE_VINTAGE_COLORS):
+        observed = ~np.isnan(curve)
+        fig.add_trace(go.Scatter(
+            x=np.flatnonzero(observed),
+            y=np.round(curve[observed] * 100, 3),
+            mode="lines",
+            name=str(vintage),
+            line=dict(color=color, width=2),
+            hovertemplate="%{x}: %{y:.2f}%<extra>" + str(vintage) + "</extra>"
+        ))
+
+    fig.update_layout(
+        title=text["curve_title"],
+        xaxis=dict(title=text["curve_x_label"]),
+        yaxis=dict(title=text["curve_y_label"], ticksuffix="%"),
+        legend_title=text["vintage_legend"],
+        height=450
+    )
+
+    return fig
+
+
+def roll_rate_figure(text, results, vintage):
+    rates = results.roll_rates(None if vintage == "all" else int(vintage)) * 100
+    statuses = [text["statuses"][status] for status in data.PERFORMANCE_STATUSES]
+
+    fig = go.Figure(go.Heatmap(
+        x=statuses,
+        y=statuses[:len(rates)],
+        z=np.round(rates, 2),
+        zmin=0, zmax=100,
+        colorscale="Blues",
+        texttemplate="%{z:.1f}%",
+        colorbar=dict(ticksuffix="%"),
+        hovertemplate="%{y} → %{x}: %{z:.2f}%<extra></extra>"
+    ))
+
+    fig.update_layout(
+        title=text["roll_title"],
+        xaxis=dict(title=text["roll_to_label"], side="top"),
+        yaxis=dict(title=text["roll_from_label"], autorange="reversed"),
+        height=400
+    )
+
+    return fig
+
+
+@fragment
+def vintage_performance(text):
+    # The loan-month table is generated offline (subprime_app/performance.py)
+    if not os.path.exists(performance.PERFORMANCE_PATH):
+        st.markdown(text["performance_missing_html"], unsafe_allow_html=True)
+        return
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        product = choose(st.selectbox, text["product_label"], text["products"], key="performance_product")
+
+    with col2:
+        fico_band = choose(st.selectbox, text["fico_label"], text["fico_bands"], key="performance_fico")
+
+    # One pass over the table per filter, then cached
+    with stage("data"):
+        results = performance.load_performance(None if product == "all" else product,
+                                               None if fico_band == "all" else fico_band)
+
+    with stage("figure"):
+        st.plotly_chart(default_curve_figure(text, results), use_container_width=True)
+
+    vintage = choose(st.selectbox, text["vintage_label"], text["vintages"], key="performance_vintage")
+
+    with stage("figure"):
+        st.plotly_chart(roll_rate_figure(text, results, vintage), use_container_width=True)
+
+    loans = f"{results.loans.sum():,}".replace(",", text["thousands_separator"])
+    loan_months = f"{results.loan_months:,}".replace(",", text["thousands_separator"])
+    st.markdown(text["performance_count"].format(loans=loans, loan_months=loan_months))
+
+
+def shock_scenarios(peak):
+    # (name, peak) of the policy-rate scenarios compared side by side
+    return (("actual", None), ("capped", round(peak / 100, 4)), ("held", 0.01))
+
+
+def shock_months():
+    # Months shown by the payment-shock charts, from January of the first vintage
+    first = (data.PAYMENT_SHOCK_VINTAGES[0] - 2000) * 12
+    months = pd.date_range("2000-01-01", periods=len(payment_shock.policy_rates()), freq="MS")
+    return first, months[first:]
+
+
+def policy_rate_figure(text, scenarios):
+    fig = go.Figure()
+    first, months = shock_months()
+
+    for name, peak in scenarios:
+        path = payment_shock.policy_rates() if peak is None else payment_shock.capped_path(peak)
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=np.round(path[first:] * 100, 3),
+            mode="lines",
+            name=text["shock_scenarios"][name].format(peak=(peak or 0) * 100),
+            line=dict(shape="hv", width=2, color=data.PAYMENT_SHOCK_COLORS[name]),
+            hovertemplate="%{x|%b %Y}: %{y:.2f}%<extra></extra>"
+        ))
+
+    fig.update_layout(
+        title=text["policy_title"],
+        yaxis=dict(title=text["policy_y_label"], ticksuffix="%"),
+        legend=dict(orientation="h", y=-0.15),
+        height=400
+    )
+
+    return fig
+
+
+def past_threshold_figure(text, results, scenarios, threshold):
+    fig = go.Figure()
+    first, months = shock_months()
+    shares = results.past_threshold(threshold / 100)
+
+    # Share of the borrowers pushed past the threshold by each month
+    for (name, peak), share in zip(scenarios, shares):
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=np.round(share[first:] * 100, 2),
+            mode="lines",
+            name=text["shock_scenarios"][name].format(peak=(peak or 0) * 100),
+            line=dict(width=2, color=data.PAYMENT_SHOCK_COLORS[name]),
+            hovertemplate="%{x|%b %Y}: %{y:.1f}%<extra></extra>"
+        ))
+
+    fig.update_layout(
+        title=text["past_threshold_title"].format(threshold=threshold),
+        yaxis=dict(title=text["past_threshold_y_label"], ticksuffix="%", rangemode="tozero"),
+        legend=dict(orientation="h", y=-0.15),
+        height=400
+    )
+
+    return fig
+
+
+def shock_table(text, results, scenarios, threshold):
+    # Payment shock and borrowers pushed past the threshold in each scenario
+    summary = results.summary(threshold / 100)
+    columns = [column.format(threshold=threshold) for column in text["shock_columns"]]
+    rows = ["| " + " | ".join(columns) + " |", "|" + " --- |" * len(columns)]
+    for index, (name, peak) in enumerate(scenarios):
+        rows.append(f"| {text['shock_scenarios'][name].format(peak=(peak or 0) * 100)} | "
+                    f"{summary['median_shock'][index]:+.1%} | {summary['large_shock'][index]:.1%} | "
+                    f"{summary['first_reset'][index]:.1%} | {summary['by_end'][index]:.1%} |")
+    return "\n".join(rows)
+
+
+@fragment
+def reset_shock(text):
+    defaults = data.PAYMENT_SHOCK_DEFAULTS
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        product = choose(st.selectbox, text["shock_product_label"], text["shock_products"], key="shock_product")
+
+    with col2:
+        peak = st.slider(text["peak_label"], 1.0, 5.25, defaults["peak"], step=0.25, format="%.2f%%",
+                         key="shock_peak")
+
+    with col3:
+        first, last, step = data.PAYMENT_SHOCK_THRESHOLDS
+        threshold = st.slider(text["threshold_label"], first, last, defaults["threshold"], step=step, format="%d%%",
+                              key="shock_threshold")
+
+    # The three scenarios run in one vectorized pass, memoized by peak and
+    # product with the counts for every threshold; moving the threshold only
+    # picks other counts
+    scenarios = shock_scenarios(peak)
+    with stage("data"):
+        results = payment_shock.payment_shock(scenarios, None if product == "all" else product)
+
+    col1, col2 = st.columns(2)
+
+    with col1, stage("figure"):
+        st.plotly_chart(policy_rate_figure(text, scenarios), use_container_width=True)
+
+    with col2, stage("figure"):
+        st.plotly_chart(past_threshold_figure(text, results, scenarios, threshold), use_container_width=True)
+
+    st.markdown(shock_table(text, results, scenarios, threshold))
+
+    loans = f"{results.loans:,}".replace(",", text["thousands_separator"])
+    st.markdown(text["shock_count"]["synthetic" if results.synthetic else "pool"].format(loans=loans))
+
+
+def housing(text):
+    sub_header(text["header"])
+
+    plotly_chart("housing", "case_shiller", lambda: case_shiller_figure(text), use_container_width=True)
+
+    st.markdown(text["anatomy_html"], unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        chart_title(text["factors_title"])
+        st.markdown(text["factors_html"], unsafe_allow_html=True)
+
+    with col2:
+        chart_title(text["subprime_title"])
+
+        plotly_chart("housing", "subprime_share", lambda: subprime_figure(text), use_container_width=True)
+
+        st.markdown(text["subprime_caption_html"], unsafe_allow_html=True)
+
+    # Default curves and roll rates of the synthetic loan pool
+    sub_header(text["performance_title"])
+
+    st.markdown(text["performance_html"], unsafe_allow_html=True)
+
+    vintage_performance(text)
+
+    # Payment shock of the ARMs at their resets under policy-rate scenarios
+    sub_header(text["shock_title"])
+
+    st.markdown(text["shock_html"], unsafe_allow_html=True)
+
+    reset_shock(text)
+
+
+def impact_figure(text, metric):
+    labels = text[metric]
+
+    with stage("data"):
+        # Country names and column labels of the selected locale
+        dataset = datastore.load_frame(data.IMPACT_DATASETS[metric])
+        columns = {'country': text["country_label"], 'increase': labels.get("increase_label")}
+        df = dataset.assign(country=dataset['country'].map(text["countries"])).rename(columns=columns)
+        colors = {columns.get(key, key): color for key, color in data.IMPACT_COLORS[metric].items()}
+
+        # Long format for Plotly
+        df_long = pd.melt(df, id_vars=[text["country_label"]], var_name=labels["series_label"],
+                          value_name=labels["value_label"])
+
+    fig = px.bar(
+        df_long,
+        x=text["country_label"],
+        y=labels["value_label"],
+        color=labels["series_label"],
+        barmode='group',
+        color_discrete_map=colors,
+        title=labels["title"],
+        height=600
+    )
+
+    fig.update_layout(xaxis_title="", yaxis_title=labels["y_label"])
+
+    return fig
+
+
+@fragment
+def impact_chart(text):
+    metric = choose(st.radio, text["metric_label"], text["metrics"], horizontal=True, key="impact_metric")
+
+    plotly_chart("impact", metric, lambda: impact_figure(text, metric), use_container_width=True)
+
+    st.markdown(text[metric]["info_html"], unsafe_allow_html=True)
+
+
+def impact(text):
+    sub_header(text["header"])
+
+    impact_chart(text)
+
+
+def securitization_figure(text):
+    names = text["nodes"]
+    positions = {node: attrs["pos"] for node, attrs in data.SECURITIZATION_NODES.items()}
+
+    fig = go.Figure()
+
+    # Edges: one arrow per edge, stopping at the border of the nodes
+    for u, v, _ in data.SECURITIZATION_EDGES:
+        (x0, y0), (x1, y1) = positions[u], positions[v]
+        fig.add_annotation(
+            x=x1, y=y1, ax=x0, ay=y0,
+            xref="x", yref="y", axref="x", ayref="y",
+            showarrow=True, arrowhead=2, arrowsize=1.2, arrowwidth=1, arrowcolor="gray",
+            standoff=24, startstandoff=24, text=""
+        )
+
+    # Edge labels at the middle of each edge, with the flow on hover
+    labelled = [(u, v, label) for u, v, label in data.SECURITIZATION_EDGES if label]
+    fig.add_trace(go.Scatter(
+        x=[(positions[u][0] + positions[v][0]) / 2 for u, v, _ in labelled],
+        y=[(positions[u][1] + positions[v][1]) / 2 for u, v, _ in labelled],
+        mode="text",
+        text=[text["edge_labels"][label] for _, _, label in labelled],
+        textfont=dict(size=10, color="#555555"),
+        hovertext=[f"{names[u]} → {names[v]}" for u, v, _ in labelled],
+        hoverinfo="text",
+        showlegend=False
+    ))
+
+    # Nodes, one trace per type so the legend names the types
+    for node_type, label in text["legend"].items():
+        nodes = [node for node, attrs in data.SECURITIZATION_NODES.items() if attrs["type"] == node_type]
+        fig.add_trace(go.Scatter(
+            x=[positions[node][0] for node in nodes],
+            y=[positions[node][1] for node in nodes],
+            mode="markers+text",
+            name=label,
+            text=[names[node] for node in nodes],
+            textfont=dict(size=11),
+            hovertemplate="%{text}<extra>" + label + "</extra>",
+            marker=dict(size=44, color=data.SECURITIZATION_NODE_COLORS[node_type], opacity=0.8,
+                        line=dict(color="gray", width=1))
+        ))
+
+    fig.update_layout(
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        legend=dict(x=1, y=0, xanchor="right", yanchor="bottom"),
+        hovermode="closest",
+        margin=dict(l=10, r=10, t=10, b=10),
+        height=600
+    )
+
+    return fig
+
+
+def tranche_loss_figure(text, simulation):
+    fig = go.Figure()
+
+    # Probability that each tranche loses more than a given share of its size
+    for name, tranche in zip(data.CDO_TRANCHE_COLORS, simulation.tranches):
+        losses, probabilities = exceedance(tranche.losses, simulation.defaults)
+        shown = probabilities > 0
+        fig.add_trace(go.Scatter(
+            x=losses[shown] * 100,
+            y=probabilities[shown],
+            mode="lines",
+            line=dict(shape="hv", width=2, color=data.CDO_TRANCHE_COLORS[name]),
+            name=text["loss_legend"].format(name=text["tranches"][name], attachment=tranche.attachment * 100,
+                                            detachment=tranche.detachment * 100,
+                                            expected_loss=tranche.expected_loss),
+            hovertemplate="%{x:.1f}%: %{y:.3%}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        xaxis=dict(title=text["loss_x_label"], range=[0, 100], ticksuffix="%"),
+        yaxis=dict(title=text["loss_y_label"], type="log", exponentformat="power"),
+        legend=dict(x=1, y=1, xanchor="right", yanchor="top"),
+        height=450
+    )
+
+    return fig
+
+
+@fragment
+def tranche_losses(text):
+    defaults = data.CDO_DEFAULTS
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        pool_size = st.slider(text["pool_size_label"], 25, 500, defaults["pool_size"], step=25, key="cdo_pool_size")
+        pd_percent = st.slider(text["pd_label"], 0.5, 30.0, defaults["pd"], step=0.5, format="%.1f%%", key="cdo_pd")
+        recovery = st.slider(text["recovery_label"], 0, 90, defaults["recovery"], step=5, format="%d%%",
+                             key="cdo_recovery")
+
+    with col2:
+        correlation = st.slider(text["correlation_label"], 0.0, 0.9, defaults["correlation"], step=0.05,
+                                key="cdo_correlation")
+        attachment, detachment = st.slider(text["mezzanine_label"], 1, 30, defaults["mezzanine"], format="%d%%",
+                                           key="cdo_mezzanine")
+
+    # Both ends of the slider on the same value still leave a 1% BBB tranche
+    detachment = max(detachment, attachment + 1)
+
+    # Memoized by parameter set: moving a slider back is instant. The figure
+    # is not cached by figure_cache, whose entries never expire
+    tranches = ((0.0, attachment / 100), (attachment / 100, detachment / 100), (detachment / 100, 1.0))
+    with stage("data"):
+        simulation = simulate(pool_size, round(pd_percent / 100, 4), recovery / 100, round(correlation, 2), tranches)
+
+    with stage("figure"):
+        st.plotly_chart(tranche_loss_figure(text, simulation), use_container_width=True)
+
+    scenarios = f"{simulation.scenarios:,}".replace(",", text["thousands_separator"])
+    st.markdown(text["simulator_summary"].format(scenarios=scenarios, expected_loss=simulation.expected_loss,
+                                                 senior_hit=simulation.tranches[2].hit_probability))
+
+
+def grid_axis(first, last, step):
+    # Rates of a grid axis given in percent, as fractions
+    return tuple(round(value / 100, 4) for value in np.arange(first, last + step / 2, step))
+
+
+def writedown_figure(text, grid, cpr, cdr):
+    names = [name for name, _, _ in data.WATERFALL_TRANCHES]
+    fig = subplots.make_subplots(rows=2, cols=2, subplot_titles=[text["waterfall_tranches"][name] for name in names],
+                                 shared_xaxes=True, shared_yaxes=True, horizontal_spacing=0.05,
+                                 vertical_spacing=0.1)
+
+    # Write-down of each tranche in every scenario, the selected one marked.
+    # Values are rounded to what the chart shows, which keeps the spec small
+    for index, name in enumerate(names):
+        row, col = index // 2 + 1, index % 2 + 1
+        fig.add_trace(go.Heatmap(
+            x=grid.cpr * 100,
+            y=grid.cdr * 100,
+            z=np.round(grid.writedown[:, :, index] * 100, 1),
+            zmin=0, zmax=100,
+            colorscale="Reds",
+            showscale=index == 0,
+            colorbar=dict(title=text["writedown_colorbar"], ticksuffix="%"),
+            hovertemplate="CPR %{x}%<br>CDR %{y}%<br>%{z:.1f}%<extra>" + text["waterfall_tranches"][name] + "</extra>"
+        ), row=row, col=col)
+        fig.add_trace(go.Scatter(
+            x=[cpr], y=[cdr], mode="markers", showlegend=False, hoverinfo="skip",
+            marker=dict(symbol="x", size=10, color="black")
+        ), row=row, col=col)
+
+    fig.update_xaxes(title_text=text["cpr_axis"], row=2)
+    fig.update_yaxes(title_text=text["cdr_axis"], col=1)
+    fig.update_layout(height=600, margin=dict(t=40))
+
+    return fig
+
+
+def principal_figure(text, flows):
+    fig = go.Figure()
+    years = np.round(np.arange(1, len(flows.principal) + 1) / 12, 3)
+
+    # Principal paid each month, stacked by tranche
+    for index, (name, _, _) in enumerate(data.WATERFALL_TRANCHES):
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=np.round(flows.principal[:, index], 4),
+            mode="lines",
+            stackgroup="principal",
+            name=text["waterfall_tranches"][name],
+            line=dict(width=0.5, color=data.WATERFALL_TRANCHE_COLORS[name]),
+            hovertemplate="%{y:.3f}<extra>" + text["waterfall_tranches"][name] + "</extra>"
+        ))
+
+    fig.update_layout(
+        title=text["principal_title"],
+        xaxis=dict(title=text["month_axis"]),
+        yaxis=dict(title=text["principal_axis"]),
+        hovermode="x unified",
+        height=400
+    )
+
+    return fig
+
+
+def waterfall_table(text, flows):
+    # Size, coupon, WAL, write-down and interest of each tranche in the selected scenario
+    rows = ["| " + " | ".join(text["waterfall_columns"]) + " |", "|" + " --- |" * len(text["waterfall_columns"])]
+    for (name, share, coupon), wal, writedown, interest in zip(
+            data.WATERFALL_TRANCHES, flows.wal, flows.writedown.sum(axis=0), flows.interest.sum(axis=0)):
+        rows.append(f"| {text['waterfall_tranches'][name]} | {share:.0%} | {coupon:.1%} | "
+                    f"{'—' if np.isnan(wal) else f'{wal:.1f}'} | {writedown / (share * 100):.1%} | {interest:.1f} |")
+    return "\n".join(rows)
+
+
+@fragment
+def deal_waterfall(text):
+    allocation = choose(st.radio, text["allocation_label"], text["allocations"], horizontal=True,
+                        key="waterfall_allocation")
+
+    defaults = data.WATERFALL_DEFAULTS
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        cpr = st.slider(text["cpr_label"], *data.WATERFALL_CPR[:2], defaults["cpr"], step=data.WATERFALL_CPR[2],
+                        format="%d%%", key="waterfall_cpr")
+
+    with col2:
+        cdr = st.slider(text["cdr_label"], *map(float, data.WATERFALL_CDR[:2]), defaults["cdr"],
+                        step=data.WATERFALL_CDR[2], format="%.1f%%", key="waterfall_cdr")
+
+    with col3:
+        severity = st.slider(text["severity_label"], 0, 100, defaults["severity"], step=10, format="%d%%",
+                             key="waterfall_severity")
+
+    # The whole grid runs once per deal and severity; moving along it only
+    # runs the selected scenario
+    deal = Deal(tuple(Tranche(*tranche) for tranche in data.WATERFALL_TRANCHES), data.WATERFALL_WAC,
+                data.WATERFALL_TERM, allocation)
+    with stage("data"):
+        grid = scenario_grid(deal, grid_axis(*data.WATERFALL_CPR), grid_axis(*data.WATERFALL_CDR), severity / 100)
+        flows = cash_flows(deal, round(cpr / 100, 4), round(cdr / 100, 4), severity / 100)
+
+    count = f"{grid.wal[..., 0].size:,}".replace(",", text["thousands_separator"])
+    chart_title(text["writedown_title"].format(count=count))
+    with stage("figure"):
+        st.plotly_chart(writedown_figure(text, grid, cpr, cdr), use_container_width=True)
+
+    with stage("figure"):
+        st.plotly_chart(principal_figure(text, flows), use_container_width=True)
+
+    st.markdown(waterfall_table(text, flows))
+
+
+def securitization(text):
+    sub_header(text["header"])
+
+    st.markdown(text["intro_html"], unsafe_allow_html=True)
+
+    chart_title(text["flow_title"])
+
+    # Drawn by the browser from a spec built once per locale
+    plotly_chart("securitization", "network", lambda: securitization_figure(text), use_container_width=True)
+
+    sub_header(text["instruments_title"])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(text["instruments_left_html"], unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(text["instruments_right_html"], unsafe_allow_html=True)
+
+    # Monte Carlo losses of a CDO's tranches, driven by the sliders
+    sub_header(text["simulator_title"])
+
+    st.markdown(text["simulator_html"], unsafe_allow_html=True)
+
+    tranche_losses(text)
+
+    # Payments of a deal's tranches month by month, across prepayment and default scenarios
+    sub_header(text["waterfall_title"])
+
+    st.markdown(text["waterfall_html"], unsafe_allow_html=True)
+
+    deal_waterfall(text)
+
+    st.markdown(text["problems_html"], unsafe_allow_html=True)
+
+
+@fragment
+def regional_measures(text):
+    region = choose(st.radio, text["region_label"], text["regions"], horizontal=True, key="region")
+
+    st.markdown(text["measures_html"][region], unsafe_allow_html=True)
+
+    st.markdown(text["focus_html"][region], unsafe_allow_html=True)
+
+
+def capital_figure(text):
+    fig = go.Figure()
+
+    capital = datastore.load_frame("basel_capital")
+    agreements = [text["basel_agreements"][agreement] for agreement in capital['agreement']]
+
+    for series, name in text["capital_series"].items():
+        fig.add_trace(go.Bar(
+            x=agreements,
+            y=capital[series],
+            name=name,
+            marker_color=data.BASEL_COLORS[series]
+        ))
+
+    fig.update_layout(
+        barmode='group',
+        xaxis=dict(title=text["x_label"]),
+        yaxis=dict(title=text["y_label"], range=[0, 14]),
+        legend=dict(x=0.1, y=1.15, orientation='h'),
+        height=500
+    )
+
+    return fig
+
+
+def regulation(text):
+    sub_header(text["header"])
+
+    st.markdown(text["intro_html"], unsafe_allow_html=True)
+
+    regional_measures(text)
+
+    # Evolution of the capital requirements
+    chart_title(text["capital_title"])
+
+    plotly_chart("regulation", "basel_capital", lambda: capital_figure(text), use_container_width=True)
+
+    st.markdown(text["capital_caption_html"], unsafe_allow_html=True)
+
+    st.markdown(text["effectiveness_html"], unsafe_allow_html=True)
+
+
+def lessons(text):
+    sub_header(text["header"])
+
+    st.markdown(text["intro_html"], unsafe_allow_html=True)
+
+    for tab, html in zip(st.tabs(text["tabs"]), text["tab_html"]):
+        with tab:
+            st.markdown(html, unsafe_allow_html=True)
+
+    # Closing quote
+    st.markdown(text["quote_html"], unsafe_allow_html=True)
+
+    sub_header(text["resources_title"])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(text["books_html"], unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(text["films_html"], unsafe_allow_html=True)
+
+
+# Page renderers, in the order of the navigation menu
+PAGES = {
+    "intro": intro,
+    "timeline": timeline,
+    "housing": housing,
+    "impact": impact,
+    "securitization": securitization,
+    "regulation": regulation,
+    "lessons": lessons,
+}
@@ -0,0 +1,249 @@
+# Payment shock of hybrid ARMs at their resets. A 2/28 pays a teaser rate for
+# two years (three for a 3/27, five for a 5/1); then, every 6 or 12 months,
+# its rate resets to the index (6-month LIBOR, here the fed funds rate plus a
+# spread) plus the loan's margin, within the caps of its product, and the
+# payment is recomputed to amortize the remaining balance over the remaining
+# term. The borrower's income is taken from the DTI at origination, so the
+# payment-to-income ratio (PTI) after a reset is DTI x new payment / first
+# payment.
+#
+# The population is the ARMs of the 2003-2007 vintages of the loan pool
+# (subprime_app/loanpool.py), sampled from its Parquet file when it has been
+# generated, otherwise drawn in memory with the same generator. Every loan is
+# followed to December 2010 as if it neither prepaid nor defaulted.
+#
+# Between resets the balance follows the closed form of a level-payment loan,
+# so the loop runs over the reset number (at most a dozen) and each step is
+# vectorized across scenarios x loans. Results are memoized by scenario set,
+# product and version of the pool file, as counts for each threshold of the
+# page's slider: the ratios of every loan at every reset (some 15 MB) are
+# dropped once counted.
+import functools
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from subprime_app import data, loanpool
+from subprime_app.performance import END, codes
+
+POPULATION = 100_000
+SYNTHETIC_LOANS = 1_000_000  # drawn to take the population's ARMs from when there is no pool file
+SEED = 2006
+TERM = 360
+
+ARM_PRODUCTS = list(data.PAYMENT_SHOCK_CAPS)
+_ARM_CODES = np.array([data.LOAN_POOL_PRODUCTS.index(product) for product in ARM_PRODUCTS], dtype=np.int8)
+
+# PTI thresholds the results are counted at, as fractions
+THRESHOLDS = tuple(percent / 100 for percent in range(data.PAYMENT_SHOCK_THRESHOLDS[0],
+                                                      data.PAYMENT_SHOCK_THRESHOLDS[1] + 1,
+                                                      data.PAYMENT_SHOCK_THRESHOLDS[2]))
+
+_HIKES_START = (data.PAYMENT_SHOCK_HIKES_START[0] - 2000) * 12 + data.PAYMENT_SHOCK_HIKES_START[1] - 1
+
+
+def policy_rates():
+    # Fed funds target in each month since January 2000
+    months = [(year - 2000) * 12 + month - 1 for year, month, _ in data.PAYMENT_SHOCK_POLICY_RATES]
+    rates = np.array([rate for _, _, rate in data.PAYMENT_SHOCK_POLICY_RATES])
+    return rates[np.searchsorted(months, np.arange(END + 1), side="right") - 1]
+
+
+def capped_path(peak):
+    # The actual path, never above peak from the start of the 2004 hikes on
+    path = policy_rates()
+    path[_HIKES_START:] = np.minimum(path[_HIKES_START:], peak)
+    return path
+
+
+def _annuity(balance, rate, months):
+    # Level monthly payment that amortizes balance in months at an annual rate
+    monthly = rate / 12
+    return balance * monthly / (1 - (1 + monthly) ** -months)
+
+
+def _amortize(balance, rate, payment, months):
+    # Balance after months level payments
+    growth = (1 + rate / 12) ** months
+    return balance * growth - payment * (growth - 1) / (rate / 12)
+
+
+def _select(loans, keep):
+    return {name: column[keep] for name, column in loans.items()}
+
+
+def _arms(vintage, product, columns):
+    # The loans of a batch (arrays) in the population, with product as an index of ARM_PRODUCTS
+    keep = np.isin(vintage, data.PAYMENT_SHOCK_VINTAGES) & np.isin(product, _ARM_CODES)
+    loans = _select(dict(columns, vintage=vintage, product=product), keep)
+    loans["product"] = np.searchsorted(_ARM_CODES, loans["product"]).astype(np.int8)
+    return loans
+
+
+def _pool_loans(path):
+    columns = ["vintage", "product", "dti", "balance", "rate", "margin"]
+    parts = []
+    for batch in pq.ParquetFile(path).iter_batches(loanpool.CHUNK_SIZE, columns=columns):
+        parts.append(_arms(batch.column("vintage").to_numpy(),
+                           codes(batch.column("product"), data.LOAN_POOL_PRODUCTS),
+                           {name: batch.column(name).to_numpy() for name in columns[2:]}))
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def _synthetic_loans(seed):
+    batch = loanpool.generate_chunk(np.random.default_rng(seed), SYNTHETIC_LOANS, 0, loanpool.calibration())
+    return _arms(batch.column("vintage").to_numpy(),
+                 batch.column("product").indices.to_numpy(zero_copy_only=False),
+                 {name: batch.column(name).to_numpy() for name in ("dti", "balance", "rate", "margin")})
+
+
+@functools.lru_cache(maxsize=2)
+def _population(path, version, size, seed):
+    loans = _synthetic_loans(seed) if path is None else _pool_loans(path)
+    rng = np.random.default_rng(seed)
+    if len(loans["vintage"]) > size:
+        loans = _select(loans, np.sort(rng.choice(len(loans["vintage"]), size, replace=False)))
+    # Originated in a random month of the vintage year
+    loans["origination"] = ((loans["vintage"].astype(np.int32) - 2000) * 12
+                            + rng.integers(0, 12, len(loans["vintage"]))).astype(np.int16)
+    for column in loans.values():
+        column.flags.writeable = False
+    return loans
+
+
+def _pool_version(path):
+    # (mtime, size) of the pool file, None when it has not been generated
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_population(size=POPULATION, seed=SEED, path=loanpool.POOL_PATH):
+    # Dict of arrays, one element per ARM: vintage, product (index of
+    # ARM_PRODUCTS), dti, balance, rate, margin and origination (months since
+    # January 2000). Synthetic when the pool file does not exist
+    version = _pool_version(path)
+    return _population(path if version else None, version, size, seed)
+
+
+def resets(loans, index_paths):
+    # Yields, for each reset number, (period, rate, payment, pti): period is
+    # the month of the reset of each loan (-1 after December 2010) and the
+    # others are arrays of scenarios x loans, NaN after December 2010.
+    # index_paths: scenarios x months since January 2000
+    caps = np.array(list(data.PAYMENT_SHOCK_CAPS.values()))[loans["product"]]
+    first_cap, periodic_cap, lifetime_cap = caps[:, :3].T
+    interval = caps[:, 3].astype(int)
+    first_reset = np.array([data.LOAN_POOL_RESET_MONTHS[product] for product in ARM_PRODUCTS])[loans["product"]]
+    initial_rate = loans["rate"].astype(float)
+    margin = loans["margin"].astype(float)
+    dti = loans["dti"].astype(float)
+
+    first_payment = _annuity(loans["balance"].astype(float), initial_rate, TERM)
+    balance, rate, payment = (np.broadcast_to(column, (len(index_paths), len(initial_rate)))
+                              for column in (loans["balance"].astype(float), initial_rate, first_payment))
+    age = np.zeros(len(initial_rate))
+    number = 0
+    while True:
+        reset_age = first_reset + number * interval
+        period = loans["origination"] + reset_age
+        observed = period <= END
+        if not observed.any():
+            return
+        balance = _amortize(balance, rate, payment, reset_age - age)
+        index = index_paths[:, np.minimum(period, END).astype(np.intp)]
+        cap = first_cap if number == 0 else periodic_cap
+        target = np.clip(index + data.PAYMENT_SHOCK_INDEX_SPREAD + margin, rate - cap, rate + cap)
+        rate = np.clip(target, margin, initial_rate + lifetime_cap)
+        payment = _annuity(balance, rate, TERM - reset_age)
+        pti = dti * payment / first_payment
+        age = reset_age
+        hidden = np.where(observed, 1.0, np.nan)
+        yield np.where(observed, period, -1), rate * hidden, payment * hidden, pti * hidden
+        number += 1
+
+
+@dataclass(frozen=True, eq=False)
+class PaymentShock:
+    scenarios: tuple
+    loans: int
+    synthetic: bool  # drawn in memory, there being no pool file
+    median_shock: np.ndarray  # per scenario: median of the payment after the first reset over the first payment, minus 1
+    large_shock: np.ndarray  # per scenario: share of the loans with a shock above 25% at the first reset
+    first_reset: np.ndarray  # scenarios x THRESHOLDS: share pushed past the threshold at the first reset
+    crossed: np.ndarray  # scenarios x THRESHOLDS x months since January 2000: share pushed past it by that month
+
+    def past_threshold(self, threshold):
+        # Scenarios x months since January 2000: share of the loans pushed
+        # past threshold (one of THRESHOLDS) at a reset by that month
+        return self.crossed[:, THRESHOLDS.index(threshold)]
+
+    def summary(self, threshold):
+        # Per scenario: median payment shock at the first reset, and shares of
+        # all the loans with a shock above 25% at the first reset and pushed
+        # past threshold at the first reset and at any reset by December 2010
+        index = THRESHOLDS.index(threshold)
+        return {
+            "median_shock": self.median_shock,
+            "large_shock": self.large_shock,
+            "first_reset": self.first_reset[:, index],
+            "by_end": self.crossed[:, index, -1],
+        }
+
+
+def _crossed(pushed, periods):
+    # Scenarios x months: share of the loans first pushed past at a reset by
+    # that month. pushed: scenarios x loans x resets; periods: loans x resets
+    crossed = pushed.any(axis=2)
+    first = np.take_along_axis(periods[None], pushed.argmax(axis=2)[..., None], axis=2)[..., 0]
+    counts = np.stack([np.bincount(first[scenario][crossed[scenario]], minlength=END + 1)
+                       for scenario in range(len(pushed))])
+    return np.cumsum(counts, axis=1) / pushed.shape[1]
+
+
+@functools.lru_cache(maxsize=16)
+def _payment_shock(scenarios, product, path, version, size, seed):
+    loans = _population(path, version, size, seed)
+    if product is not None:
+        loans = _select(loans, loans["product"] == ARM_PRODUCTS.index(product))
+    index_paths = np.stack([policy_rates() if peak is None else capped_path(peak) for _, peak in scenarios])
+    first_payment = _annuity(loans["balance"].astype(float), loans["rate"].astype(float), TERM)
+    periods, pti, first_shock = [], [], None
+    for period, _, payment, ratio in resets(loans, index_paths):
+        if first_shock is None:
+            first_shock = payment / first_payment - 1
+        periods.append(period.astype(np.int16))
+        pti.append(ratio.astype(np.float32))
+    periods, pti = np.stack(periods, axis=1), np.stack(pti, axis=2)
+
+    # Only borrowers below the threshold at origination are pushed past it
+    first_reset, crossed = [], []
+    for threshold in THRESHOLDS:
+        pushed = (pti > threshold) & (loans["dti"] <= threshold)[:, None]
+        first_reset.append(pushed[..., 0].mean(axis=1))
+        crossed.append(_crossed(pushed, periods))
+    with np.errstate(invalid="ignore"):
+        median_shock = np.nanmedian(first_shock.astype(np.float32), axis=1)
+    result = PaymentShock(
+        tuple(name for name, _ in scenarios), len(loans["dti"]), version is None,
+        median_shock=median_shock,
+        large_shock=(first_shock.astype(np.float32) > 0.25).mean(axis=1),
+        first_reset=np.stack(first_reset, axis=1),
+        crossed=np.stack(crossed, axis=1),
+    )
+    for array in (result.median_shock, result.large_shock, result.first_reset, result.crossed):
+        array.flags.writeable = False
+    return result
+
+
+def payment_shock(scenarios, product=None, size=POPULATION, seed=SEED, path=loanpool.POOL_PATH):
+    # scenarios: ((name, peak), ...), peak None for the actual path; product:
+    # the ARMs of one product (name), or None for all. Memoized per pool file
+    # version, so a generated or regenerated pool is picked up; the arrays of
+    # the result are shared by every caller and read-only
+    version = _pool_version(path)
+    return _payment_shock(scenarios, product, path if version else None, version, size, seed)
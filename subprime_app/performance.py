@@ -0,0 +1,295 @@
+"""Monthly performance of the synthetic loan pool, and its vintage analytics.
+
+``generate`` follows a seeded sample of the 2003-2008 vintages of the pool
+(``subprime_app/loanpool.py``) month by month until December 2010: each loan
+is current, 30, 60 or 90+ days delinquent, and leaves the pool when it
+defaults or prepays. The hazards (``subprime_app/data.py``) respond to the
+borrower's FICO and LTV, to house prices (the Case-Shiller dataset) and to ARM
+resets. The result is a loan-month table, sorted by loan and month, written
+to Parquet one row group per chunk of loans:
+
+    python -m subprime_app.performance generate --sample 0.1
+
+The analytics scan that table batch by batch with bounded memory and
+accumulate, per vintage, the loans that default at each age (the cumulative
+default curves) and the transitions between statuses from one month to the
+next (the roll-rate matrices). The transition of the first row of a batch
+uses the last row of the batch before. Results are cached per product and
+FICO band filter, for as long as the file does not change:
+
+    python -m subprime_app.performance summary
+"""
+import argparse
+import functools
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from subprime_app import data, datastore
+from subprime_app.loanpool import POOL_PATH
+
+PERFORMANCE_PATH = os.path.join(datastore.DATASETS_DIR, "loan_months.parquet")
+SAMPLE = 0.1
+SEED = 2010
+BATCH_SIZE = 1_000_000
+
+STATUSES = data.PERFORMANCE_STATUSES
+CURRENT, DPD30, DPD60, DPD90, DEFAULT, PREPAID = range(len(STATUSES))
+FICO_BANDS = list(data.PERFORMANCE_FICO_BANDS)
+
+# Months are counted from January 2000; END is the last one observed
+END = (data.PERFORMANCE_END[0] - 2000) * 12 + data.PERFORMANCE_END[1] - 1
+_AGES = END - (data.PERFORMANCE_VINTAGES[0] - 2000) * 12 + 1
+
+_CATEGORY = pa.dictionary(pa.int8(), pa.string())
+
+SCHEMA = pa.schema([
+    ("loan_id", pa.int32()),
+    ("vintage", pa.int16()),
+    ("product", _CATEGORY),
+    ("fico_band", _CATEGORY),
+    ("period", pa.int16()),  # months since January 2000
+    ("age", pa.int16()),  # months since origination
+    ("status", _CATEGORY),
+])
+
+
+def codes(column, names):
+    # Positions in names of the values of a dictionary-encoded column
+    lookup = np.array([names.index(name) for name in column.dictionary.to_pylist()], dtype=np.int8)
+    return lookup[column.indices.to_numpy(zero_copy_only=False)]
+
+
+def _price_changes():
+    # Year-over-year change of the Case-Shiller index in each month
+    case_shiller = datastore.load_frame("case_shiller")
+    years = 2000 + np.arange(END + 1) / 12
+    index = np.interp(years, case_shiller["date"], case_shiller["index"])
+    return index / np.interp(years - 1, case_shiller["date"], case_shiller["index"]) - 1
+
+
+def _annual_to_monthly(rate):
+    return 1 - (1 - np.minimum(rate, 0.9)) ** (1 / 12)
+
+
+def simulate(rng, loans, price_changes):
+    # Loan-month rows of a chunk of loans (a dict of pool columns), sorted by
+    # loan and month
+    size = len(loans["loan_id"])
+    hazards = data.PERFORMANCE_HAZARDS
+    subprime = loans["subprime"]
+    origination = (loans["vintage"].astype(np.int32) - 2000) * 12 + rng.integers(0, 12, size)
+    resets = np.array(list(data.LOAN_POOL_RESET_MONTHS.values()))[loans["product"]]
+    delinquency = (np.where(subprime, hazards["delinquency"]["subprime"], hazards["delinquency"]["prime"])
+                   * np.exp((700 - loans["fico"]) / hazards["fico_scale"])
+                   * np.exp(hazards["ltv_slope"] * (loans["ltv"] - 0.8)))
+    prepayment = np.where(subprime, hazards["prepayment"]["subprime"], hazards["prepayment"]["prime"])
+    rolls = data.PERFORMANCE_ROLLS
+
+    status = np.zeros(size, dtype=np.int8)
+    done = np.zeros(size, dtype=bool)
+    rows = []
+    for period in range(origination.min() + 1, END + 1):
+        active = np.flatnonzero((origination < period) & ~done)
+        if not len(active):
+            continue
+        age = period - origination[active]
+        before = status[active]
+        price = np.exp(-hazards["price_slope"] * price_changes[period])
+        stress = np.sqrt(price)
+        reset = (resets[active] > 0) & (age > resets[active])
+
+        # Current loans miss a payment or prepay
+        missed = np.minimum(delinquency[active] * price * np.where(reset, hazards["reset_factor"], 1), 0.5)
+        refinancing = reset & (age <= resets[active] + 6) & (price_changes[period] > 0)
+        prepaid = _annual_to_monthly(prepayment[active] * np.exp(hazards["prepayment_price_slope"] * price_changes[period])
+                                     * np.where(refinancing, hazards["reset_prepayment_factor"], 1))
+
+        # Delinquent loans cure, roll forward or, from 60 days, go back to 30
+        cure30 = rolls["dpd30"]["cure"] / stress
+        roll30 = min(rolls["dpd30"]["roll"] * stress, 1 - cure30)
+        cure60, back60 = rolls["dpd60"]["cure"] / stress, rolls["dpd60"]["back"] / stress
+        roll60 = min(rolls["dpd60"]["roll"] * stress, 1 - cure60 - back60)
+        cure90 = rolls["dpd90"]["cure"] / stress
+        roll90 = min(rolls["dpd90"]["roll"] * stress, 1 - cure90)
+
+        draw = rng.random(len(active))
+        after = np.select(
+            [before == CURRENT, before == DPD30, before == DPD60],
+            [np.where(draw < missed, DPD30, np.where(draw < missed + prepaid, PREPAID, CURRENT)),
+             np.where(draw < cure30, CURRENT, np.where(draw < cure30 + roll30, DPD60, DPD30)),
+             np.select([draw < cure60, draw < cure60 + back60, draw < cure60 + back60 + roll60],
+                       [CURRENT, DPD30, DPD90], DPD60)],
+            np.where(draw < cure90, CURRENT, np.where(draw < cure90 + roll90, DEFAULT, DPD90)),
+        ).astype(np.int8)
+        status[active] = after
+        done[active] = after >= DEFAULT
+        rows.append((active, np.full(len(active), period, np.int16), age.astype(np.int16), after))
+
+    # Rows were produced month by month; a stable sort by loan keeps the months in order
+    loan, period, age, after = (np.concatenate(column) for column in zip(*rows))
+    order = np.argsort(loan, kind="stable")
+    loan, period, age, after = loan[order], period[order], age[order], after[order]
+    bands = np.searchsorted([low for low, _ in data.PERFORMANCE_FICO_BANDS.values()], loans["fico"][loan],
+                            side="right") - 1
+    return pa.RecordBatch.from_arrays([
+        pa.array(loans["loan_id"][loan]),
+        pa.array(loans["vintage"][loan]),
+        pa.DictionaryArray.from_arrays(pa.array(loans["product"][loan], pa.int8()), pa.array(data.LOAN_POOL_PRODUCTS)),
+        pa.DictionaryArray.from_arrays(pa.array(bands.astype(np.int8)), pa.array(FICO_BANDS)),
+        pa.array(period),
+        pa.array(age),
+        pa.DictionaryArray.from_arrays(pa.array(after), pa.array(STATUSES)),
+    ], schema=SCHEMA)
+
+
+def generate(pool=POOL_PATH, output=PERFORMANCE_PATH, sample=SAMPLE, seed=SEED):
+    # Follows a share (sample) of the pool's loans of the followed vintages,
+    # one row group per row group of the pool; returns loans and loan-months.
+    # The file is replaced only once complete
+    price_changes = _price_changes()
+    segments = list(data.LOAN_POOL_SEGMENTS)
+    loans_written = rows_written = 0
+    temporary = f"{output}.tmp"
+    with pq.ParquetWriter(temporary, SCHEMA, compression="zstd") as writer:
+        source = pq.ParquetFile(pool)
+        for index in range(source.num_row_groups):
+            rng = np.random.default_rng([seed, index])
+            group = source.read_row_group(index, columns=["loan_id", "vintage", "segment", "product", "fico", "ltv"])
+            vintage = group.column("vintage").to_numpy()
+            keep = np.isin(vintage, data.PERFORMANCE_VINTAGES) & (rng.random(len(vintage)) < sample)
+            if not keep.any():
+                continue
+            loans = {
+                "loan_id": group.column("loan_id").to_numpy()[keep],
+                "vintage": vintage[keep],
+                "subprime": codes(group.column("segment").combine_chunks(), segments)[keep] == segments.index("subprime"),
+                "product": codes(group.column("product").combine_chunks(), data.LOAN_POOL_PRODUCTS)[keep],
+                "fico": group.column("fico").to_numpy()[keep],
+                "ltv": group.column("ltv").to_numpy()[keep],
+            }
+            batch = simulate(rng, loans, price_changes)
+            writer.write_batch(batch, row_group_size=len(batch))
+            loans_written += len(loans["loan_id"])
+            rows_written += len(batch)
+    os.replace(temporary, output)
+    return loans_written, rows_written
+
+
+@dataclass(frozen=True, eq=False)
+class VintagePerformance:
+    vintages: np.ndarray
+    loans: np.ndarray  # loans of each vintage
+    loan_months: int
+    defaults: np.ndarray  # vintage x age: loans that default at that age
+    transitions: np.ndarray  # vintage x status x status: loans moving from one to the other in a month
+
+    def default_curves(self):
+        # Cumulative share of each vintage's loans in default by age, NaN
+        # after the last age at which every loan of the vintage is observed
+        with np.errstate(invalid="ignore", divide="ignore"):
+            curves = np.cumsum(self.defaults, axis=1) / self.loans[:, None]
+        observed = END - ((self.vintages - 2000) * 12 + 11)
+        curves[np.arange(curves.shape[1]) > observed[:, None]] = np.nan
+        return curves
+
+    def roll_rates(self, vintage=None):
+        # Share of the loans in each delinquency status (current to 90+) found
+        # in each status the next month
+        counts = self.transitions.sum(axis=0) if vintage is None else \
+            self.transitions[list(self.vintages).index(vintage)]
+        counts = counts[:DEFAULT]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return counts / counts.sum(axis=1, keepdims=True)
+
+
+def scan(path=PERFORMANCE_PATH, product=None, fico_band=None, batch_size=BATCH_SIZE):
+    # One pass over the loan-month table; product and fico_band (names, or
+    # None for all) filter the loans
+    vintages = np.array(data.PERFORMANCE_VINTAGES)
+    loans = np.zeros(len(vintages), dtype=np.int64)
+    defaults = np.zeros((len(vintages), _AGES), dtype=np.int64)
+    transitions = np.zeros((len(vintages), len(STATUSES), len(STATUSES)), dtype=np.int64)
+    loan_months = 0
+    last_loan, last_status = -1, CURRENT
+    columns = ["loan_id", "vintage", "product", "fico_band", "age", "status"]
+    for batch in pq.ParquetFile(path).iter_batches(batch_size, columns=columns):
+        loan = batch.column("loan_id").to_numpy()
+        status = codes(batch.column("status"), STATUSES)
+
+        # Status of each row's loan the month before, when the row is not its first
+        previous_loan = np.concatenate(([last_loan], loan[:-1]))
+        previous_status = np.concatenate(([last_status], status[:-1]))
+        last_loan, last_status = loan[-1], status[-1]
+
+        selected = np.ones(len(loan), dtype=bool)
+        if product is not None:
+            selected &= codes(batch.column("product"), data.LOAN_POOL_PRODUCTS) == data.LOAN_POOL_PRODUCTS.index(product)
+        if fico_band is not None:
+            selected &= codes(batch.column("fico_band"), FICO_BANDS) == FICO_BANDS.index(fico_band)
+        vintage = batch.column("vintage").to_numpy()[selected] - vintages[0]
+        age = batch.column("age").to_numpy()[selected]
+        status, previous_status = status[selected], previous_status[selected]
+        continued = (previous_loan == loan)[selected]
+        loan_months += len(vintage)
+
+        loans += np.bincount(vintage[age == 1], minlength=len(vintages))
+        defaulted = status == DEFAULT
+        defaults += np.bincount(vintage[defaulted] * _AGES + age[defaulted],
+                                minlength=defaults.size).reshape(defaults.shape)
+        cells = (vintage * len(STATUSES) + previous_status) * len(STATUSES) + status
+        transitions += np.bincount(cells[continued], minlength=transitions.size).reshape(transitions.shape)
+
+    return VintagePerformance(vintages, loans, loan_months, defaults, transitions)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_scan(path, version, product, fico_band):
+    return scan(path, product, fico_band)
+
+
+def load_performance(product=None, fico_band=None, path=PERFORMANCE_PATH):
+    # Scanned once per filter; a regenerated file has a new version and is scanned again
+    stat = os.stat(path)
+    return _cached_scan(path, (stat.st_mtime_ns, stat.st_size), product, fico_band)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate or summarize the monthly performance of the loan pool.")
+    parser.add_argument("command", choices=("generate", "summary"),
+                        help="generate: follow the pool month by month; summary: default rates by vintage")
+    parser.add_argument("--pool", default=POOL_PATH, help="Parquet file of the pool (subprime_app.loanpool)")
+    parser.add_argument("--output", default=PERFORMANCE_PATH, help="Parquet file of the loan-months")
+    parser.add_argument("--sample", type=float, default=SAMPLE, help="share of the pool's loans to follow")
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        start = time.perf_counter()
+        loans, rows = generate(args.pool, args.output, args.sample, args.seed)
+        size = os.path.getsize(args.output)
+        print(f"{loans} loans, {rows} loan-months written to {args.output} in {time.perf_counter() - start:.1f} s "
+              f"({size / 1024 / 1024:.1f} MiB)")
+        return 0
+
+    start = time.perf_counter()
+    performance = load_performance(path=args.output)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    load_performance(path=args.output)
+    cached = time.perf_counter() - start
+    curves = performance.default_curves()
+    for vintage, loans, curve in zip(performance.vintages, performance.loans, curves):
+        print(f"{vintage}  {loans:8d} loans  defaulted {np.nanmax(curve):6.2%} "
+              f"after {np.flatnonzero(~np.isnan(curve))[-1]} months")
+    print(f"{performance.loan_months} loan-months scanned in {first:.2f} s (cached: {cached * 1e6:.0f} us)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# Render cache on disk, shared by every worker process on the host and kept
+# across restarts. Entries are content-addressed: the key is a hash of the kind
+# of artifact, the dataset version and the inputs, so equal inputs always map
+# to the same entry. The inputs must cover everything else the artifact
+# depends on, code included (subprime_app/figure_cache.py adds the catalog
+# version and its FORMAT): an entry written by an older catalog or builder is
+# never read again and is evicted once it is the least recently used.
+#
+# The cache is one SQLite database in WAL mode: readers never block, concurrent
+# writers wait for each other (busy timeout) and every write is atomic. When
+# the stored values exceed the size budget, the least recently used entries are
+# evicted.
+#
+#   SUBPRIME_RENDER_CACHE      database path, or "off" (default: in the temp dir)
+#   SUBPRIME_RENDER_CACHE_MB   size budget in MiB (default: 64)
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from subprime_app import datastore
+
+PATH = os.environ.get("SUBPRIME_RENDER_CACHE", os.path.join(tempfile.gettempdir(), "subprime-render-cache.sqlite3"))
+ENABLED = PATH != "off"
+MAX_BYTES = int(float(os.environ.get("SUBPRIME_RENDER_CACHE_MB", 64)) * 1024 * 1024)
+
+# Hits refresh the access time at most this often, so reads rarely write
+_TOUCH_INTERVAL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+# sqlite3 connections belong to the thread that opened them
+_local = threading.local()
+
+
+def _connection():
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = sqlite3.connect(PATH, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        _local.connection = connection
+    return connection
+
+
+def cache_key(kind, inputs):
+    payload = json.dumps([kind, datastore.dataset_version(), inputs], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get(kind, inputs):
+    connection = _connection()
+    key = cache_key(kind, inputs)
+    row = connection.execute("SELECT value, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    value, accessed = row
+    now = time.time()
+    if now - accessed > _TOUCH_INTERVAL:
+        connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+    return value
+
+
+def put(kind, inputs, value):
+    connection = _connection()
+    encoded = value.encode() if isinstance(value, str) else value
+    with connection:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (key, kind, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+            (cache_key(kind, inputs), kind, encoded, len(encoded), time.time()))
+        _evict(connection)
+
+
+def _evict(connection):
+    # Deletes the least recently used entries until the values fit in MAX_BYTES
+    total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    excess = total - MAX_BYTES
+    for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+        connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        excess -= size
+        if excess <= 0:
+            break
+
+
+def cached(kind, inputs, compute):
+    # Text produced by compute(), read from the disk cache when another process
+    # (or an earlier run of this one) already produced it
+    if not ENABLED:
+        return compute()
+    value = get(kind, inputs)
+    if value is not None:
+        return value.decode()
+    value = compute()
+    put(kind, inputs, value)
+    return value
+
+
+def stats():
+    rows = _connection().execute("SELECT kind, COUNT(*), SUM(size) FROM entries GROUP BY kind").fetchall()
+    return {kind: {"entries": count, "bytes": size} for kind, count, size in rows}
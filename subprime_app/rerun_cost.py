@@ -0,0 +1,164 @@
+"""Rerun cost of the in-page selectors, measured against a live server.
+
+Starts ``streamlit run`` headless, talks to it over the same websocket the
+browser uses, opens each page that has a selector and cycles through its
+options. For every interaction it records the wall time between sending the
+rerun request and receiving ``script_finished``, and the bytes the server sent
+back over the websocket:
+
+    python -m subprime_app.rerun_cost --rounds 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+# Page id and key of the selector measured on it
+SELECTORS = {
+    "timeline": "timeline_period",
+    "impact": "impact_metric",
+    "regulation": "region",
+}
+
+PAGE_ORDER = ("intro", "timeline", "housing", "impact", "securitization", "regulation", "lessons")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(script, port):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("Streamlit server did not start")
+
+
+class Session:
+    # A minimal browser: sends rerun requests and keeps the widget states current
+
+    def __init__(self, connection, query_string):
+        self.connection = connection
+        self.query_string = query_string
+        self.widgets = {}  # key -> (widget id, fragment id)
+        self.states = {}  # widget id -> option index
+
+    async def rerun(self, fragment_id=""):
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query_string
+        for widget_id, index in self.states.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.int_value = index
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        start = time.perf_counter()
+        await self.connection.write_message(msg.SerializeToString(), binary=True)
+
+        received = 0
+        while True:
+            payload = await self.connection.read_message()
+            if payload is None:
+                raise RuntimeError("Websocket closed by the server")
+            received += len(payload)
+            forward = ForwardMsg()
+            forward.ParseFromString(payload)
+            if forward.WhichOneof("type") == "delta":
+                self._track(forward.delta)
+            elif forward.WhichOneof("type") == "script_finished":
+                return (time.perf_counter() - start) * 1000, received
+
+    def _track(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind in ("radio", "selectbox"):
+            widget = getattr(element, kind)
+            key = widget.id.rsplit("-", 1)[-1]
+            self.widgets[key] = (widget.id, getattr(delta, "fragment_id", ""))
+            self.states.setdefault(widget.id, widget.default)
+
+    async def select(self, key, index):
+        widget_id, fragment_id = self.widgets[key]
+        self.states[widget_id] = index
+        return await self.rerun(fragment_id)
+
+
+async def _measure(port, query_string, rounds):
+    connection = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+    session = Session(connection, query_string)
+    await session.rerun()
+    report = {}
+    for page, key in SELECTORS.items():
+        await session.select("page", PAGE_ORDER.index(page))
+        options = 8 if key == "timeline_period" else 3
+        timings, sizes = [], []
+        for _ in range(rounds):
+            for index in (*range(1, options), 0):
+                ms, received = await session.select(key, index)
+                timings.append(ms)
+                sizes.append(received)
+        report[key] = {
+            "interactions": len(timings),
+            "median_ms": statistics.median(timings),
+            "mean_ms": statistics.mean(timings),
+            "mean_bytes": statistics.mean(sizes),
+        }
+    connection.close()
+    return report
+
+
+def measure(script="app.py", query_string="lang=pt", rounds=10):
+    port = _free_port()
+    server = start_server(script, port)
+    try:
+        return asyncio.run(_measure(port, query_string, rounds))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the rerun cost of the in-page selectors.")
+    parser.add_argument("--script", default="app.py", help="app script to serve")
+    parser.add_argument("--lang", default="pt", help="locale passed as ?lang=")
+    parser.add_argument("--rounds", type=int, default=10, help="passes over every option")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = measure(args.script, f"lang={args.lang}", args.rounds)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for key, row in report.items():
+            print(f"{key:<16} median {row['median_ms']:6.1f} ms, mean {row['mean_ms']:6.1f} ms, "
+                  f"{row['mean_bytes'] / 1024:5.1f} KB   ({row['interactions']} interactions)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+# Full-text search over every text block of the app. The compiled content of
+# each locale (subprime_app/content.py) is cut into documents, one per heading
+# of a block (or per block without headings), and held in an inverted index:
+# term -> [(document, term frequency)]. Terms are lowercase with the accents
+# dropped, so "basileia" finds "Basiléia" and "securitizacao" finds
+# "securitização". Hits are ranked with BM25; the last word of the query also
+# matches as a prefix ("secur" finds "securitization"), through a binary
+# search over the sorted vocabulary.
+#
+# Each document keeps a deep link to where it is shown: the page, the option
+# of the selector that shows it (period, metric or region) and the anchor of
+# its heading. The indexes are built once per locale and process.
+import bisect
+import functools
+import html
+import math
+import re
+import unicodedata
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from subprime_app.content import load_content
+from subprime_app.locales import TRANSLATED_SELECTORS, load_catalog
+
+# Blocks shown only for one option of a selector: the option is the key of
+# the block under them
+_OPTION_BLOCKS = {"period_html": "timeline_period", "measures_html": "region", "focus_html": "region"}
+
+# Pages whose sections are keyed by the option of a selector
+_OPTION_SECTIONS = {"impact": "impact_metric"}
+
+# Cards of the timeline events, already indexed through the periods
+_SKIPPED_BLOCKS = {"event_html"}
+
+_HEADING = re.compile(r"<(h[1-4])([^>]*)>(.*?)</\1>", re.DOTALL)
+_ANCHOR = re.compile(r'data-anchor="([^"]*)"')
+_TAG = re.compile(r"<[^>]+>")
+_WORD = re.compile(r"\w+")
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+# Title words count as this many occurrences
+_TITLE_WEIGHT = 3
+
+# Shortest last word that also matches as a prefix
+_MIN_PREFIX = 3
+
+
+@dataclass(frozen=True)
+class Document:
+    locale: str
+    page: str
+    selection: tuple  # ((selector key, option id), ...)
+    anchor: str  # "" for the top of the page
+    title: str
+    text: str
+
+    @property
+    def link(self):
+        # Relative URL that opens a new session on the document
+        query = urlencode({"lang": self.locale, "page": self.page, **dict(self.selection)})
+        return f"?{query}#{self.anchor}" if self.anchor else f"?{query}"
+
+
+@dataclass(frozen=True)
+class Hit:
+    document: Document
+    score: float
+    snippet: str
+
+
+def _fold_char(char):
+    return unicodedata.normalize("NFKD", char.lower())[0]
+
+
+def fold(text):
+    # One character per character, so positions in the folded text are
+    # positions in the original text
+    return "".join(_fold_char(char) for char in text)
+
+
+def tokens(text):
+    return _WORD.findall(fold(text))
+
+
+def _plain(markup):
+    return " ".join(html.unescape(_TAG.sub(" ", markup)).split())
+
+
+def _blocks(value, path):
+    # (path, HTML) of every block under value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _blocks(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _blocks(item, path + (index,))
+    elif any(isinstance(key, str) and key.endswith("_html") for key in path):
+        yield path, value
+
+
+def _selection(page, path):
+    if page in _OPTION_SECTIONS:
+        return ((_OPTION_SECTIONS[page], str(path[0])),)
+    if path[0] in _OPTION_BLOCKS:
+        return ((_OPTION_BLOCKS[path[0]], str(path[1])),)
+    return ()
+
+
+def documents(locale):
+    content = load_content(locale)
+    catalog = load_catalog(locale)
+    for page, page_label in content["pages"].items():
+        for path, markup in _blocks(content[page], ()):
+            if path[0] in _SKIPPED_BLOCKS:
+                continue
+            selection = _selection(page, path)
+            # Blocks without a heading are titled by their option, else by the page
+            title = page_label
+            for key, option in selection:
+                labels = {str(option_id): label for option_id, label in TRANSLATED_SELECTORS[key](catalog).items()}
+                title = f"{page_label} › {labels[option]}"
+
+            # One document for the text before the first heading, then one per heading
+            headings = list(_HEADING.finditer(markup))
+            starts = [0] + [heading.start() for heading in headings]
+            ends = starts[1:] + [len(markup)]
+            for number, (start, end) in enumerate(zip(starts, ends)):
+                text = _plain(markup[start:end])
+                if not text:
+                    continue
+                if number == 0:
+                    yield Document(locale, page, selection, "", title, text)
+                else:
+                    _, attributes, heading = headings[number - 1].groups()
+                    anchor = _ANCHOR.search(attributes)
+                    yield Document(locale, page, selection, anchor.group(1) if anchor else "",
+                                   f"{page_label} › {_plain(heading)}", text)
+
+
+class SearchIndex:
+
+    def __init__(self, documents):
+        self.documents = list(documents)
+        self._postings = {}
+        lengths = []
+        self._folded = []
+        for number, document in enumerate(self.documents):
+            counts = {}
+            for term in tokens(document.text):
+                counts[term] = counts.get(term, 0) + 1
+            for term in tokens(document.title):
+                counts[term] = counts.get(term, 0) + _TITLE_WEIGHT
+            for term, count in counts.items():
+                self._postings.setdefault(term, []).append((number, count))
+            lengths.append(sum(counts.values()))
+            self._folded.append(fold(document.text))
+        self._vocabulary = sorted(self._postings)
+        average_length = sum(lengths) / max(len(lengths), 1)
+        self._norms = [_K1 * (1 - _B + _B * length / average_length) for length in lengths]
+        self._idf = {
+            term: math.log(1 + (len(self.documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def _expand(self, term):
+        # The term and, when it is long enough, every word it is a prefix of
+        if len(term) < _MIN_PREFIX:
+            return [term] if term in self._postings else []
+        first = bisect.bisect_left(self._vocabulary, term)
+        last = bisect.bisect_left(self._vocabulary, term + "\uffff")
+        return self._vocabulary[first:last]
+
+    def _scores(self, terms):
+        # BM25 score of each document with at least one of the terms
+        scores = {}
+        for term in terms:
+            idf = self._idf[term]
+            for number, count in self._postings[term]:
+                scores[number] = scores.get(number, 0.0) + idf * count * (_K1 + 1) / (count + self._norms[number])
+        return scores
+
+    def search(self, query, limit=8):
+        # Documents with every word of the query (the last one also as a
+        # prefix), best first
+        words = tokens(query)
+        if not words:
+            return []
+        groups = [[word] if word in self._postings else [] for word in words[:-1]]
+        groups.append(self._expand(words[-1]))
+        if not all(groups):
+            return []
+
+        total = None
+        for group in groups:
+            scores = self._scores(group)
+            total = scores if total is None else {
+                number: score + scores[number] for number, score in total.items() if number in scores
+            }
+        ranked = sorted(total.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [Hit(self.documents[number], score, self._snippet(number, groups))
+                for number, score in ranked]
+
+    def _snippet(self, number, groups, width=160):
+        # Text around the first occurrence of a query word
+        text, folded = self.documents[number].text, self._folded[number]
+        positions = [match.start() for group in groups for term in group
+                     for match in [re.search(rf"\b{re.escape(term)}", folded)] if match]
+        if not positions or len(text) <= width:
+            return text[:width]
+        start = max(min(positions) - width // 4, 0)
+        snippet = text[start:start + width]
+        return ("…" if start else "") + snippet + ("…" if start + width < len(text) else "")
+
+
+@functools.lru_cache(maxsize=None)
+def load_index(locale):
+    return SearchIndex(documents(locale))
+
+
+def search(query, locales, limit=8):
+    # Hits in the first locale with any; later locales are fallbacks, so a
+    # term that only appears in another language still finds its page
+    for locale in locales:
+        hits = load_index(locale).search(query, limit)
+        if hits:
+            return hits
+    return []
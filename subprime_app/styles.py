@@ -0,0 +1,52 @@
+"""The app's stylesheet, served as a static file instead of injected per rerun.
+
+All the styling lives in ``subprime_app/static/subprime.css``. The directory is
+registered as a Streamlit component, so the file is served by the app itself
+under ``/component/...`` with ``Cache-Control: public``. Each rerun sends only
+a one-line ``@import`` of it. The content hash in the URL lets the browser
+keep its copy across reruns and sessions until the stylesheet changes.
+
+``declare_component`` registers the directory only with the runtime that is
+live when this module is first imported. Under the warm-up
+(``subprime_app/warmup.py``), that is the AppTest runtime, not the server that
+starts afterwards in the same process. So every rerun registers it with the
+live runtime before sending the ``@import``. (``server.enableStaticServing``
+is no alternative: it serves ``.css`` files as ``text/plain`` with
+``nosniff``, which browsers refuse as a stylesheet.)
+"""
+import functools
+import hashlib
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+from streamlit import config, runtime
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STYLESHEET_PATH = os.path.join(STATIC_DIR, "subprime.css")
+
+_static = components.declare_component("static", path=STATIC_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def _stylesheet_version():
+    with open(STYLESHEET_PATH, "rb") as stylesheet:
+        return hashlib.sha256(stylesheet.read()).hexdigest()[:12]
+
+
+def stylesheet_url():
+    base_url = config.get_option("server.baseUrlPath").strip("/")
+    prefix = f"/{base_url}" if base_url else ""
+    return f"{prefix}/component/{_static.name}/subprime.css?v={_stylesheet_version()}"
+
+
+def _register():
+    if runtime.exists():
+        registry = runtime.get_instance().component_registry
+        if registry.get_component(_static.name) is None:
+            registry.register_component(_static)
+
+
+def load_stylesheet():
+    _register()
+    st.markdown(f'<style>@import url("{stylesheet_url()}");</style>', unsafe_allow_html=True)
@@ -0,0 +1,293 @@
+# The history of the crisis in one place. The timeline page shows it three
+# ways: the event cards of the selected period, the summary table with one
+# colored row per phase and the Gantt chart of the phases. Each view is a
+# projection of the store below, which joins the text of a locale catalog
+# with the language-independent years and colors of subprime_app.data.
+#
+# The store is built once per locale and process. Its HTML projections are
+# compiled into the content artifacts (subprime_app/content.py) and the Gantt
+# chart goes through the figure cache, so reruns never rebuild any of them.
+import bisect
+import calendar
+import datetime
+import functools
+import re
+from dataclasses import dataclass, field
+
+import plotly.graph_objects as go
+
+from subprime_app import data
+from subprime_app.locales import load_catalog
+
+
+@dataclass(frozen=True)
+class Phase:
+    index: int
+    name: str  # "Bubble Formation"
+    period: str  # "Background (2001-2006)", the label of the period selector
+    span: str  # "2001-2006", as written in the summary table
+    summary: str  # key events of the phase, for the summary table
+    start: float  # years, fractional: 2008.75 is the start of October 2008
+    end: float
+    color: str
+
+    @property
+    def css_class(self):
+        # Class of the stylesheet (subprime_app/static/subprime.css) with the phase colors
+        return f"phase-{self.index}"
+
+
+@dataclass(frozen=True)
+class Event:
+    phase: int
+    date: str  # as written in the catalog: "Sep 2008 (15th)"
+    description: str
+    start: datetime.date  # first and last day the date stands for
+    end: datetime.date
+
+
+@dataclass(frozen=True)
+class Milestone:
+    # Event marked on the Gantt chart
+    phase: int
+    year: float
+    label: str
+
+
+@dataclass(frozen=True)
+class CrucialEvent:
+    date: str
+    event: str
+
+
+class EventIndex:
+    # Interval index over the events: their positions sorted by start date,
+    # plus a segment tree holding the latest end date under each node. The
+    # events overlapping a date range are the ones that start before the range
+    # ends (a binary search) and end after it starts (the tree prunes every
+    # run of events that all end too early): O((k + 1) log n) for k matches
+
+    def __init__(self, events):
+        order = sorted(range(len(events)), key=lambda position: (events[position].start, position))
+        self._positions = order
+        self._starts = [events[position].start.toordinal() for position in order]
+        self._size = 1
+        while self._size < len(order):
+            self._size *= 2
+        self._max_end = [0] * (2 * self._size)
+        for leaf, position in enumerate(order):
+            self._max_end[self._size + leaf] = events[position].end.toordinal()
+        for node in range(self._size - 1, 0, -1):
+            self._max_end[node] = max(self._max_end[2 * node], self._max_end[2 * node + 1])
+        self.first_date = events[order[0]].start
+        self.last_date = datetime.date.fromordinal(self._max_end[1])
+
+    def overlapping(self, start, end):
+        # Positions of the events that overlap [start, end], by start date
+        first, last = start.toordinal(), end.toordinal()
+        count = bisect.bisect_right(self._starts, last)
+        found = []
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= count or self._max_end[node] < first:
+                continue
+            if high - low == 1:
+                found.append(self._positions[low])
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        return found
+
+
+@dataclass(frozen=True)
+class Timeline:
+    phases: tuple
+    events: tuple
+    milestones: tuple
+    crucial_events: tuple
+    index: EventIndex = field(compare=False, repr=False)
+
+    def phase_events(self, phase):
+        return [event for event in self.events if event.phase == phase]
+
+    def events_between(self, start, end):
+        # Positions in self.events of the events that overlap the range
+        return self.index.overlapping(start, end)
+
+
+_YEARS = re.compile(r"(\d{4})(?:-(\d{4}))?")
+_MONTHS = re.compile(r"([^\W\d_]+)(?:-([^\W\d_]+))?\s+(\d{4})(?:\s*\((.*)\))?")
+
+# "Mid-2006" stands for May to August
+_MID_YEAR = ((5, 1), (8, 31))
+
+
+def _month(word, months, label):
+    # Month numbers by the first three letters of their name: "Set", "Sep" and
+    # "Setembro" are all September
+    for number, name in enumerate(months, 1):
+        if name[:3].lower() == word[:3].lower():
+            return number
+    raise ValueError(f"Unrecognized month in date {label!r}")
+
+
+def parse_date(label, months, mid_year):
+    # First and last day of a catalog date: "2001", "2009-2010", "Mid-2006",
+    # "Feb 2007", "Jun-Jul 2007", "August 2007", "Sep 2008 (16-20th)".
+    # months are the month names of the locale, mid_year its word for "Mid"
+    match = _YEARS.fullmatch(label)
+    if match:
+        first, last = match.group(1), match.group(2) or match.group(1)
+        return datetime.date(int(first), 1, 1), datetime.date(int(last), 12, 31)
+
+    match = re.fullmatch(rf"{re.escape(mid_year)}[\s-]*(\d{{4}})", label, re.IGNORECASE)
+    if match:
+        year = int(match.group(1))
+        return datetime.date(year, *_MID_YEAR[0]), datetime.date(year, *_MID_YEAR[1])
+
+    match = _MONTHS.fullmatch(label)
+    if match is None:
+        raise ValueError(f"Unrecognized date {label!r}")
+    first_month, last_month, year, days = match.groups()
+    year = int(year)
+    first = _month(first_month, months, label)
+    last = _month(last_month, months, label) if last_month else first
+    start = datetime.date(year, first, 1)
+    end = datetime.date(year, last, calendar.monthrange(year, last)[1])
+
+    # Days of a single month: "(dia 15)", "(16-20th)"
+    days = [int(day) for day in re.findall(r"\d+", days or "")]
+    if days:
+        if last_month:
+            raise ValueError(f"Days of a range of months in date {label!r}")
+        start, end = start.replace(day=days[0]), start.replace(day=days[-1])
+    return start, end
+
+
+def build_timeline(text):
+    # text is the timeline section of a locale catalog
+    phases = tuple(
+        Phase(index, name, period, span, summary, start, end, color)
+        for index, (name, period, span, summary, start, end, color) in enumerate(zip(
+            text["phases"], text["periods"], text["table_periods"], text["table_events"],
+            data.TIMELINE_START_YEARS, data.TIMELINE_END_YEARS, data.TIMELINE_PHASE_COLORS, strict=True))
+    )
+    events = tuple(
+        Event(phase, event["date"], event["description"],
+              *parse_date(event["date"], text["months"], text["mid_year"]))
+        for phase, period_events in enumerate(text["events"]) for event in period_events
+    )
+    milestones = tuple(
+        Milestone(phase, year, label)
+        for year, phase, label in zip(data.TIMELINE_EVENT_YEARS, data.TIMELINE_EVENT_PHASES,
+                                      text["chart_events"], strict=True)
+    )
+    crucial_events = tuple(CrucialEvent(event["date"], event["event"]) for event in text["crucial_events"])
+    return Timeline(phases, events, milestones, crucial_events, EventIndex(events))
+
+
+@functools.lru_cache(maxsize=None)
+def load_timeline(locale):
+    return build_timeline(load_catalog(locale)["timeline"])
+
+
+def period_blocks(timeline, phase):
+    # Banner of the period followed by one card per event
+    blocks = [f'<div class="period-banner {timeline.phases[phase].css_class}">'
+              f'<h3>{timeline.phases[phase].period}</h3></div>']
+    blocks.extend(event_card(event) for event in timeline.phase_events(phase))
+    return blocks
+
+
+def event_card(event):
+    return (f'<div class="timeline-item">\n'
+            f'    <div class="timeline-date">{event.date}</div>\n'
+            f'    <div class="timeline-description">{event.description}</div>\n'
+            f'</div>')
+
+
+def summary_table(timeline, columns):
+    # Timeline table with one color per phase
+    html_table = '<table class="timeline-table">'
+    html_table += '<tr>' + ''.join(f'<th>{column}</th>' for column in columns) + '</tr>'
+
+    for phase in timeline.phases:
+        html_table += f'<tr class="phase-row {phase.css_class}">'
+        html_table += f'<td>{phase.span}</td>'
+        html_table += f'<td class="phase-name">{phase.name}</td>'
+        html_table += f'<td>{phase.summary}</td>'
+        html_table += '</tr>'
+
+    html_table += '</table>'
+
+    return html_table
+
+
+def crucial_blocks(timeline):
+    return [f'<div class="crucial-event"><span class="crucial-date">{event.date}</span>: {event.event}</div>'
+            for event in timeline.crucial_events]
+
+
+def gantt_figure(timeline, title, x_label):
+    phases = [phase.name for phase in timeline.phases]
+    starts = [phase.start for phase in timeline.phases]
+
+    fig = go.Figure()
+
+    # Horizontal bars
+    fig.add_trace(go.Bar(
+        y=phases,
+        base=starts,
+        x=[phase.end - phase.start for phase in timeline.phases],
+        orientation="h",
+        width=0.8,
+        marker=dict(color=[phase.color for phase in timeline.phases], line=dict(color="white", width=2)),
+        customdata=[phase.end for phase in timeline.phases],
+        hovertemplate="%{y}<br>%{base} – %{customdata}<extra></extra>"
+    ))
+
+    # Labels inside the bars
+    fig.add_trace(go.Scatter(
+        x=starts,
+        y=phases,
+        mode="text",
+        text=phases,
+        textposition="middle right",
+        textfont=dict(size=13),
+        hoverinfo="skip"
+    ))
+
+    # Event markers
+    years = [milestone.year for milestone in timeline.milestones]
+    event_y = [phases[milestone.phase] for milestone in timeline.milestones]
+    labels = [milestone.label for milestone in timeline.milestones]
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=event_y,
+        mode="markers",
+        marker=dict(size=10, color="black", opacity=0.8),
+        text=labels,
+        hovertemplate="%{text}<extra></extra>"
+    ))
+
+    # Event labels
+    for x, y, label in zip(years, event_y, labels):
+        fig.add_annotation(
+            x=x, y=y, text=label, showarrow=False, yshift=-20,
+            font=dict(size=12, color="#333333"),
+            bgcolor="rgba(255, 255, 255, 0.7)",
+            bordercolor="rgba(0, 0, 0, 0.2)"
+        )
+
+    # Chart style
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title=x_label, range=[2000, 2024], tickvals=list(range(2001, 2024, 2)), showgrid=False),
+        yaxis=dict(categoryorder="array", categoryarray=phases, showgrid=False),
+        showlegend=False,
+        height=500
+    )
+
+    return fig
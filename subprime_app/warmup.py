@@ -0,0 +1,103 @@
+"""Startup warm-up: renders every view before the server accepts a session.
+
+Every combination of locale, page and in-page selector option is rendered
+once, headless, with Streamlit's app-testing harness. Rendering fills the
+process-wide cache of the Plotly specs; the search index of every locale is
+built too. Only then does the Streamlit server start, in the same process, so
+the first student to open any view gets a cache hit. Until warm-up finishes
+the server is not listening, so the health check at /_stcore/health fails.
+A view that raises stops the start-up.
+
+    python -m subprime_app.warmup --script app.py [streamlit run options]
+
+``--no-serve`` only warms up and logs the timings. Use it as a build check.
+"""
+import argparse
+import logging
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from subprime_app.figure_cache import cache_stats
+from subprime_app.locales import LOCALES, TRANSLATED_SELECTORS, load_catalog
+from subprime_app.search import load_index
+
+logger = logging.getLogger("subprime_app.warmup")
+
+
+class WarmUpError(RuntimeError):
+    pass
+
+
+def walk_views(at, render):
+    # Renders every view of a fresh AppTest in turn: the landing page, each page
+    # and each option of its selectors. render(at, view) runs the app; views are
+    # named by id ("impact/impact_metric=debt"), so names do not depend on the locale
+    render(at, "landing")
+    text = load_catalog(at.session_state["locale"])
+    page_ids = {label: page for page, label in text["pages"].items()}
+    for label in at.sidebar.radio(key="page").options:
+        # Each run replaces the element tree, so widgets are looked up again
+        at.sidebar.radio(key="page").set_value(label)
+        page = page_ids[label]
+        render(at, page)
+        for selector in list(at.main.radio) + list(at.main.selectbox):
+            option_ids = {name: option for option, name in TRANSLATED_SELECTORS[selector.key](text).items()}
+            initial = selector.value
+            for option in selector.options:
+                getattr(at.main, selector.type)(key=selector.key).set_value(option)
+                render(at, f"{page}/{selector.key}={option_ids[option]}")
+            # The views of the page's other selectors start from this one's first option
+            getattr(at.main, selector.type)(key=selector.key).set_value(initial)
+
+
+def warm_up(script="app.py"):
+    # Returns the render time in ms of every view, in the order they were rendered
+    timings = {}
+
+    def render(at, view):
+        start = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise WarmUpError(f"{locale} {view} failed: {at.exception[0].message}")
+        logger.info("%s %-40s %7.1f ms", locale, view, elapsed)
+        timings[f"{locale} {view}"] = elapsed
+
+    for locale in LOCALES:
+        at = AppTest.from_file(script, default_timeout=120)
+        at.query_params["lang"] = locale
+        walk_views(at, render)
+        load_index(locale)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render every view into the shared caches, then start the Streamlit server.")
+    parser.add_argument("--script", default="app.py", help="app script to warm up and serve")
+    parser.add_argument("--no-serve", action="store_true", help="only warm up, do not start the server")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    start = time.perf_counter()
+    try:
+        timings = warm_up(args.script)
+    except WarmUpError as error:
+        logger.error("%s; not starting the server", error)
+        return 1
+    stats = cache_stats()
+    logger.info("Warm-up finished: %d views in %.1f s, %d charts cached (%d built)",
+                len(timings), time.perf_counter() - start, stats["entries"], stats["built"])
+    if args.no_serve:
+        return 0
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", args.script, *streamlit_args]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# Cash-flow waterfall of a securitization: the mortgages of the pool pay into
+# the SPV, which pays the bonds (tranches) in order of priority. Each month:
+#
+# - a share of the pool defaults (CDR, annual) and stops paying; the recovery
+#   of those loans is principal, the rest (the severity) is a loss
+# - the performing loans pay interest and scheduled principal (level payments
+#   over the remaining term), and some prepay in full (CPR, annual)
+# - interest pays the coupons from the most senior tranche down. What is left
+#   (the excess spread) first covers the month's losses, then goes to the
+#   residual holder, the most junior tranche
+# - principal is paid to the most senior tranche outstanding (sequential) or
+#   to every tranche in proportion to its balance (pro rata)
+# - the losses not covered write the tranches down from the most junior up
+#
+# Scenarios are rows of NumPy arrays and the months a loop over them, so a
+# whole grid of prepayment and default rates runs in one pass. Amounts are
+# percentages of the original pool. Coupon shortfalls are not carried over.
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+SEQUENTIAL = "sequential"
+PRO_RATA = "pro_rata"
+
+
+@dataclass(frozen=True)
+class Tranche:
+    name: str
+    share: float  # of the original pool
+    coupon: float  # annual
+
+
+@dataclass(frozen=True)
+class Deal:
+    tranches: tuple  # most senior first
+    wac: float  # annual rate paid by the mortgages
+    term: int  # months
+    allocation: str = SEQUENTIAL
+
+
+@dataclass(frozen=True, eq=False)
+class CashFlows:
+    # Monthly amounts of one scenario: arrays of months x tranches
+    principal: np.ndarray
+    interest: np.ndarray
+    writedown: np.ndarray
+
+    @property
+    def wal(self):
+        return _wal(np.arange(1, len(self.principal) + 1) @ self.principal, self.principal.sum(axis=0))
+
+
+@dataclass(frozen=True, eq=False)
+class ScenarioGrid:
+    # Results of every (CDR, CPR) pair: arrays of CDR x CPR x tranches
+    cpr: np.ndarray
+    cdr: np.ndarray
+    wal: np.ndarray  # years, NaN for a tranche that never receives principal
+    writedown: np.ndarray  # share of the tranche lost
+    interest: np.ndarray  # total received
+
+
+def _wal(weighted_months, principal):
+    # Weighted average life in years
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(principal > 0, weighted_months / principal / 12, np.nan)
+
+
+def _sequential(available, amounts):
+    # Pays available (scenarios) to amounts (scenarios x tranches) in column order
+    before = np.cumsum(amounts, axis=1) - amounts
+    return np.clip(available[:, None] - before, 0, amounts)
+
+
+def _monthly(annual):
+    return 1 - (1 - np.asarray(annual, dtype=float)) ** (1 / 12)
+
+
+def run(deal, cpr, cdr, severity):
+    # Yields (principal, interest, writedown) of each month, arrays of
+    # scenarios x tranches. cpr and cdr are arrays with one rate per scenario
+    smm, mdr = _monthly(cpr), _monthly(cdr)
+    rate = deal.wac / 12
+    coupons = np.array([tranche.coupon for tranche in deal.tranches]) / 12
+    pool = np.full(smm.shape, 100.0)
+    bonds = np.tile([tranche.share * 100 for tranche in deal.tranches], (len(smm), 1))
+
+    for month in range(deal.term):
+        defaulted = pool * mdr
+        performing = pool - defaulted
+        interest = performing * rate
+        remaining = deal.term - month
+        scheduled = performing * rate / (1 - (1 + rate) ** -remaining) - interest
+        prepaid = (performing - scheduled) * smm
+        loss = defaulted * severity
+        pool = performing - scheduled - prepaid
+
+        # Interest: coupons by seniority, then the excess spread
+        coupons_paid = _sequential(interest, bonds * coupons)
+        excess = interest - coupons_paid.sum(axis=1)
+        covered = np.minimum(excess, loss)
+        coupons_paid[:, -1] += excess - covered
+
+        # Losses not covered by the excess spread, from the most junior tranche up
+        writedown = _sequential(loss - covered, bonds[:, ::-1])[:, ::-1]
+        bonds = bonds - writedown
+
+        # Principal: scheduled, prepaid, recovered and the covered losses
+        principal = scheduled + prepaid + defaulted - loss + covered
+        if deal.allocation == PRO_RATA:
+            total = bonds.sum(axis=1, keepdims=True)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                paid = np.where(total > 0, principal[:, None] * bonds / total, 0)
+        else:
+            paid = _sequential(principal, bonds)
+        bonds = bonds - paid
+
+        yield paid, coupons_paid, writedown
+
+
+@functools.lru_cache(maxsize=256)
+def cash_flows(deal, cpr, cdr, severity):
+    periods = list(run(deal, np.array([cpr]), np.array([cdr]), severity))
+    principal, interest, writedown = (np.stack([period[part][0] for period in periods]) for part in range(3))
+    for array in (principal, interest, writedown):
+        array.flags.writeable = False
+    return CashFlows(principal, interest, writedown)
+
+
+@functools.lru_cache(maxsize=16)
+def scenario_grid(deal, cpr, cdr, severity):
+    # cpr and cdr are tuples of the rates of each axis. Only running sums are
+    # kept, so memory does not grow with the number of months
+    cpr_axis, cdr_axis = np.array(cpr, dtype=float), np.array(cdr, dtype=float)
+    cdr_rates, cpr_rates = (grid.ravel() for grid in np.meshgrid(cdr_axis, cpr_axis, indexing="ij"))
+    shape = (len(cdr_rates), len(deal.tranches))
+    weighted, principal_total, interest_total, writedown_total = (np.zeros(shape) for _ in range(4))
+
+    for month, (principal, interest, writedown) in enumerate(run(deal, cpr_rates, cdr_rates, severity), 1):
+        weighted += month * principal
+        principal_total += principal
+        interest_total += interest
+        writedown_total += writedown
+
+    sizes = np.array([tranche.share * 100 for tranche in deal.tranches])
+    grid_shape = (len(cdr_axis), len(cpr_axis), len(deal.tranches))
+    results = (_wal(weighted, principal_total), writedown_total / sizes, interest_total)
+    for array in results:
+        array.shape = grid_shape
+        array.flags.writeable = False
+    return ScenarioGrid(cpr_axis, cdr_axis, *results)
@@ -0,0 +1,64 @@
+# Memory regression check: hundreds of reruns across the pages, in both
+# languages, must not grow the resident memory or leave Plotly figures alive.
+# A first pass over every page of each language fills the caches (figures,
+# datasets, lazy imports) and sets the baseline.
+import gc
+import os
+import resource
+import sys
+
+import plotly.graph_objects as go
+from streamlit.testing.v1 import AppTest
+
+# Keep the soak off the render cache on disk shared with running apps
+os.environ.setdefault("SUBPRIME_RENDER_CACHE", "off")
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+RERUNS = 300
+MAX_RSS_GROWTH_MB = 40
+
+
+def peak_rss_mb():
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def live_figures():
+    gc.collect()
+    return sum(isinstance(item, go.Figure) for item in gc.get_objects())
+
+
+def switch_language(at):
+    language = at.sidebar.radio(key="language")
+    other = [option for option in language.options if option != language.value][0]
+    language.set_value(other).run()
+    assert not at.exception, at.exception
+
+
+def visit_pages(at, count):
+    # Reruns the app count times, on the next page each time; page labels
+    # follow the language, so the options are read again before every rerun
+    for rerun in range(count):
+        pages = at.sidebar.radio(key="page").options
+        page = pages[(pages.index(at.sidebar.radio(key="page").value) + 1) % len(pages)]
+        at.sidebar.radio(key="page").set_value(page).run()
+        assert not at.exception, (page, at.exception)
+
+
+def test_reruns_keep_memory_flat():
+    at = AppTest.from_file(APP, default_timeout=120).run()
+    assert not at.exception, at.exception
+    pages = len(at.sidebar.radio(key="page").options)
+
+    for _ in range(2):
+        visit_pages(at, pages)
+        switch_language(at)
+    baseline_rss, baseline_figures = peak_rss_mb(), live_figures()
+
+    for _ in range(RERUNS // pages):
+        visit_pages(at, pages)
+        switch_language(at)
+
+    assert live_figures() <= baseline_figures
+    assert peak_rss_mb() - baseline_rss < MAX_RSS_GROWTH_MB